@@ -93,11 +93,11 @@ class LookerSDK(api_methods.APIMethods):
       expect(gen.modelsEpilogue('')).toEqual(`
 import functools  # noqa:E402
 
-forward_ref_structure_hook = functools.partial(
-    sr.forward_ref_structure_hook, globals(), sr.converter
+forward_ref_structure_hook_factory = functools.partial(
+    sr.forward_ref_structure_hook_factory, globals(), sr.converter
 )
-sr.converter.register_structure_hook_func(
-    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook
+sr.converter.register_structure_hook_factory(
+    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook_factory
 )
 translate_keys_structure_hook = functools.partial(sr.translate_keys_structure_hook, sr.converter)
 sr.converter.register_structure_hook(
@@ -192,7 +192,9 @@ sr.converter.register_structure_hook(
     path=f"/groups/{group_id}/groups",
     structure=mdls.Group,
     body=body,
-    transport_options=transport_options`.replace(/^\n/, '');
+    transport_options=transport_options,
+    operation="add_group_group",
+    route="/groups/{group_id}/groups"`.replace(/^\n/, '');
       expect(args).toEqual(expected);
     });
     it('create_query', () => {
@@ -203,7 +205,9 @@ sr.converter.register_structure_hook(
     structure=mdls.Query,
     query_params={"fields": fields},
     body=body,
-    transport_options=transport_options`.replace(/^\n/, '');
+    transport_options=transport_options,
+    operation="create_query",
+    route="/queries"`.replace(/^\n/, '');
       expect(args).toEqual(expected);
     });
     it('create_dashboard', () => {
@@ -213,7 +217,9 @@ sr.converter.register_structure_hook(
     path="/dashboards",
     structure=mdls.Dashboard,
     body=body,
-    transport_options=transport_options`.replace(/^\n/, '');
+    transport_options=transport_options,
+    operation="create_dashboard",
+    route="/dashboards"`.replace(/^\n/, '');
       expect(args).toEqual(expected);
     });
   });
@@ -393,7 +399,9 @@ def old_login(
             path="/old_login",
             structure=mdls.AccessToken,
             query_params={"old_cred": old_cred},
-            transport_options=transport_options
+            transport_options=transport_options,
+            operation="old_login",
+            route="/old_login"
         )
     )
     return response`;
@@ -430,7 +438,9 @@ response = cast(
         path=f"/groups/{group_id}/groups",
         structure=mdls.Group,
         body=body,
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="add_group_group",
+        route="/groups/{group_id}/groups"
     )
 )
 return response`.replace(/^\n/, '');
@@ -445,7 +455,9 @@ response = cast(
     self.delete(
         path=f"/groups/{group_id}/groups/{deleting_group_id}",
         structure=None,
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="delete_group_from_group",
+        route="/groups/{group_id}/groups/{deleting_group_id}"
     )
 )
 return response`.replace(/^\n/, '');
@@ -461,7 +473,9 @@ response = cast(
         path="/themes/active",
         structure=Sequence[mdls.Theme],
         query_params={"name": name, "ts": ts, "fields": fields},
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="active_themes",
+        route="/themes/active"
     )
 )
 return response`.replace(/^\n/, '');
@@ -478,7 +492,9 @@ response = cast(
         path=f"/login/{user_id}",
         structure=mdls.AccessToken,
         query_params={"associative": associative},
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="login_user",
+        route="/login/{user_id}"
     )
 )
 return response`.replace(/^\n/, '');
@@ -493,7 +509,9 @@ response = cast(
     self.get(
         path=f"/query_tasks/{query_task_id}/results",
         structure=str,
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="query_task_results",
+        route="/query_tasks/{query_task_id}/results"
     )
 )
 return response`.replace(/^\n/, '');
@@ -508,7 +526,9 @@ response = cast(
     self.get(
         path=f"/render_tasks/{render_task_id}/results",
         structure=bytes,
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="render_task_results",
+        route="/render_tasks/{render_task_id}/results"
     )
 )
 return response`.replace(/^\n/, '');
@@ -523,7 +543,9 @@ response = cast(
     self.get(
         path=f"/queries/models/{model_name}/views/{view_name}/run/{result_format}",
         structure=Union[str, bytes],  # type: ignore
-        transport_options=transport_options
+        transport_options=transport_options,
+        operation="run_url_encoded_query",
+        route="/queries/models/{model_name}/views/{view_name}/run/{result_format}"
     )
 )
 return response`.replace(/^\n/, '');
@@ -112,7 +112,13 @@ class ${this.packageName}(api_methods.APIMethods):
 `;
 
   methodsEpilogue = (_indent: string) =>
-    this.apiVersion === '4.0' ? `LookerSDK = ${this.packageName}` : '';
+    this.apiVersion === '4.0'
+      ? `class Async${this.packageName}(${this.packageName}, api_methods.AsyncAPIMethods):
+    """${this.packageName} for use with an AsyncTransport: every method returns an awaitable"""
+
+
+LookerSDK = ${this.packageName}`
+      : '';
 
   modelsPrologue = (_indent: string) => `
 # ${this.warnEditing()}
@@ -137,11 +143,11 @@ DelimSequence = model.DelimSequence
   modelsEpilogue = (_indent: string) => `
 import functools  # noqa:E402
 
-forward_ref_structure_hook = functools.partial(
-    sr.forward_ref_structure_hook, globals(), sr.converter${this.apiRef}
+forward_ref_structure_hook_factory = functools.partial(
+    sr.forward_ref_structure_hook_factory, globals(), sr.converter${this.apiRef}
 )
-sr.converter${this.apiRef}.register_structure_hook_func(
-    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook
+sr.converter${this.apiRef}.register_structure_hook_factory(
+    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook_factory
 )
 ${
   this.structureHookTK
@@ -384,6 +390,9 @@ ${this.hooks.join('\n')}
     );
 
     let args = '';
+    // name the operation and its route for telemetry and profiling
+    args = this.argFill(args, `${currIndent}route="${method.endpoint}"`);
+    args = this.argFill(args, `${currIndent}operation="${method.name}"`);
     args = this.argFill(
       args,
       `${currIndent}transport_options=${formArgs.options}`
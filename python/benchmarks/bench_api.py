@@ -0,0 +1,298 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""End to end throughput and latency of SDK calls
+
+Run from the python directory:
+
+    python -m benchmarks.bench_api [--calls N] [--threads N]
+        [--scenario NAME ...] [--mode serial|threaded|async ...]
+        [--baseline FILE] [--save] [--check] [--tolerance FRACTION]
+
+Each scenario calls one SDK method against a local stub server replaying
+a large, realistically shaped payload (see benchmarks.payloads):
+
+    search_dashboards: json array of fully populated dashboards
+    all_users: json array of fully populated users
+    lookml_model_explore: one explore with fields, joins and sets
+    run_query_csv: multi MB csv query results
+
+in each mode:
+
+    serial: one call at a time from one thread (Looker40SDK)
+    threaded: --threads calls at a time from a thread pool (Looker40SDK)
+    async: --threads calls at a time on one event loop (AsyncLooker40SDK,
+        needs httpx)
+
+and reports calls/s, p50 and p99 latency and client CPU per call. The stub
+server runs in this process too, so its work competes for the GIL and is
+part of the latency but not of the client CPU, which only counts the
+threads making the calls.
+
+Results are compared to the stored baseline (benchmarks/baselines.json by
+default), --save replaces it and --check exits with status 1 when calls/s,
+p99 latency or CPU per call is worse than the baseline by more than
+--tolerance. Baselines are only comparable on the same machine.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import looker_sdk
+from looker_sdk.rtl import api_settings
+from looker_sdk.sdk.api40 import models as mdls
+
+from benchmarks import payloads
+from benchmarks.stub_server import StubServer
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baselines.json")
+MODES = ("serial", "threaded", "async")
+
+
+class Scenario(NamedTuple):
+    path: str
+    body: bytes
+    content_type: str
+    call: Callable[[Any], Any]
+
+
+SCENARIOS: Dict[str, Callable[[], Scenario]] = {
+    "search_dashboards": lambda: Scenario(
+        "/api/4.0/dashboards/search",
+        payloads.payload(mdls.Dashboard, 50).encode("utf-8"),
+        "application/json",
+        lambda sdk: sdk.search_dashboards(title="Sales%"),
+    ),
+    "all_users": lambda: Scenario(
+        "/api/4.0/users",
+        payloads.payload(mdls.User, 500).encode("utf-8"),
+        "application/json",
+        lambda sdk: sdk.all_users(),
+    ),
+    "lookml_model_explore": lambda: Scenario(
+        "/api/4.0/lookml_models/thelook/explores/orders",
+        json.dumps(payloads.model_dict(mdls.LookmlModelExplore)).encode("utf-8"),
+        "application/json",
+        lambda sdk: sdk.lookml_model_explore("thelook", "orders"),
+    ),
+    "run_query_csv": lambda: Scenario(
+        "/api/4.0/queries/42/run/csv",
+        payloads.csv(4 * 1024 * 1024),
+        "text/csv",
+        lambda sdk: sdk.run_query("42", "csv"),
+    ),
+}
+
+
+class Settings(api_settings.ApiSettings):
+    """ApiSettings for the stub server, ignoring looker.ini and the env"""
+
+    def __init__(self, base_url: str, pool_maxsize: int):
+        self._config: api_settings.SettingsConfig = {
+            "client_id": "benchmark",
+            "client_secret": "benchmark",
+            "base_url": base_url,
+            "pool_maxsize": str(pool_maxsize),
+        }
+        super().__init__(filename="")
+
+    def read_config(self) -> api_settings.SettingsConfig:
+        return self._config
+
+
+class Result(NamedTuple):
+    calls_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    cpu_ms: float
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _result(elapsed: float, latencies: List[float], cpu: float) -> Result:
+    return Result(
+        calls_per_sec=len(latencies) / elapsed,
+        p50_ms=_percentile(latencies, 50) * 1000,
+        p99_ms=_percentile(latencies, 99) * 1000,
+        cpu_ms=cpu / len(latencies) * 1000,
+    )
+
+
+def _timed(call: Callable[[], Any]) -> Tuple[float, float]:
+    """(wall clock, thread CPU) seconds of call()"""
+    cpu = time.thread_time()
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start, time.thread_time() - cpu
+
+
+def run_serial(scenario: Scenario, settings: Settings, calls: int) -> Result:
+    sdk = looker_sdk.init40(config_settings=settings)
+    scenario.call(sdk)  # log in and warm up
+    latencies = []
+    cpu = time.thread_time()
+    start = time.perf_counter()
+    for _ in range(calls):
+        latencies.append(_timed(lambda: scenario.call(sdk))[0])
+    return _result(time.perf_counter() - start, latencies, time.thread_time() - cpu)
+
+
+def run_threaded(
+    scenario: Scenario, settings: Settings, calls: int, threads: int
+) -> Result:
+    sdk = looker_sdk.init40(config_settings=settings)
+    scenario.call(sdk)
+    lock = threading.Lock()
+    latencies: List[float] = []
+    cpu = [0.0]
+
+    def call(_):
+        latency, thread_cpu = _timed(lambda: scenario.call(sdk))
+        with lock:
+            latencies.append(latency)
+            cpu[0] += thread_cpu
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(call, range(calls)))
+        elapsed = time.perf_counter() - start
+    return _result(elapsed, latencies, cpu[0])
+
+
+def run_async(scenario: Scenario, settings: Settings, calls: int, tasks: int) -> Result:
+    async def run() -> Result:
+        async with looker_sdk.init40_async(config_settings=settings) as sdk:
+            await scenario.call(sdk)
+            semaphore = asyncio.Semaphore(tasks)
+            latencies = []
+
+            async def call():
+                async with semaphore:
+                    start = time.perf_counter()
+                    await scenario.call(sdk)
+                    latencies.append(time.perf_counter() - start)
+
+            # every coroutine runs on this thread
+            cpu = time.thread_time()
+            start = time.perf_counter()
+            await asyncio.gather(*(call() for _ in range(calls)))
+            elapsed = time.perf_counter() - start
+            return _result(elapsed, latencies, time.thread_time() - cpu)
+
+    return asyncio.run(run())
+
+
+def run(scenario: Scenario, mode: str, base_url: str, args: Any) -> Result:
+    settings = Settings(base_url, pool_maxsize=max(args.threads, 10))
+    if mode == "serial":
+        return run_serial(scenario, settings, args.calls)
+    if mode == "threaded":
+        return run_threaded(scenario, settings, args.calls, args.threads)
+    return run_async(scenario, settings, args.calls, args.threads)
+
+
+def regressions(
+    result: Result, baseline: Optional[Dict[str, float]], tolerance: float
+) -> List[str]:
+    """The measurements of result worse than baseline by more than tolerance"""
+    if not baseline:
+        return []
+    worse = []
+    if result.calls_per_sec < baseline["calls_per_sec"] * (1 - tolerance):
+        worse.append("calls/s")
+    for name, label in (("p99_ms", "p99"), ("cpu_ms", "cpu/call")):
+        if getattr(result, name) > baseline[name] * (1 + tolerance):
+            worse.append(label)
+    return worse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20, help="calls per run")
+    parser.add_argument("--threads", type=int, default=8, help="concurrent calls")
+    parser.add_argument(
+        "--scenario", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--baseline", default=BASELINE, help="baseline json file")
+    parser.add_argument("--save", action="store_true", help="replace the baseline")
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 on regressions"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    baselines: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    results = dict(baselines) if args.save else {}
+    failed = False
+    print(f"{args.calls} calls per run, {args.threads} at a time when concurrent")
+    print(
+        f"{'scenario':<22}{'mode':<10}{'calls/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'cpu ms':>9}  vs baseline"
+    )
+    for name in args.scenario:
+        scenario = SCENARIOS[name]()
+        routes = {scenario.path: (scenario.body, scenario.content_type)}
+        with StubServer(routes=routes) as server:
+            for mode in args.mode:
+                key = f"{name}/{mode}"
+                result = run(scenario, mode, server.base_url, args)
+                results[key] = {k: round(v, 3) for k, v in result._asdict().items()}
+                baseline = baselines.get(key)
+                worse = regressions(result, baseline, args.tolerance)
+                failed = failed or bool(worse)
+                if not baseline:
+                    compared = "-"
+                else:
+                    compared = "%+.0f%% calls/s" % (
+                        (result.calls_per_sec / baseline["calls_per_sec"] - 1) * 100
+                    )
+                    if worse:
+                        compared += ", worse " + ", ".join(worse)
+                print(
+                    f"{name:<22}{mode:<10}{result.calls_per_sec:>9.1f}"
+                    f"{result.p50_ms:>9.1f}{result.p99_ms:>9.1f}"
+                    f"{result.cpu_ms:>9.1f}  {compared}"
+                )
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"saved {args.baseline}")
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Connection reuse of RequestsTransport under concurrency
+
+Run from the python directory:
+
+    python -m benchmarks.bench_connections [--threads N] [--requests N]
+        [--latency SECONDS]
+
+Each configuration makes the same number of GET requests, in waves of one
+request per thread, against a local stub server and reports how many TCP
+connections the server accepted. Fewer connections means more reuse; against a real
+instance each new connection is also a TLS handshake.
+"""
+import argparse
+import concurrent.futures
+import logging
+import time
+from typing import Any, Dict
+
+from looker_sdk.rtl import requests_transport
+from looker_sdk.rtl import transport
+
+from benchmarks.stub_server import StubServer
+
+
+class Settings:
+    """Minimal PTransportSettings"""
+
+    verify_ssl = True
+    timeout = 30
+    agent_tag = "benchmark"
+    headers = None
+
+    def __init__(self, base_url: str, **pool: Any):
+        self.base_url = base_url
+        for name, value in pool.items():
+            setattr(self, name, value)
+
+
+def run(base_url: str, threads: int, requests: int, **pool: Any) -> float:
+    rt = requests_transport.RequestsTransport.configure(Settings(base_url, **pool))
+
+    def get(_):
+        response = rt.request(transport.HttpMethod.GET, f"{base_url}/api/4.0/user")
+        assert response.ok, response.value
+
+    # fan out a wave of `threads` requests and wait for all of them, like
+    # sdk.batch() does, before starting the next wave
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        for _ in range(0, requests, threads):
+            list(executor.map(get, range(threads)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="stub server seconds/request"
+    )
+    args = parser.parse_args()
+    # a pool too small for the threads logs "Connection pool is full"
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+    configs: Dict[str, Dict[str, Any]] = {
+        "default pool (10)": {},
+        f"pool_maxsize={args.threads}": {"pool_maxsize": args.threads},
+        f"pool_maxsize={args.threads}, per thread": {
+            "pool_maxsize": args.threads,
+            "session_per_thread": True,
+        },
+        "keep_alive=false": {"pool_maxsize": args.threads, "keep_alive": False},
+    }
+    print(f"{args.requests} GETs from {args.threads} threads")
+    print(f"{'configuration':<36}{'connections':>12}{'seconds':>9}{'req/s':>8}")
+    with StubServer(body=b'{"id": "1"}', delay=args.latency) as server:
+        for name, pool in configs.items():
+            server.reset()
+            elapsed = run(server.base_url, args.threads, args.requests, **pool)
+            print(
+                f"{name:<36}{server.connections:>12}{elapsed:>9.2f}"
+                f"{args.requests / elapsed:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Deserialization throughput of API 4.0 models
+
+Run from the python directory:
+
+    python -m benchmarks.bench_deserialize [--repeat N] [--json CODEC]
+
+Reports the best of N runs of serialize.deserialize40 over json arrays of
+fully populated models and over the hand shaped responses the memory
+budget tests use (see benchmarks.payloads).
+"""
+import argparse
+import time
+from typing import Any, Callable, List, Sequence, Tuple
+
+from looker_sdk.rtl import serialize
+from looker_sdk.sdk.api40 import models as mdls
+
+from benchmarks import payloads
+
+
+def _populated(model, count: int) -> Tuple[str, Callable[[], Any], Any]:
+    return model.__name__, lambda: payloads.payload(model, count), Sequence[model]
+
+
+CASES: List[Tuple[str, Callable[[], Any], Any]] = [
+    _populated(mdls.Dashboard, 200),
+    _populated(mdls.User, 2000),
+    _populated(mdls.LookmlModelExplore, 20),
+    _populated(mdls.ContentValidation, 1),
+    ("users", lambda: payloads.users(2500), Sequence[mdls.User]),
+    ("dashboards", lambda: payloads.dashboards(500), Sequence[mdls.Dashboard]),
+    (
+        "content_validation",
+        lambda: payloads.content_validation(500),
+        mdls.ContentValidation,
+    ),
+]
+
+
+def bench(data, structure, repeat: int) -> float:
+    """Best wall clock seconds to deserialize `data` as `structure`"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize.deserialize40(data=data, structure=structure)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--json", choices=["orjson", "ujson", "json"], help="json codec to use"
+    )
+    args = parser.parse_args()
+    print(f"json codec: {serialize.set_json_codec(args.json).name}")
+    print(f"{'payload':<24}{'size KB':>10}{'best s':>9}{'MB/s':>8}")
+    for name, build, structure in CASES:
+        data = build()
+        size = len(data)
+        best = bench(data, structure, args.repeat)
+        print(f"{name:<24}{size // 1024:>10}{best:>9.3f}{size / best / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
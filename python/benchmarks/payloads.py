@@ -0,0 +1,348 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Synthetic but realistically shaped API payloads for benchmarks
+
+Payloads are built by walking a model's attrs fields and filling every
+field with a plausible value, recursing into nested models and sequences
+so e.g. a Dashboard comes with dashboard_elements, filters and layouts.
+
+users, dashboards and content_validation instead build responses shaped
+like a real instance's, with the nulls and empty lists that come with
+them. The memory budget tests in tests/rtl/test_memory.py measure these.
+"""
+import collections.abc
+import datetime
+import enum
+import json
+import keyword
+import typing
+from typing import Any, Dict, Iterable, Type
+
+import attr
+
+from looker_sdk.sdk.api40 import models as mdls
+
+# nested sequences get this many items, deeper levels get fewer
+SEQUENCE_SIZES = (8, 3, 1)
+MAX_DEPTH = 3
+
+_CACHE: Dict[Any, Any] = {}
+
+
+def _resolve(tp: Any) -> Any:
+    if isinstance(tp, typing.ForwardRef):
+        return getattr(mdls, tp.__forward_arg__)
+    if isinstance(tp, str):
+        return getattr(mdls, tp)
+    return tp
+
+
+def _value(tp: Any, depth: int, seed: int) -> Any:
+    tp = _resolve(tp)
+    origin = getattr(tp, "__origin__", None)
+    args = getattr(tp, "__args__", ())
+    if origin is typing.Union:
+        return _value([a for a in args if a is not type(None)][0], depth, seed)
+    if origin in (list, collections.abc.Sequence):
+        if depth >= MAX_DEPTH - 1:
+            return []
+        size = SEQUENCE_SIZES[min(depth, len(SEQUENCE_SIZES) - 1)]
+        return [_value(args[0], depth + 1, seed + i) for i in range(size)]
+    if origin in (dict, collections.abc.MutableMapping):
+        return {"key": True, "other": False}
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return next(m.value for m in tp if m.name != "invalid_api_enum_value")
+    if isinstance(tp, type) and attr.has(tp):
+        if depth >= MAX_DEPTH:
+            return None
+        return model_dict(tp, depth + 1, seed)
+    if tp is bool:
+        return seed % 2 == 0
+    if tp is int:
+        return 1000 + seed
+    if tp is float:
+        return 1.5 * seed
+    if tp is datetime.datetime:
+        return "2023-03-0%dT12:34:56.789+00:00" % (1 + seed % 9)
+    return f"value {seed}"
+
+
+def model_dict(model: Type[Any], depth: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """JSON ready dict for `model` with every field populated"""
+    data = {}
+    for field in attr.fields(model):
+        name = field.name
+        if name.endswith("_") and keyword.iskeyword(name[:-1]):
+            name = name[:-1]
+        data[name] = _value(field.type, depth, seed)
+    return data
+
+
+def payload(model: Type[Any], count: int) -> str:
+    """JSON array of `count` fully populated `model` objects"""
+    key = (model, count)
+    if key not in _CACHE:
+        _CACHE[key] = json.dumps(
+            [model_dict(model, seed=i) for i in range(count)]
+        )
+    return _CACHE[key]
+
+
+def csv(size: int) -> bytes:
+    """About `size` bytes of query results csv, like run_query(..., "csv")"""
+    key = ("csv", size)
+    if key not in _CACHE:
+        header = b"orders.id,orders.created_date,users.state,orders.total\n"
+        rows = [header]
+        length = len(header)
+        i = 0
+        while length < size:
+            row = b"%d,2023-03-%02d,state %d,%d.%02d\n" % (
+                i,
+                1 + i % 28,
+                i % 50,
+                i % 9973,
+                i % 100,
+            )
+            rows.append(row)
+            length += len(row)
+            i += 1
+        _CACHE[key] = b"".join(rows)
+    return _CACHE[key]
+
+
+# hand shaped responses, as returned by all_users, all_dashboards and
+# content_validation
+CAN = {"show": True, "index": True, "show_details": True, "edit": False}
+TIMESTAMP = "2023-03-01T12:34:56.789+00:00"
+URL = "https://example.looker.com"
+
+
+def user(i: int) -> Dict[str, Any]:
+    return {
+        "can": CAN,
+        "avatar_url": f"https://gravatar.com/avatar/{i:032x}?s=156&d=blank",
+        "avatar_url_without_sizing": f"https://gravatar.com/avatar/{i:032x}?d=blank",
+        "credentials_email": {
+            "can": CAN,
+            "created_at": TIMESTAMP,
+            "email": f"user{i}@example.com",
+            "forced_password_reset_at_next_login": False,
+            "is_disabled": False,
+            "logged_in_at": TIMESTAMP,
+            "type": "email",
+            "url": f"{URL}/api/4.0/users/{i}/credentials_email",
+            "user_url": f"{URL}/api/4.0/users/{i}",
+        },
+        "credentials_api3": [],
+        "credentials_embed": [],
+        "credentials_google": None,
+        "display_name": f"First{i} Last{i}",
+        "email": f"user{i}@example.com",
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "group_ids": ["1", str(10 + i % 20)],
+        "home_folder_id": "1",
+        "id": str(i),
+        "is_disabled": False,
+        "locale": "en",
+        "looker_versions": ["23.6.0"],
+        "models_dir_validated": None,
+        "personal_folder_id": str(1000 + i),
+        "presumed_looker_employee": False,
+        "role_ids": ["2", str(3 + i % 5)],
+        "sessions": [],
+        "ui_state": {"homepageGroupIdPreference": "1"},
+        "verified_looker_employee": False,
+        "roles_externally_managed": False,
+        "allow_direct_roles": True,
+        "allow_normal_group_membership": True,
+        "allow_roles_from_normal_groups": True,
+        "is_service_account": False,
+        "url": f"{URL}/api/4.0/users/{i}",
+    }
+
+
+def query(i: int) -> Dict[str, Any]:
+    return {
+        "can": CAN,
+        "id": str(i),
+        "model": "thelook",
+        "view": "orders",
+        "fields": ["orders.created_date", "orders.count", "users.state"],
+        "pivots": None,
+        "fill_fields": None,
+        "filters": {"orders.created_date": "30 days"},
+        "sorts": ["orders.created_date desc"],
+        "limit": "500",
+        "column_limit": "50",
+        "total": False,
+        "row_total": None,
+        "subtotals": None,
+        "vis_config": {"type": "looker_line", "show_legend": True},
+        "filter_config": None,
+        "visible_ui_sections": None,
+        "slug": f"q{i:08d}",
+        "dynamic_fields": None,
+        "client_id": f"c{i:020d}",
+        "share_url": f"{URL}/x/c{i:020d}",
+        "expanded_share_url": f"{URL}/explore/thelook/orders?qid=c{i:020d}",
+        "url": "/explore/thelook/orders?fields=orders.created_date,orders.count",
+        "query_timezone": "UTC",
+        "has_table_calculations": False,
+    }
+
+
+def dashboard_element(dashboard_id: int, i: int) -> Dict[str, Any]:
+    element_id = dashboard_id * 10 + i
+    return {
+        "can": CAN,
+        "body_text": None,
+        "dashboard_id": str(dashboard_id),
+        "id": str(element_id),
+        "look": None,
+        "look_id": None,
+        "note_display": None,
+        "note_state": None,
+        "note_text": None,
+        "query": query(element_id),
+        "query_id": str(element_id),
+        "refresh_interval": None,
+        "result_maker": None,
+        "result_maker_id": str(element_id),
+        "subtitle_text": None,
+        "title": f"Tile {i}",
+        "title_hidden": False,
+        "title_text": None,
+        "type": "vis",
+        "alert_count": 0,
+        "rich_content_json": None,
+    }
+
+
+def dashboard(i: int) -> Dict[str, Any]:
+    return {
+        "can": CAN,
+        "content_favorite_id": None,
+        "content_metadata_id": str(i),
+        "description": f"Dashboard {i} description",
+        "hidden": False,
+        "id": str(i),
+        "model": None,
+        "query_timezone": "UTC",
+        "readonly": False,
+        "refresh_interval": None,
+        "folder": {
+            "can": CAN,
+            "name": "Shared",
+            "parent_id": None,
+            "id": "1",
+            "content_metadata_id": "1",
+            "created_at": TIMESTAMP,
+            "creator_id": "1",
+            "child_count": 10,
+            "is_shared_root": True,
+            "is_users_root": False,
+            "is_personal": False,
+        },
+        "title": f"Sales {i}",
+        "user_id": str(i % 100),
+        "slug": f"s{i:020d}",
+        "created_at": TIMESTAMP,
+        "crossfilter_enabled": False,
+        "dashboard_elements": [dashboard_element(i, j) for j in range(6)],
+        "dashboard_filters": [],
+        "dashboard_layouts": [],
+        "deleted": False,
+        "favorite_count": 3,
+        "last_accessed_at": TIMESTAMP,
+        "last_viewed_at": TIMESTAMP,
+        "view_count": 42,
+        "show_filters_bar": True,
+        "show_title": True,
+        "folder_id": "1",
+        "url": f"/dashboards/{i}",
+    }
+
+
+def content_validator_error(i: int) -> Dict[str, Any]:
+    return {
+        "look": None,
+        "dashboard": {
+            "description": None,
+            "id": str(i % 500),
+            "content_metadata_id": str(i % 500),
+            "title": f"Sales {i % 500}",
+            "url": f"/dashboards/{i % 500}",
+            "folder": {"id": "1", "name": "Shared"},
+        },
+        "dashboard_element": {
+            "id": str(i),
+            "look_id": None,
+            "title": f"Tile {i}",
+            "type": "vis",
+            "query_id": str(i),
+        },
+        "errors": [
+            {
+                "message": f'Unknown field "orders.old_field_{i}".',
+                "field_name": f"orders.old_field_{i}",
+                "model_name": "thelook",
+                "explore_name": "orders",
+                "removable": True,
+            }
+        ],
+        "id": f"error-{i}",
+    }
+
+
+def _array(items: Iterable[Dict[str, Any]]) -> bytes:
+    # one item at a time so building the payload doesn't hold every dict
+    return b"[" + b",".join(json.dumps(item).encode("utf-8") for item in items) + b"]"
+
+
+def users(count: int) -> bytes:
+    return _array(user(i) for i in range(count))
+
+
+def dashboards(count: int) -> bytes:
+    return _array(dashboard(i) for i in range(count))
+
+
+def content_validation(count: int) -> bytes:
+    errors = _array(content_validator_error(i) for i in range(count))
+    totals = {
+        "computation_time": 12.5,
+        "total_looks_validated": 5000,
+        "total_dashboard_elements_validated": 30000,
+        "total_dashboard_filters_validated": 4000,
+        "total_scheduled_plans_validated": 800,
+        "total_alerts_validated": 100,
+        "total_explores_validated": 300,
+    }
+    return (
+        b'{"content_with_errors": '
+        + errors
+        + b", "
+        + json.dumps(totals).encode("utf-8")[1:]
+    )
@@ -0,0 +1,152 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Local HTTP/1.1 stub of the Looker API for benchmarks
+
+Serves a canned /login token, per path bodies from `routes` and a fixed
+json body for every other path, with keep-alive, and counts the TCP
+connections it accepts so benchmarks can report connection reuse.
+
+    with StubServer(body=b'{"id": "1"}') as server:
+        settings.base_url = server.base_url
+        ...
+        print(server.connections)
+"""
+import http.server
+import json
+import threading
+from typing import Dict, Optional, Tuple
+
+LOGIN_BODY = json.dumps(
+    {"access_token": "stub-token", "token_type": "Bearer", "expires_in": 3600}
+).encode("utf-8")
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, don't let Nagle's algorithm
+    # hold the body back waiting for a delayed ACK
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        status, body, headers = self.server.stub.response(self.command, self.path)
+        headers = dict(headers)
+        self.send_response(status)
+        self.send_header(
+            "Content-Type", headers.pop("Content-Type", "application/json")
+        )
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    stub: "StubServer"
+
+    def get_request(self):
+        request = super().get_request()
+        with self.stub.lock:
+            self.stub.connections += 1
+        return request
+
+
+class StubServer:
+    """Threaded stub API server on an ephemeral localhost port"""
+
+    def __init__(
+        self,
+        body: bytes = b"{}",
+        delay: float = 0.0,
+        routes: Optional[Dict[str, Tuple[bytes, str]]] = None,
+    ):
+        """`delay` seconds of simulated server latency per request
+
+        `routes` maps request paths, without the query string, to the
+        (body, content type) to serve for them instead of `body`
+        """
+        self.body = body
+        self.delay = delay
+        self.routes = routes or {}
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server, "server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def response(self, method: str, path: str) -> Tuple[int, bytes, Dict[str, str]]:
+        """(status, body, headers) for a request. Override to customize."""
+        with self.lock:
+            self.requests += 1
+        if self.delay:
+            threading.Event().wait(self.delay)
+        path = path.split("?")[0]
+        if path.endswith("/login"):
+            return 200, LOGIN_BODY, {}
+        if path in self.routes:
+            body, content_type = self.routes[path]
+            return 200, body, {"Content-Type": content_type}
+        return 200, self.body, {}
+
+    def start(self) -> "StubServer":
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self) -> None:
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -20,17 +20,40 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, Any, List, Optional, Type
 
 from looker_sdk.rtl import api_settings
 from looker_sdk.rtl import requests_transport
 from looker_sdk.rtl import serialize
+from looker_sdk.rtl import transport as rtl_transport
 from looker_sdk.rtl import auth_session
 from looker_sdk.sdk import constants
 
-# F401 - providing convenience shortcut for methods/models at top level
-from looker_sdk.sdk.api40 import methods as methods40
-from looker_sdk.sdk.api40 import models as models40  # noqa: F401
+if TYPE_CHECKING:
+    # F401 - providing convenience shortcut for methods/models at top level
+    from looker_sdk.sdk.api40 import methods as methods40
+    from looker_sdk.sdk.api40 import models as models40  # noqa: F401
+
+# The generated api40 modules hold hundreds of attrs classes and dominate
+# `import looker_sdk` so they are only imported on first use (PEP 562).
+_LAZY_MODULES = {
+    "methods40": "looker_sdk.sdk.api40.methods",
+    "models40": "looker_sdk.sdk.api40.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
 
 API_SETTINGS_API_VERSION_DEPRECATED = "API_VERSION config value is no longer needed."
 
@@ -49,13 +72,20 @@ def init40(
     config_file: str = "looker.ini",
     section: Optional[str] = None,
     config_settings: Optional[api_settings.ApiSettings] = None,
-) -> methods40.Looker40SDK:
-    """Default dependency configuration"""
+    transport_class: Type[rtl_transport.Transport] = requests_transport.RequestsTransport,
+) -> "methods40.Looker40SDK":
+    """Default dependency configuration
+
+    Pass transport_class=httpx_transport.HttpxTransport to use HTTP/2
+    (pip install looker_sdk[http2]).
+    """
+    from looker_sdk.sdk.api40 import methods as methods40
+
     settings = (
         _settings(config_file, section) if config_settings is None else config_settings
     )
     settings.is_configured()
-    transport = requests_transport.RequestsTransport.configure(settings)
+    transport = transport_class.configure(settings)
     return methods40.Looker40SDK(
         auth_session.AuthSession(settings, transport, serialize.deserialize40, "4.0"),
         serialize.deserialize40,
@@ -63,3 +93,35 @@ def init40(
         transport,
         "4.0",
     )
+
+
+def init40_async(
+    config_file: str = "looker.ini",
+    section: Optional[str] = None,
+    config_settings: Optional[api_settings.ApiSettings] = None,
+) -> "methods40.AsyncLooker40SDK":
+    """Default dependency configuration for use with asyncio
+
+    Requires the optional httpx dependency: pip install looker_sdk[async]
+
+    e.g.
+        async with looker_sdk.init40_async() as sdk:
+            dashboards = await asyncio.gather(*(sdk.dashboard(i) for i in ids))
+    """
+    from looker_sdk.rtl import httpx_transport
+    from looker_sdk.sdk.api40 import methods as methods40
+
+    settings = (
+        _settings(config_file, section) if config_settings is None else config_settings
+    )
+    settings.is_configured()
+    transport = httpx_transport.AsyncHttpxTransport.configure(settings)
+    return methods40.AsyncLooker40SDK(
+        auth_session.AsyncAuthSession(
+            settings, transport, serialize.deserialize40, "4.0"
+        ),
+        serialize.deserialize40,
+        serialize.serialize40,
+        transport,
+        "4.0",
+    )
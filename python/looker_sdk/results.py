@@ -0,0 +1,273 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Convert query results into column oriented arrays
+
+e.g.
+    table = results.to_arrow(
+        sdk.stream(sdk.run_inline_query, "json_bi", query), "json_bi"
+    )
+
+Results are read column by column from a str, bytes or streamed body
+(ResponseStream or any iterable of bytes) without materializing a list of
+row dicts. For "json_bi" the field types in the metadata pick the column
+types. numpy, pyarrow and pandas are optional:
+
+    pip install looker_sdk[numpy]  # to_numpy()
+    pip install looker_sdk[arrow]  # to_arrow()
+    pip install looker_sdk[pandas]  # to_pandas()
+"""
+import codecs
+import csv
+import importlib
+import io
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import attr
+
+from looker_sdk.rtl import json_rows
+
+TData = Union[str, bytes, Iterable[bytes]]
+
+# Looker field types holding whole numbers, other numeric types are floats
+INTEGER_TYPES = {"count", "count_distinct", "int"}
+NUMERIC_TYPES = INTEGER_TYPES | {
+    "average",
+    "average_distinct",
+    "max",
+    "median",
+    "median_distinct",
+    "min",
+    "number",
+    "percent_of_previous",
+    "percent_of_total",
+    "percentile",
+    "percentile_distinct",
+    "running_total",
+    "sum",
+    "sum_distinct",
+}
+BOOLEAN_TYPES = {"yesno"}
+
+
+@attr.s(auto_attribs=True)
+class Columns:
+    """Query result as columns:
+    data: column values keyed by field name
+    types: Looker field type keyed by field name (json_bi only)
+    """
+
+    data: Dict[str, List[Any]] = attr.ib(factory=dict)
+    types: Dict[str, str] = attr.ib(factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.data.values()), []))
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required for this conversion: "
+            f"pip install looker_sdk[{extra}]"
+        )
+
+
+def _chunks(data: TData, encoding: str) -> Iterable[bytes]:
+    if isinstance(data, str):
+        return [data.encode(encoding)]
+    if isinstance(data, bytes):
+        return [data]
+    return data
+
+
+def _encoding(data: TData, encoding: Optional[str]) -> str:
+    return encoding or getattr(data, "encoding", None) or "utf-8"
+
+
+def _lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decoded lines keeping their line endings, as csv.reader expects"""
+    pending = ""
+    for text in codecs.iterdecode(chunks, encoding):
+        pending += text
+        start = 0
+        end = pending.find("\n")
+        while end >= 0:
+            yield pending[start : end + 1]
+            start = end + 1
+            end = pending.find("\n", start)
+        pending = pending[start:]
+    if pending:
+        yield pending
+
+
+def _json_bi_types(metadata: Any) -> Dict[str, str]:
+    types: Dict[str, str] = {}
+    fields = (metadata or {}).get("fields") or {}
+    for group in ("dimensions", "measures"):
+        for field in fields.get(group) or []:
+            types[field["name"]] = field.get("type") or ""
+    for calc in fields.get("table_calculations") or []:
+        # table calculation types aren't described, measures are numeric
+        types[calc["name"]] = "number" if calc.get("measure") else ""
+    return types
+
+
+def columns(
+    data: TData, result_format: str = "json", encoding: Optional[str] = None
+) -> Columns:
+    """Read a "json", "json_bi" or "csv" query result into Columns"""
+    encoding = _encoding(data, encoding)
+    chunks = _chunks(data, encoding)
+    result = Columns()
+    if result_format == "csv":
+        reader = csv.reader(_lines(chunks, encoding))
+        names = next(reader, [])
+        result.data = {name: [] for name in names}
+        cols = list(result.data.values())
+        for values in reader:
+            for col, value in zip(cols, values):
+                col.append(value)
+        return result
+    if result_format not in ("json", "json_bi"):
+        raise ValueError(f"Unsupported result_format '{result_format}'")
+
+    rows = json_rows.RowReader(chunks, encoding)
+    count = 0
+    for row in rows:
+        for name, value in row.items():
+            if name not in result.data:
+                result.data[name] = [None] * count
+            result.data[name].append(value)
+        count += 1
+        for column in result.data.values():
+            if len(column) < count:
+                column.append(None)
+    result.types = _json_bi_types(rows.members.get("metadata"))
+    return result
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if value is None:
+        return None
+    return value in (True, "Yes", "yes", "true")
+
+
+def to_numpy(
+    data: TData, result_format: str = "json", encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """Read a query result into numpy arrays keyed by field name
+
+    Numeric fields become float64 (int64 when whole and complete) with NaN
+    for nulls, yesno fields become bool and everything else object arrays.
+    """
+    np = _require("numpy", "numpy")
+    result = columns(data, result_format, encoding)
+    arrays: Dict[str, Any] = {}
+    for name, values in result.data.items():
+        looker_type = result.types.get(name)
+        if looker_type in NUMERIC_TYPES:
+            if looker_type in INTEGER_TYPES and None not in values:
+                arrays[name] = np.array(values, dtype=np.int64)
+            else:
+                arrays[name] = np.array(
+                    [np.nan if v is None else v for v in values], dtype=np.float64
+                )
+        elif looker_type in BOOLEAN_TYPES and None not in values:
+            arrays[name] = np.array([_to_bool(v) for v in values], dtype=np.bool_)
+        elif looker_type is None and values and None not in values:
+            # plain json: let numpy infer numeric and bool columns
+            arrays[name] = np.array(values)
+            if arrays[name].dtype.kind not in "biuf":
+                arrays[name] = np.array(values, dtype=object)
+        else:
+            arrays[name] = np.array(values, dtype=object)
+    return arrays
+
+
+class _ChunkReader(io.RawIOBase):
+    """File like view of an iterable of byte chunks"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)  # type: ignore
+            if self._pending is None:
+                self._pending = b""
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def to_arrow(
+    data: TData, result_format: str = "json", encoding: Optional[str] = None
+) -> Any:
+    """Read a query result into a pyarrow.Table
+
+    "csv" results are parsed by pyarrow itself. For "json_bi" the field
+    metadata sets the column types, for "json" pyarrow infers them.
+    """
+    pa = _require("pyarrow", "arrow")
+    encoding = _encoding(data, encoding)
+    if result_format == "csv":
+        pa_csv = _require("pyarrow.csv", "arrow")
+        source = io.BufferedReader(_ChunkReader(_chunks(data, encoding)))
+        return pa_csv.read_csv(
+            source, read_options=pa_csv.ReadOptions(encoding=encoding)
+        )
+    result = columns(data, result_format, encoding)
+    arrays = []
+    for name, values in result.data.items():
+        looker_type = result.types.get(name)
+        if looker_type in INTEGER_TYPES:
+            arrays.append(pa.array(values, type=pa.int64()))
+        elif looker_type in NUMERIC_TYPES:
+            arrays.append(pa.array(values, type=pa.float64()))
+        elif looker_type in BOOLEAN_TYPES:
+            arrays.append(pa.array([_to_bool(v) for v in values], type=pa.bool_()))
+        else:
+            arrays.append(pa.array(values))
+    return pa.Table.from_arrays(arrays, names=list(result.data))
+
+
+def to_pandas(
+    data: TData, result_format: str = "json", encoding: Optional[str] = None
+) -> Any:
+    """Read a query result into a pandas.DataFrame
+
+    Goes through pyarrow when it is installed, numpy otherwise.
+    """
+    pd = _require("pandas", "pandas")
+    try:
+        importlib.import_module("pyarrow")
+    except ImportError:
+        return pd.DataFrame(to_numpy(data, result_format, encoding))
+    return to_arrow(data, result_format, encoding).to_pandas()
@@ -22,15 +22,46 @@
 
 """Functionality for making authenticated API calls
 """
+import asyncio
+import codecs
+import contextlib
+import contextvars
 import datetime
+import functools
 import re
+import time
 import urllib.parse
 import json
-from typing import Any, MutableMapping, Optional, Sequence, Tuple, Type, Union
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from looker_sdk import error
+from looker_sdk.rtl import batch as batch_executor
+from looker_sdk.rtl import conditional
+from looker_sdk.rtl import json_rows
 from looker_sdk.rtl import model
+from looker_sdk.rtl import paging
+from looker_sdk.rtl import profile as sdk_profile
+from looker_sdk.rtl import response_cache
+from looker_sdk.rtl import retry
 from looker_sdk.rtl import serialize
+from looker_sdk.rtl import single_flight
+from looker_sdk.rtl import telemetry
 from looker_sdk.rtl import transport
 from looker_sdk.rtl import auth_session
 
@@ -52,6 +83,23 @@ TQueryParams = MutableMapping[
 ]
 
 
+# the profile.Profile of each SDK profiling the current context, see
+# APIMethods.profile(). Replaced rather than updated so contexts copied from
+# this one keep their own.
+TProfilers = MutableMapping[Any, sdk_profile.Profile]
+_profilers: "contextvars.ContextVar[Optional[TProfilers]]" = contextvars.ContextVar(
+    "looker_sdk_profilers", default=None
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_utf8(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
 class APIMethods:
     """Functionality for making authenticated API calls"""
 
@@ -70,6 +118,218 @@ class APIMethods:
         self.deserialize = deserialize
         self.serialize = serialize
         self.transport = transport
+        # throttled (429) and unavailable (502/503/504) responses to
+        # idempotent requests are retried. Set to None to disable or override
+        # per call with transport_options={"retry": RetryPolicy(...)}
+        self.retry: Optional[retry.RetryPolicy] = retry.RetryPolicy()
+        self.retry_stats = retry.RetryStats()
+        # calls in flight limits shared by this SDK's batch() calls
+        self.batch_limits = batch_executor.BatchLimits()
+        # opt-in conditional.ConditionalCache revalidating repeat GETs with
+        # ETag / Last-Modified instead of downloading them again
+        self.conditional_cache: Optional[conditional.ConditionalCache] = None
+        # opt-in response_cache.ResponseCache answering repeat GETs without
+        # a request until they expire, writes invalidate what they change
+        self.response_cache: Optional[response_cache.ResponseCache] = None
+        # opt-in single_flight.SingleFlight sending one request for
+        # identical GETs made concurrently, their callers share its response
+        self.single_flight: Optional[single_flight.SingleFlight] = None
+        self._scope: Optional[str] = None
+        # telemetry.Telemetry tracing every call, see telemetry.instrument()
+        self.telemetry: Optional[telemetry.Telemetry] = None
+
+    @property
+    def profiler(self) -> Optional[sdk_profile.Profile]:
+        """profile.Profile timing the calls made in the current context"""
+        profilers = _profilers.get()
+        return None if profilers is None else profilers.get(self)
+
+    @profiler.setter
+    def profiler(self, value: Optional[sdk_profile.Profile]) -> None:
+        """Profile the calls made in the current context (thread or task) and
+        those it starts later, until set again. Prefer profile().
+        """
+        _profilers.set(self._with_profiler(value))
+
+    def _with_profiler(
+        self, value: Optional[sdk_profile.Profile]
+    ) -> TProfilers:
+        profilers: TProfilers = weakref.WeakKeyDictionary(_profilers.get() or {})
+        if value is None:
+            profilers.pop(self, None)
+        else:
+            profilers[self] = value
+        return profilers
+
+    def _retry_policy(
+        self, transport_options: Optional[transport.TransportOptions]
+    ) -> Optional[retry.RetryPolicy]:
+        if transport_options and "retry" in transport_options:
+            return transport_options["retry"]
+        return self.retry
+
+    def _send(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+        body: Optional[bytes],
+        transport_options: Optional[transport.TransportOptions],
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> transport.Response:
+        """transport.request() with retries according to the retry policy
+
+        operation: name of the SDK method making the request and route its
+        path template, e.g. "/dashboards/{dashboard_id}", for telemetry and
+        profiling. The generated methods pass both, route defaults to path.
+        """
+        policy = self._retry_policy(transport_options)
+        url = self._path(path)
+        call = None
+        if self.telemetry is not None:
+            call = self.telemetry.call(
+                method, route or path, body, transport_options, operation
+            )
+            transport_options = call.transport_options
+        authenticator = self.auth.authenticate
+        timings = None
+        profiler = self.profiler
+        if profiler is not None:
+            timings, authenticator, transport_options = self._profiled(
+                profiler, transport_options, operation
+            )
+        attempt = 0
+        try:
+            while True:
+                response = self.transport.request(
+                    method,
+                    url,
+                    query_params=query_params,
+                    body=body,
+                    authenticator=authenticator,
+                    transport_options=transport_options,
+                )
+                attempt += 1
+                delay = retry.next_delay(
+                    policy, self.retry_stats, method, path, response, attempt
+                )
+                if delay is None:
+                    break
+                time.sleep(delay)
+        except BaseException as exc:
+            if call is not None:
+                call.end(None, attempt, exc)
+            raise
+        if call is not None:
+            call.end(response, attempt)
+        response.timings = timings
+        self._invalidate(method, path)
+        return response
+
+    def _profiled(
+        self,
+        profiler: sdk_profile.Profile,
+        transport_options: Optional[transport.TransportOptions],
+        operation: str,
+    ) -> Tuple[Dict[str, float], Any, transport.TransportOptions]:
+        """(timings, authenticator, transport_options) profiling a call"""
+        timings = profiler.start(operation)
+        options = cast(transport.TransportOptions, dict(transport_options or {}))
+        options["timings"] = timings
+        authenticate = self.auth.authenticate
+
+        def authenticator(
+            transport_options: transport.TransportOptions,
+        ) -> Dict[str, str]:
+            started = time.perf_counter()
+            try:
+                return authenticate(transport_options)
+            finally:
+                transport.add_time(timings, "auth", time.perf_counter() - started)
+
+        return timings, authenticator, options
+
+    def _invalidate(self, method: transport.HttpMethod, path: str) -> None:
+        if self.response_cache is not None and method not in (
+            transport.HttpMethod.GET,
+            transport.HttpMethod.HEAD,
+        ):
+            self.response_cache.invalidate(path)
+
+    def _response_cache_key(
+        self,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+        transport_options: Optional[transport.TransportOptions],
+    ) -> Optional[str]:
+        if self.response_cache is None or (
+            transport_options and transport_options.get("stream")
+        ):
+            return None
+        return self.response_cache.key(self._identity(), path, query_params)
+
+    def _identity(self) -> str:
+        """Who requests are made as: Looker host, client_id and sudo user"""
+        if self._scope is None:
+            settings = self.auth.settings
+            client_id = getattr(self.auth, "client_id", None)
+            if client_id is None:
+                client_id = settings.read_config().get("client_id")
+            self._scope = f"{settings.base_url} {client_id}"
+        return f"{self._scope} {self.auth._sudo_id or ''}"
+
+    def _flight_key(
+        self,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+        transport_options: Optional[transport.TransportOptions],
+    ) -> Optional[str]:
+        """Identical GETs share a flight: same path, query, identity and
+        headers (including conditional ones). Streams are never shared.
+        """
+        if self.single_flight is None or (
+            transport_options and transport_options.get("stream")
+        ):
+            return None
+        headers = sorted((transport_options or {}).get("headers", {}).items())
+        key = response_cache.ResponseCache.key(self._identity(), path, query_params)
+        return f"{key} {headers}"
+
+    def _cached(self, key: Optional[str]) -> Optional[transport.Response]:
+        if key is None or self.response_cache is None:
+            return None
+        return self.response_cache.get(key)
+
+    def _conditional_cache(
+        self, transport_options: Optional[transport.TransportOptions]
+    ) -> Optional[conditional.ConditionalCache]:
+        if transport_options and transport_options.get("stream"):
+            return None
+        return self.conditional_cache
+
+    def _get_return(
+        self,
+        path: str,
+        key: Optional[str],
+        revalidated: Optional[conditional.TRevalidated],
+        response: transport.Response,
+        structure: TStructure,
+    ) -> TReturn:
+        """Return a GET's result, caching it as configured"""
+        entry = None
+        if revalidated is not None:
+            cache, conditional_key, entry = revalidated
+            entry = cache.update(conditional_key, entry, response)
+        if entry is not None:
+            response = entry.response
+        if key is not None and self.response_cache is not None:
+            self.response_cache.put(key, path, response)
+        if entry is None:
+            return self._return(response, structure)
+        return entry.result(
+            structure, functools.partial(self._return, response, structure)
+        )
 
     def _path(self, path: str) -> str:
         if path[0] == "/":
@@ -82,6 +342,119 @@ class APIMethods:
     def __exit__(self, *exc) -> None:
         self.auth.logout()
 
+    def batch(
+        self,
+        calls: Iterable[batch_executor.TCall],
+        max_workers: int = 8,
+        max_per_host: Optional[int] = None,
+    ) -> List[batch_executor.BatchResult]:
+        """Run SDK method calls concurrently, returning results in order
+
+        e.g. sdk.batch([functools.partial(sdk.dashboard, i) for i in ids])
+
+        Concurrent batches of this SDK with the same max_per_host (default
+        max_workers) share its limit of calls in flight.
+        See batch.BatchExecutor
+        """
+        executor = batch_executor.BatchExecutor(
+            max_workers=max_workers,
+            max_per_host=max_per_host,
+            limits=self.batch_limits,
+        )
+        return executor.run(calls)
+
+    @contextlib.contextmanager
+    def profile(self) -> Iterator[sdk_profile.Profile]:
+        """Time the phases of every call made in the block by SDK method
+
+        e.g.
+            with sdk.profile() as p:
+                sdk.search_dashboards(title="Sales%")
+            print(p.report())
+
+        Only calls made from the block's thread or task are profiled, and
+        those it runs through batch() or paginate(), not calls other
+        threads make with the same SDK at the same time.
+        See profile.Profile
+        """
+        profiler = sdk_profile.Profile()
+        token = _profilers.set(self._with_profiler(profiler))
+        try:
+            yield profiler
+        finally:
+            _profilers.reset(token)
+
+    def stream(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> transport.ResponseStream:
+        """Call an SDK method returning its response body as a ResponseStream
+
+        e.g.
+            with sdk.stream(sdk.run_inline_query, "csv", query) as body:
+                body.write_to("results.csv")
+
+        Same as passing transport_options={"stream": True} to the method.
+        """
+        options = cast(
+            transport.TransportOptions, dict(kwargs.pop("transport_options", None) or {})
+        )
+        options["stream"] = True
+        ret = method(*args, transport_options=options, **kwargs)
+        if not isinstance(ret, transport.ResponseStream):
+            name = getattr(method, "__name__", repr(method))
+            raise error.SDKError(f"{name} did not return a response body")
+        return ret
+
+    def iter_rows(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> json_rows.RowReader:
+        """Call a json or json_bi result method, parsing its rows as they arrive
+
+        e.g. for row in sdk.iter_rows(sdk.run_inline_query, "json", query):
+
+        Works with run_query, run_inline_query, run_look, query_task_results
+        or any other method returning a json array of rows or a json_bi
+        result. See json_rows.RowReader
+        """
+        body = self.stream(method, *args, **kwargs)
+        return json_rows.RowReader(body, body.encoding, close=body.close)
+
+    def paginate(
+        self,
+        method: paging.TPagedMethod[paging.T],
+        *args: Any,
+        page_size: int = paging.DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Sequence[paging.T]]:
+        """Yield successive pages of a method taking limit and offset
+
+        e.g. for page in sdk.paginate(sdk.search_dashboards, title="Sales%")
+
+        See paging.paginate
+        """
+        return paging.paginate(
+            method, *args, page_size=page_size, prefetch=prefetch, **kwargs
+        )
+
+    def iterate(
+        self,
+        method: paging.TPagedMethod[paging.T],
+        *args: Any,
+        page_size: int = paging.DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[paging.T]:
+        """Yield each item of a method taking limit and offset, page by page
+
+        e.g. for user in sdk.iterate(sdk.all_users, page_size=1000)
+
+        See paging.iterate
+        """
+        return paging.iterate(
+            method, *args, page_size=page_size, prefetch=prefetch, **kwargs
+        )
+
     def _return(self, response: transport.Response, structure: TStructure) -> TReturn:
         encoding = response.encoding
         if not response.ok:
@@ -101,18 +474,43 @@ class APIMethods:
                 raise error.SDKError(value)
             raise sdk_error
         ret: TReturn
-        if structure is None:
+        if response.stream is not None:
+            response.stream.status_code = response.status_code
+            response.stream.headers = response.headers
+            ret = response.stream  # type: ignore
+        elif structure is None:
             ret = None
         elif response.response_mode == transport.ResponseMode.BINARY:
             ret = response.value
+        elif (
+            structure == Union[str, bytes]  # type: ignore
+            or structure == str
+            or response.value == b""
+        ):
+            started = time.perf_counter()
+            ret = response.value.decode(encoding=encoding)
+            if response.timings is not None:
+                transport.add_time(
+                    response.timings, "decode", time.perf_counter() - started
+                )
         else:
-            value = response.value.decode(encoding=encoding)
-            if structure == Union[str, bytes] or structure == str or value == "":  # type: ignore
-                ret = value
-            else:
+            # the json codec parses utf-8 bytes directly
+            data: Union[str, bytes] = response.value
+            if not _is_utf8(encoding):
+                started = time.perf_counter()
+                data = response.value.decode(encoding=encoding)
+                if response.timings is not None:
+                    transport.add_time(
+                        response.timings, "decode", time.perf_counter() - started
+                    )
+            if response.timings is None:
                 # ignore type: mypy bug doesn't recognized kwarg
                 # `structure` to partial func
-                ret = self.deserialize(data=value, structure=structure)  # type: ignore
+                ret = self.deserialize(data=data, structure=structure)  # type: ignore
+            else:
+                ret = self.deserialize(
+                    data=data, structure=structure, timings=response.timings  # type: ignore
+                )
         return ret
 
     def _convert_query_params(
@@ -144,18 +542,36 @@ class APIMethods:
         structure: TStructure,
         query_params: Optional[TQueryParams] = None,
         transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
     ) -> TReturn:
         """GET method"""
         params = self._convert_query_params(query_params) if query_params else None
-        response = self.transport.request(
+        key = self._response_cache_key(path, params, transport_options)
+        cached = self._cached(key)
+        if cached is not None:
+            return self._return(cached, structure)
+        revalidated = None
+        cache = self._conditional_cache(transport_options)
+        if cache is not None:
+            revalidated = cache.revalidate(self._identity(), path, params)
+            transport_options = cache.options(revalidated[2], transport_options)
+        send = functools.partial(
+            self._send,
             transport.HttpMethod.GET,
-            self._path(path),
-            query_params=params,
-            body=None,
-            authenticator=self.auth.authenticate,
-            transport_options=transport_options,
+            path,
+            params,
+            None,
+            transport_options,
+            operation,
+            route,
         )
-        return self._return(response, structure)
+        flight = self._flight_key(path, params, transport_options)
+        if flight is None or self.single_flight is None:
+            response = send()
+        else:
+            response = self.single_flight.do(flight, send)
+        return self._get_return(path, key, revalidated, response, structure)
 
     def _get_serialized(
         self, body: TBody, transport_options: Optional[transport.TransportOptions] = None
@@ -179,6 +595,18 @@ class APIMethods:
             serialized = None
         return serialized
 
+    @staticmethod
+    def _body_options(
+        body: TBody, transport_options: Optional[transport.TransportOptions]
+    ) -> Optional[transport.TransportOptions]:
+        if isinstance(body, model.URLSearchParams):
+            if transport_options is None:
+                transport_options = {}
+            if "headers" not in transport_options:
+                transport_options["headers"] = {}
+            transport_options["headers"]["Content-Type"] = "application/x-www-form-urlencoded"
+        return transport_options
+
     def post(
         self,
         path: str,
@@ -186,23 +614,21 @@ class APIMethods:
         query_params: Optional[TQueryParams] = None,
         body: TBody = None,
         transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
     ) -> TReturn:
         """POST method"""
         params = self._convert_query_params(query_params) if query_params else None
-        if isinstance(body, model.URLSearchParams):
-            if transport_options is None:
-                transport_options = {}
-            if "headers" not in transport_options:
-                transport_options["headers"] = {}
-            transport_options["headers"]["Content-Type"] = "application/x-www-form-urlencoded"
+        transport_options = self._body_options(body, transport_options)
         serialized = self._get_serialized(body, transport_options)
-        response = self.transport.request(
+        response = self._send(
             transport.HttpMethod.POST,
-            self._path(path),
-            query_params=params,
-            body=serialized,
-            authenticator=self.auth.authenticate,
-            transport_options=transport_options,
+            path,
+            params,
+            serialized,
+            transport_options,
+            operation,
+            route,
         )
         return self._return(response, structure)
 
@@ -213,23 +639,21 @@ class APIMethods:
         query_params: Optional[TQueryParams] = None,
         body: TBody = None,
         transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
     ) -> TReturn:
         """PATCH method"""
         params = self._convert_query_params(query_params) if query_params else None
-        if isinstance(body, model.URLSearchParams):
-            if transport_options is None:
-                transport_options = {}
-            if "headers" not in transport_options:
-                transport_options["headers"] = {}
-            transport_options["headers"]["Content-Type"] = "application/x-www-form-urlencoded"
+        transport_options = self._body_options(body, transport_options)
         serialized = self._get_serialized(body, transport_options)
-        response = self.transport.request(
+        response = self._send(
             transport.HttpMethod.PATCH,
-            self._path(path),
-            query_params=params,
-            body=serialized,
-            authenticator=self.auth.authenticate,
-            transport_options=transport_options,
+            path,
+            params,
+            serialized,
+            transport_options,
+            operation,
+            route,
         )
         return self._return(response, structure)
 
@@ -240,23 +664,21 @@ class APIMethods:
         query_params: Optional[TQueryParams] = None,
         body: TBody = None,
         transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
     ) -> TReturn:
         """PUT method"""
         params = self._convert_query_params(query_params) if query_params else None
-        if isinstance(body, model.URLSearchParams):
-            if transport_options is None:
-                transport_options = {}
-            if "headers" not in transport_options:
-                transport_options["headers"] = {}
-            transport_options["headers"]["Content-Type"] = "application/x-www-form-urlencoded"
+        transport_options = self._body_options(body, transport_options)
         serialized = self._get_serialized(body, transport_options)
-        response = self.transport.request(
+        response = self._send(
             transport.HttpMethod.PUT,
-            self._path(path),
-            query_params=params,
-            body=serialized,
-            authenticator=self.auth.authenticate,
-            transport_options=transport_options,
+            path,
+            params,
+            serialized,
+            transport_options,
+            operation,
+            route,
         )
         return self._return(response, structure)
 
@@ -266,15 +688,295 @@ class APIMethods:
         structure: TStructure = None,
         query_params: Optional[TQueryParams] = None,
         transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
     ) -> TReturn:
         """DELETE method"""
         params = self._convert_query_params(query_params) if query_params else None
-        response = self.transport.request(
+        response = self._send(
             transport.HttpMethod.DELETE,
-            self._path(path),
-            query_params=params,
-            body=None,
-            authenticator=self.auth.authenticate,
-            transport_options=transport_options,
+            path,
+            params,
+            None,
+            transport_options,
+            operation,
+            route,
+        )
+        return self._return(response, structure)
+
+
+class AsyncAPIMethods(APIMethods):
+    """Functionality for making authenticated API calls over an AsyncTransport
+
+    The HTTP verb methods are coroutines so every generated SDK method
+    built on them returns an awaitable.
+    """
+
+    def __init__(
+        self,
+        auth: auth_session.AsyncAuthSession,
+        deserialize: serialize.TDeserialize,
+        serialize: serialize.TSerialize,
+        transport: transport.AsyncTransport,
+        api_version: str,
+    ):
+        super().__init__(auth, deserialize, serialize, transport, api_version)  # type: ignore
+        self.auth: auth_session.AsyncAuthSession = auth
+        self.transport: transport.AsyncTransport = transport  # type: ignore
+
+    async def __aenter__(self) -> "AsyncAPIMethods":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.auth.logout()
+        await self.transport.close()
+
+    def _unsupported(self, helper: str, alternative: str) -> NoReturn:
+        raise TypeError(
+            f"{type(self).__name__}.{helper}() needs a blocking transport, "
+            f"{alternative}"
+        )
+
+    def batch(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported, await the calls with asyncio.gather() instead"""
+        self._unsupported("batch", "await the calls with asyncio.gather() instead")
+
+    def stream(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported, AsyncTransport responses are always read in full"""
+        self._unsupported("stream", "AsyncTransport responses are read in full")
+
+    def iter_rows(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported, AsyncTransport responses are always read in full"""
+        self._unsupported("iter_rows", "AsyncTransport responses are read in full")
+
+    def paginate(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported, await the method with limit and offset instead"""
+        self._unsupported("paginate", "await the method with limit and offset")
+
+    def iterate(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Not supported, await the method with limit and offset instead"""
+        self._unsupported("iterate", "await the method with limit and offset")
+
+    def _profiled(
+        self,
+        profiler: sdk_profile.Profile,
+        transport_options: Optional[transport.TransportOptions],
+        operation: str,
+    ) -> Tuple[Dict[str, float], Any, transport.TransportOptions]:
+        timings = profiler.start(operation)
+        options = cast(transport.TransportOptions, dict(transport_options or {}))
+        options["timings"] = timings
+        authenticate = self.auth.authenticate
+
+        async def authenticator(
+            transport_options: transport.TransportOptions,
+        ) -> Dict[str, str]:
+            started = time.perf_counter()
+            try:
+                return await authenticate(transport_options)
+            finally:
+                transport.add_time(timings, "auth", time.perf_counter() - started)
+
+        return timings, authenticator, options
+
+    async def _send(  # type: ignore
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+        body: Optional[bytes],
+        transport_options: Optional[transport.TransportOptions],
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> transport.Response:
+        """transport.request() with retries according to the retry policy
+
+        operation: name of the SDK method making the request and route its
+        path template, e.g. "/dashboards/{dashboard_id}", for telemetry and
+        profiling. The generated methods pass both, route defaults to path.
+        """
+        policy = self._retry_policy(transport_options)
+        url = self._path(path)
+        call = None
+        if self.telemetry is not None:
+            call = self.telemetry.call(
+                method, route or path, body, transport_options, operation
+            )
+            transport_options = call.transport_options
+        authenticator = self.auth.authenticate
+        timings = None
+        profiler = self.profiler
+        if profiler is not None:
+            timings, authenticator, transport_options = self._profiled(
+                profiler, transport_options, operation
+            )
+        attempt = 0
+        try:
+            while True:
+                response = await self.transport.request(
+                    method,
+                    url,
+                    query_params=query_params,
+                    body=body,
+                    authenticator=authenticator,
+                    transport_options=transport_options,
+                )
+                attempt += 1
+                delay = retry.next_delay(
+                    policy, self.retry_stats, method, path, response, attempt
+                )
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        except BaseException as exc:
+            if call is not None:
+                call.end(None, attempt, exc)
+            raise
+        if call is not None:
+            call.end(response, attempt)
+        response.timings = timings
+        self._invalidate(method, path)
+        return response
+
+    async def _request(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        structure: TStructure,
+        query_params: Optional[TQueryParams],
+        body: TBody,
+        transport_options: Optional[transport.TransportOptions],
+        operation: str,
+        route: Optional[str],
+    ) -> TReturn:
+        params = self._convert_query_params(query_params) if query_params else None
+        transport_options = self._body_options(body, transport_options)
+        serialized = self._get_serialized(body, transport_options)
+        response = await self._send(
+            method, path, params, serialized, transport_options, operation, route
         )
         return self._return(response, structure)
+
+    async def get(  # type: ignore
+        self,
+        path: str,
+        structure: TStructure,
+        query_params: Optional[TQueryParams] = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> TReturn:
+        """GET method"""
+        params = self._convert_query_params(query_params) if query_params else None
+        key = self._response_cache_key(path, params, transport_options)
+        cached = self._cached(key)
+        if cached is not None:
+            return self._return(cached, structure)
+        revalidated = None
+        cache = self._conditional_cache(transport_options)
+        if cache is not None:
+            revalidated = cache.revalidate(self._identity(), path, params)
+            transport_options = cache.options(revalidated[2], transport_options)
+        send = functools.partial(
+            self._send,
+            transport.HttpMethod.GET,
+            path,
+            params,
+            None,
+            transport_options,
+            operation,
+            route,
+        )
+        flight = self._flight_key(path, params, transport_options)
+        if flight is None or self.single_flight is None:
+            response = await send()
+        else:
+            response = await self.single_flight.do_async(flight, send)
+        return self._get_return(path, key, revalidated, response, structure)
+
+    async def post(  # type: ignore
+        self,
+        path: str,
+        structure: TStructure,
+        query_params: Optional[TQueryParams] = None,
+        body: TBody = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> TReturn:
+        """POST method"""
+        return await self._request(
+            transport.HttpMethod.POST,
+            path,
+            structure,
+            query_params,
+            body,
+            transport_options,
+            operation,
+            route,
+        )
+
+    async def patch(  # type: ignore
+        self,
+        path: str,
+        structure: TStructure,
+        query_params: Optional[TQueryParams] = None,
+        body: TBody = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> TReturn:
+        """PATCH method"""
+        return await self._request(
+            transport.HttpMethod.PATCH,
+            path,
+            structure,
+            query_params,
+            body,
+            transport_options,
+            operation,
+            route,
+        )
+
+    async def put(  # type: ignore
+        self,
+        path: str,
+        structure: TStructure = None,
+        query_params: Optional[TQueryParams] = None,
+        body: TBody = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> TReturn:
+        """PUT method"""
+        return await self._request(
+            transport.HttpMethod.PUT,
+            path,
+            structure,
+            query_params,
+            body,
+            transport_options,
+            operation,
+            route,
+        )
+
+    async def delete(  # type: ignore
+        self,
+        path: str,
+        structure: TStructure = None,
+        query_params: Optional[TQueryParams] = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+        operation: str = "",
+        route: Optional[str] = None,
+    ) -> TReturn:
+        """DELETE method"""
+        return await self._request(
+            transport.HttpMethod.DELETE,
+            path,
+            structure,
+            query_params,
+            None,
+            transport_options,
+            operation,
+            route,
+        )
@@ -46,6 +46,13 @@ class SettingsConfig(TypedDict, total=False):
     timeout: str
     redirect_uri: str
     looker_url: str
+    pool_connections: str
+    pool_maxsize: str
+    pool_block: str
+    keep_alive: str
+    session_per_thread: str
+    connect_timeout: str
+    read_timeout: str
 
 
 class PApiSettings(transport.PTransportSettings, Protocol):
@@ -54,6 +61,15 @@ class PApiSettings(transport.PTransportSettings, Protocol):
 
 
 _DEFAULT_INIS = ["looker.ini", "../looker.ini"]
+_CONNECTION_SETTINGS = [
+    "pool_connections",
+    "pool_maxsize",
+    "pool_block",
+    "keep_alive",
+    "session_per_thread",
+    "connect_timeout",
+    "read_timeout",
+]
 
 
 class ApiSettings(PApiSettings):
@@ -76,6 +92,8 @@ class ApiSettings(PApiSettings):
         ENV variables map like this:
             <package-prefix>_BASE_URL -> base_url
             <package-prefix>_VERIFY_SSL -> verify_ssl
+            <package-prefix>_POOL_MAXSIZE -> pool_maxsize (and likewise for
+                the other connection pool and timeout settings)
 
         Args:
             filename (str): config file. If specified, the file must exist.
@@ -99,6 +117,13 @@ class ApiSettings(PApiSettings):
             self.verify_ssl = self._bool(verify_ssl)
         self.base_url = data.get("base_url", "")
         self.timeout = int(data.get("timeout", 120))
+        self.pool_connections = int(data.get("pool_connections", 10))
+        self.pool_maxsize = int(data.get("pool_maxsize", 10))
+        self.pool_block = self._bool(data.get("pool_block", "false"))
+        self.keep_alive = self._bool(data.get("keep_alive", "true"))
+        self.session_per_thread = self._bool(data.get("session_per_thread", "false"))
+        self.connect_timeout = self._float(data.get("connect_timeout"))
+        self.read_timeout = self._float(data.get("read_timeout"))
         self.headers = {"Content-Type": "application/json"}
         self.agent_tag = f"{transport.AGENT_PREFIX}"
         if sdk_version:
@@ -137,6 +162,10 @@ class ApiSettings(PApiSettings):
             raise TypeError
         return converted
 
+    @staticmethod
+    def _float(val: Optional[str]) -> Optional[float]:
+        return None if val is None else float(val)
+
     def _override_settings(
         self, data: SettingsConfig, overrides: Dict[str, str]
     ) -> SettingsConfig:
@@ -160,6 +189,11 @@ class ApiSettings(PApiSettings):
         if timeout:
             overrides["timeout"] = timeout
 
+        for setting in _CONNECTION_SETTINGS:
+            value = os.getenv(f"{self.env_prefix}_{setting.upper()}")
+            if value:
+                overrides[setting] = value
+
         client_id = os.getenv(f"{self.env_prefix}_CLIENT_ID")
         if client_id:
             overrides["client_id"] = client_id
@@ -22,9 +22,12 @@
 
 """AuthSession to provide automatic authentication
 """
+import asyncio
+import contextlib
 import hashlib
 import secrets
-from typing import cast, Dict, Optional, Union
+import threading
+from typing import cast, Any, ContextManager, Dict, Optional, Union
 import urllib.parse
 
 import attr
@@ -34,6 +37,8 @@ from looker_sdk.rtl import api_settings
 from looker_sdk.rtl import auth_token
 from looker_sdk.rtl import model
 from looker_sdk.rtl import serialize
+from looker_sdk.rtl import telemetry
+from looker_sdk.rtl import token_store
 from looker_sdk.rtl import transport
 
 
@@ -56,6 +61,19 @@ class AuthSession:
         self.transport = transport
         self.deserialize = deserialize
         self.token_model = auth_token.AccessToken
+        # seconds before expiry at which a token still in use is renewed by a
+        # background thread so callers never wait on /login. 0 disables.
+        self.renew_ahead = 60
+        # reentrant: _login_sudo() needs the api token via _get_token()
+        self._lock = threading.RLock()
+        # guards starting the renewal thread only, never held over a request
+        self._renewal_lock = threading.Lock()
+        self._renewal: Optional[threading.Thread] = None
+        # token_store.TokenStore sharing the API token with other processes
+        # so they can skip /login while it is active
+        self.token_store: Optional[token_store.TokenStore] = None
+        # telemetry.Telemetry adding spans for logins
+        self.telemetry: Optional[telemetry.Telemetry] = None
 
     def _is_authenticated(self, token: auth_token.AuthToken) -> bool:
         """Determines if current token is active."""
@@ -74,19 +92,77 @@ class AuthSession:
     def _get_sudo_token(
         self, transport_options: transport.TransportOptions
     ) -> auth_token.AuthToken:
-        """Returns an active sudo token."""
+        """Returns an active sudo token.
+
+        Only one thread logs in, any others wait for and share its token.
+        """
         if not self.is_sudo_authenticated:
-            self._login_sudo(transport_options)
+            with self._lock:
+                if not self.is_sudo_authenticated:
+                    self._login_sudo(transport_options)
+        elif self.sudo_token.expires_within(self.renew_ahead):
+            self._renew_in_background(True, transport_options)
         return self.sudo_token
 
     def _get_token(
         self, transport_options: transport.TransportOptions
     ) -> auth_token.AuthToken:
-        """Returns an active token."""
+        """Returns an active token.
+
+        Only one thread logs in, any others wait for and share its token.
+        """
         if not self.is_authenticated:
-            self._login(transport_options)
+            with self._lock:
+                if not self.is_authenticated:
+                    self._login(transport_options)
+        elif self.token.expires_within(self.renew_ahead):
+            self._renew_in_background(False, transport_options)
         return self.token
 
+    def _renew_in_background(
+        self, sudo: bool, transport_options: transport.TransportOptions
+    ) -> None:
+        """Start a thread to renew the (sudo) token unless one is running."""
+        with self._renewal_lock:
+            if self._renewal and self._renewal.is_alive():
+                return
+            options = cast(transport.TransportOptions, dict(transport_options))
+            if "headers" in options:
+                options["headers"] = dict(options["headers"])
+            self._renewal = threading.Thread(
+                target=self._renew, args=(sudo, options), daemon=True
+            )
+            self._renewal.start()
+
+    def _renew(self, sudo: bool, transport_options: transport.TransportOptions):
+        """Log in again while callers keep using the expiring token.
+
+        The lock is only taken to swap in the new token, so authenticate()
+        never waits on the renewal's /login.
+        """
+        token = self.sudo_token if sudo else self.token
+        # renewed or logged out since the thread was started
+        if not token.access_token or not token.expires_within(self.renew_ahead):
+            return
+        try:
+            if sudo:
+                renewed = self._fetch_sudo_token(transport_options)
+            else:
+                renewed = self._stored_token() or self._fetch_token(
+                    transport_options
+                )
+        except error.SDKError:
+            # the token is still active: the next authenticate() call
+            # after it expires logs in again and surfaces the error
+            return
+        with self._lock:
+            # unless logged out or in again meanwhile
+            if sudo and self.sudo_token is token:
+                self.sudo_token = renewed
+            elif not sudo and self.token is token:
+                self.token = renewed
+                self._store_token()
+
     def authenticate(
         self, transport_options: transport.TransportOptions
     ) -> Dict[str, str]:
@@ -94,6 +170,7 @@ class AuthSession:
 
         Expired token renewal happens automatically.
         """
+        transport_options = self._auth_options(transport_options)
         if self._sudo_id:
             token = self._get_sudo_token(transport_options)
         else:
@@ -101,6 +178,18 @@ class AuthSession:
 
         return {"Authorization": f"Bearer {token.access_token}"}
 
+    @staticmethod
+    def _auth_options(
+        transport_options: transport.TransportOptions,
+    ) -> transport.TransportOptions:
+        """The API call's transport_options minus those that don't apply to login"""
+        if "stream" not in transport_options and "timings" not in transport_options:
+            return transport_options
+        options = cast(transport.TransportOptions, dict(transport_options))
+        options.pop("stream", None)
+        options.pop("timings", None)
+        return options
+
     def login_user(
         self,
         sudo_id: int,
@@ -112,24 +201,26 @@ class AuthSession:
         token is automatically renewed when it expires. In order to
         subsequently login_user() as another user you must first logout()
         """
-        if self._sudo_id is None:
-            self._sudo_id = sudo_id
-            try:
-                self._login_sudo(transport_options or {})
-            except error.SDKError:
-                self._sudo_id = None
-                raise
-
-        else:
-            if self._sudo_id != sudo_id:
-                raise error.SDKError(
-                    f"Another user ({self._sudo_id}) "
-                    "is already logged in. Log them out first."
-                )
-            elif not self.is_sudo_authenticated:
-                self._login_sudo(transport_options or {})
-
-    def _login(self, transport_options: transport.TransportOptions) -> None:
+        with self._lock:
+            if self._sudo_id is None:
+                self._sudo_id = sudo_id
+                try:
+                    self._login_sudo(transport_options or {})
+                except error.SDKError:
+                    self._sudo_id = None
+                    raise
+
+            else:
+                if self._sudo_id != sudo_id:
+                    raise error.SDKError(
+                        f"Another user ({self._sudo_id}) "
+                        "is already logged in. Log them out first."
+                    )
+                elif not self.is_sudo_authenticated:
+                    self._login_sudo(transport_options or {})
+
+    def _login_body(self, transport_options: transport.TransportOptions) -> bytes:
+        """Form encoded credentials for the /login request."""
         client_id = self.settings.read_config().get("client_id")
         client_secret = self.settings.read_config().get("client_secret")
         if not (client_id and client_secret):
@@ -140,28 +231,88 @@ class AuthSession:
             "client_secret": cast(str, client_secret),
         }
 
-        serialized = urllib.parse.urlencode(login).encode("utf-8")
-
         transport_options.setdefault("headers", {}).update(
             {"Content-Type": "application/x-www-form-urlencoded"}
         )
-        response = self._ok(
-            self.transport.request(
-                transport.HttpMethod.POST,
-                f"{self.settings.base_url}/api/{self.api_version}/login",
-                body=serialized,
-                transport_options=transport_options,
-            )
-        )
+        return urllib.parse.urlencode(login).encode("utf-8")
 
+    def _auth_token(self, response: str) -> auth_token.AuthToken:
         # ignore type: mypy bug doesn't recognized kwarg `structure` to partial func
         access_token = self.deserialize(
             data=response, structure=self.token_model
         )  # type: ignore
         assert isinstance(access_token, auth_token.AccessToken)
-        self.token = auth_token.AuthToken(access_token)
+        return auth_token.AuthToken(access_token)
+
+    def _span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        if self.telemetry is None:
+            return contextlib.nullcontext()
+        return self.telemetry.span(name, attributes)
+
+    def _token_key(self) -> str:
+        client_id = self.settings.read_config().get("client_id") or ""
+        return token_store.token_key(self.settings.base_url, client_id)
+
+    def _stored_token(self) -> Optional[auth_token.AuthToken]:
+        """The token_store's token if it is active, not about to be renewed
+        and not the one already in use.
+        """
+        if self.token_store is None:
+            return None
+        token = self.token_store.load(self._token_key())
+        if (
+            token is None
+            or not token.is_active
+            or token.expires_within(self.renew_ahead)
+            or token.access_token == self.token.access_token
+        ):
+            return None
+        return token
+
+    def _restore_token(self) -> bool:
+        """Use the token_store's token, if any, rather than logging in."""
+        token = self._stored_token()
+        if token is None:
+            return False
+        self.token = token
+        return True
+
+    def _store_token(self) -> None:
+        if self.token_store is not None:
+            self.token_store.save(self._token_key(), self.token)
+
+    def _login(self, transport_options: transport.TransportOptions) -> None:
+        if self._restore_token():
+            return
+        self.token = self._fetch_token(transport_options)
+        self._store_token()
+
+    def _fetch_token(
+        self, transport_options: transport.TransportOptions
+    ) -> auth_token.AuthToken:
+        """A new API token from /login"""
+        serialized = self._login_body(transport_options)
+        with self._span("looker.login"):
+            response = self._ok(
+                self.transport.request(
+                    transport.HttpMethod.POST,
+                    f"{self.settings.base_url}/api/{self.api_version}/login",
+                    body=serialized,
+                    transport_options=transport_options,
+                )
+            )
+        return self._auth_token(response)
 
     def _login_sudo(self, transport_options: transport.TransportOptions) -> None:
+        self.sudo_token = self._fetch_sudo_token(transport_options)
+
+    def _fetch_sudo_token(
+        self, transport_options: transport.TransportOptions
+    ) -> auth_token.AuthToken:
+        """A new sudo token from /login/{sudo_id}"""
+
         def authenticator(
             transport_options: transport.TransportOptions,
         ) -> Dict[str, str]:
@@ -169,20 +320,16 @@ class AuthSession:
                 "Authorization": f"Bearer {self._get_token(transport_options).access_token}"
             }
 
-        response = self._ok(
-            self.transport.request(
-                transport.HttpMethod.POST,
-                f"{self.settings.base_url}/api/{self.api_version}/login/{self._sudo_id}",
-                authenticator=authenticator,
-                transport_options=transport_options,
+        with self._span("looker.login_sudo", {"looker.sudo_id": str(self._sudo_id)}):
+            response = self._ok(
+                self.transport.request(
+                    transport.HttpMethod.POST,
+                    f"{self.settings.base_url}/api/{self.api_version}/login/{self._sudo_id}",
+                    authenticator=authenticator,
+                    transport_options=transport_options,
+                )
             )
-        )
-        # ignore type: mypy bug doesn't recognized kwarg `structure` to partial func
-        access_token = self.deserialize(
-            data=response, structure=self.token_model
-        )  # type: ignore
-        assert isinstance(access_token, auth_token.AccessToken)
-        self.sudo_token = auth_token.AuthToken(access_token)
+        return self._auth_token(response)
 
     def logout(
         self,
@@ -198,15 +345,16 @@ class AuthSession:
         or logout(). If you want to logout completely in one step pass
         full=True
         """
-        if self._sudo_id:
-            self._sudo_id = None
-            if self.is_sudo_authenticated:
-                self._logout(sudo=True, transport_options=transport_options)
-                if full:
-                    self._logout(transport_options=transport_options)
+        with self._lock:
+            if self._sudo_id:
+                self._sudo_id = None
+                if self.is_sudo_authenticated:
+                    self._logout(sudo=True, transport_options=transport_options)
+                    if full:
+                        self._logout(transport_options=transport_options)
 
-        elif self.is_authenticated:
-            self._logout(transport_options=transport_options)
+            elif self.is_authenticated:
+                self._logout(transport_options=transport_options)
 
     def _logout(
         self,
@@ -214,12 +362,7 @@ class AuthSession:
         transport_options: Optional[transport.TransportOptions] = None,
     ) -> None:
 
-        if sudo:
-            token = self.sudo_token.access_token
-            self.sudo_token = auth_token.AuthToken()
-        else:
-            token = self.token.access_token
-            self.token = auth_token.AuthToken()
+        token = self._discard_token(sudo)
 
         def authenticator(
             _transport_options: transport.TransportOptions,
@@ -235,12 +378,194 @@ class AuthSession:
             )
         )
 
+    def _discard_token(self, sudo: bool) -> str:
+        """Reset the (sudo) token and return the access_token it held."""
+        if sudo:
+            token = self.sudo_token.access_token
+            self.sudo_token = auth_token.AuthToken()
+        else:
+            token = self.token.access_token
+            self.token = auth_token.AuthToken()
+            if self.token_store is not None:
+                # logging out revokes the token for every process using it
+                self.token_store.delete(self._token_key())
+        return token
+
     def _ok(self, response: transport.Response) -> str:
         if not response.ok:
             raise error.SDKError(response.value.decode(encoding="utf-8"))
         return response.value.decode(encoding="utf-8")
 
 
+class AsyncAuthSession(AuthSession):
+    """AuthSession to provide automatic authentication over an AsyncTransport
+
+    Concurrent coroutines needing a (sudo) token share a single /login
+    request rather than each logging in.
+    """
+
+    def __init__(
+        self,
+        settings: api_settings.PApiSettings,
+        transport: transport.AsyncTransport,
+        deserialize: serialize.TDeserialize,
+        api_version: str,
+    ):
+        super().__init__(settings, transport, deserialize, api_version)  # type: ignore
+        self.transport: transport.AsyncTransport = transport  # type: ignore
+        # created lazily so the lock binds to the running event loop
+        self._login_lock: Optional[asyncio.Lock] = None
+
+    def _async_lock(self) -> asyncio.Lock:
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        return self._login_lock
+
+    async def _get_sudo_token(  # type: ignore
+        self, transport_options: transport.TransportOptions
+    ) -> auth_token.AuthToken:
+        """Returns an active sudo token."""
+        if not self.is_sudo_authenticated:
+            async with self._async_lock():
+                if not self.is_sudo_authenticated:
+                    await self._login_sudo(transport_options)
+        return self.sudo_token
+
+    async def _get_token(  # type: ignore
+        self, transport_options: transport.TransportOptions
+    ) -> auth_token.AuthToken:
+        """Returns an active token."""
+        if not self.is_authenticated:
+            async with self._async_lock():
+                if not self.is_authenticated:
+                    await self._login(transport_options)
+        return self.token
+
+    async def authenticate(  # type: ignore
+        self, transport_options: transport.TransportOptions
+    ) -> Dict[str, str]:
+        """Return the Authorization header to authenticate each API call.
+
+        Expired token renewal happens automatically.
+        """
+        transport_options = self._auth_options(transport_options)
+        if self._sudo_id:
+            token = await self._get_sudo_token(transport_options)
+        else:
+            token = await self._get_token(transport_options)
+
+        return {"Authorization": f"Bearer {token.access_token}"}
+
+    async def login_user(  # type: ignore
+        self,
+        sudo_id: int,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> None:
+        """Authenticate using settings credentials and sudo as sudo_id.
+
+        See AuthSession.login_user()
+        """
+        if self._sudo_id is None:
+            self._sudo_id = sudo_id
+            try:
+                await self._login_sudo(transport_options or {})
+            except error.SDKError:
+                self._sudo_id = None
+                raise
+
+        else:
+            if self._sudo_id != sudo_id:
+                raise error.SDKError(
+                    f"Another user ({self._sudo_id}) "
+                    "is already logged in. Log them out first."
+                )
+            elif not self.is_sudo_authenticated:
+                await self._login_sudo(transport_options or {})
+
+    async def _login(  # type: ignore
+        self, transport_options: transport.TransportOptions
+    ) -> None:
+        if self._restore_token():
+            return
+        serialized = self._login_body(transport_options)
+        with self._span("looker.login"):
+            response = self._ok(
+                await self.transport.request(
+                    transport.HttpMethod.POST,
+                    f"{self.settings.base_url}/api/{self.api_version}/login",
+                    body=serialized,
+                    transport_options=transport_options,
+                )
+            )
+        self.token = self._auth_token(response)
+        self._store_token()
+
+    async def _login_sudo(  # type: ignore
+        self, transport_options: transport.TransportOptions
+    ) -> None:
+        async def authenticator(
+            transport_options: transport.TransportOptions,
+        ) -> Dict[str, str]:
+            token = self.token
+            if not self.is_authenticated:
+                # already holding the login lock so log in directly
+                await self._login(transport_options)
+                token = self.token
+            return {"Authorization": f"Bearer {token.access_token}"}
+
+        with self._span("looker.login_sudo", {"looker.sudo_id": str(self._sudo_id)}):
+            response = self._ok(
+                await self.transport.request(
+                    transport.HttpMethod.POST,
+                    f"{self.settings.base_url}/api/{self.api_version}/login/{self._sudo_id}",
+                    authenticator=authenticator,
+                    transport_options=transport_options,
+                )
+            )
+        self.sudo_token = self._auth_token(response)
+
+    async def logout(  # type: ignore
+        self,
+        full: bool = False,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> None:
+        """Logout of API.
+
+        See AuthSession.logout()
+        """
+        if self._sudo_id:
+            self._sudo_id = None
+            if self.is_sudo_authenticated:
+                await self._logout(sudo=True, transport_options=transport_options)
+                if full:
+                    await self._logout(transport_options=transport_options)
+
+        elif self.is_authenticated:
+            await self._logout(transport_options=transport_options)
+
+    async def _logout(  # type: ignore
+        self,
+        sudo: bool = False,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> None:
+
+        token = self._discard_token(sudo)
+
+        async def authenticator(
+            _transport_options: transport.TransportOptions,
+        ) -> Dict[str, str]:
+            return {"Authorization": f"Bearer {token}"}
+
+        self._ok(
+            await self.transport.request(
+                transport.HttpMethod.DELETE,
+                f"{self.settings.base_url}/api/logout",
+                authenticator=authenticator,
+                transport_options=transport_options,
+            )
+        )
+
+
 class CryptoHash:
     def secure_random(self, byte_count: int) -> str:
         return secrets.token_urlsafe(byte_count)
@@ -344,10 +669,16 @@ class OAuthSession(AuthSession):
         self.token = auth_token.AuthToken(access_token)
 
     def _login(self, transport_options: transport.TransportOptions) -> None:
+        self.token = self._fetch_token(transport_options)
+
+    def _fetch_token(
+        self, transport_options: transport.TransportOptions
+    ) -> auth_token.AuthToken:
+        """A new token for the current one's refresh_token"""
         params = self.RefreshTokenGrantTypeParams(
             client_id=self.client_id,
             redirect_uri=self.redirect_uri,
             refresh_token=self.token.refresh_token,
         )
         access_token = self._request_token(params, transport_options)
-        self.token = auth_token.AuthToken(access_token)
+        return auth_token.AuthToken(access_token)
@@ -93,6 +93,14 @@ class AuthToken:
             lag = datetime.timedelta(seconds=token.expires_in - self.lag_time)
         self.expires_at = datetime.datetime.now() + lag
 
+    def expires_within(self, seconds: int) -> bool:
+        """True if the token expires in the next `seconds` seconds"""
+        if not seconds:
+            return False
+        return self.expires_at <= datetime.datetime.now() + datetime.timedelta(
+            seconds=seconds
+        )
+
     @property
     def is_active(self) -> bool:
         """True if authentication token has not timed out"""
@@ -0,0 +1,126 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Run many SDK method calls concurrently over a bounded worker pool
+"""
+import concurrent.futures
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import attr
+
+from looker_sdk import error
+
+TCall = Callable[[], Any]
+
+
+@attr.s(auto_attribs=True)
+class BatchResult:
+    """Outcome of one call in a batch:
+    value: return value of the call (None if it failed)
+    sdk_error: SDKError raised by the call, if any
+    elapsed: wall clock seconds the call took
+    """
+
+    value: Any = None
+    sdk_error: Optional[error.SDKError] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.sdk_error is None
+
+
+class BatchLimits:
+    """Limits on calls in flight shared by every executor given them
+
+    Each SDK has its own so its concurrent batches can't overwhelm the
+    Looker API rate limiter together. Executors asking for the same
+    max_per_host share one limit, a different max_per_host gets its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._slots: Dict[int, threading.BoundedSemaphore] = {}
+
+    def slots(self, size: int) -> threading.BoundedSemaphore:
+        with self._lock:
+            if size not in self._slots:
+                self._slots[size] = threading.BoundedSemaphore(size)
+            return self._slots[size]
+
+
+class BatchExecutor:
+    """Run SDK method calls concurrently, preserving their order
+
+    e.g.
+        executor = BatchExecutor(max_workers=8)
+        results = executor.run([functools.partial(sdk.dashboard, i) for i in ids])
+
+    An SDKError raised by a call is recorded on its BatchResult rather than
+    aborting the batch. Any other exception propagates.
+
+    At most max_per_host (default max_workers) calls are in flight at once,
+    counting the calls of every other executor sharing `limits` with the
+    same max_per_host, see sdk.batch().
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_per_host: Optional[int] = None,
+        limits: Optional[BatchLimits] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host or max_workers
+        if limits is None:
+            limits = BatchLimits()
+        self._slots = limits.slots(self.max_per_host)
+
+    def _call(self, call: TCall) -> BatchResult:
+        result = BatchResult()
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                result.value = call()
+            except error.SDKError as ex:
+                result.sdk_error = ex
+            finally:
+                result.elapsed = time.perf_counter() - start
+        return result
+
+    def run(self, calls: Iterable[TCall]) -> List[BatchResult]:
+        """Run calls concurrently and return their results in the same order"""
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="looker_sdk_batch"
+        ) as pool:
+            # each call runs in a copy of the caller's context, e.g. to be
+            # profiled by an enclosing sdk.profile()
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._call, call)
+                for call in calls
+            ]
+            return [future.result() for future in futures]
@@ -0,0 +1,497 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Record real API traffic to a cassette and replay it offline
+
+A RecordingTransport wraps any transport and appends every request and
+response to a gzip compressed cassette. Request headers, which carry the
+Authorization header, are not recorded. Cookies, login credentials and
+secret fields such as access tokens and passwords are scrubbed before
+writing.
+
+A ReplayTransport serves a cassette back without a Looker instance, with
+optional simulated latency and bandwidth, to load test pipelines and the
+SDK's client side overhead.
+
+e.g.
+    sdk = looker_sdk.init40()
+    with cassette.record(sdk, "dashboards.jsonl.gz"):
+        sdk.search_dashboards(title="Sales%")
+
+    sdk = looker_sdk.init40()
+    cassette.replay(sdk, "dashboards.jsonl.gz", latency=0.05)
+    sdk.search_dashboards(title="Sales%")  # served from the cassette
+"""
+import base64
+import collections
+import gzip
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from typing import (
+    IO,
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import attr
+
+from looker_sdk import error
+from looker_sdk.rtl import transport
+
+VERSION = 1
+SCRUBBED = "scrubbed"
+# query params and JSON fields, at any depth, whose values are scrubbed
+SCRUBBED_FIELDS = frozenset(
+    ["access_token", "refresh_token", "client_secret", "password"]
+)
+_SCRUBBED_RESPONSE_HEADERS = {"set-cookie"}
+# requests carrying credentials and responses carrying tokens
+_CREDENTIALS_PATH = re.compile(r"/(login(/[^/]+)?|token)$")
+
+TKey = Tuple[str, str, Tuple[Tuple[str, str], ...], Optional[bytes]]
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class Interaction:
+    """A recorded request and its response"""
+
+    method: str
+    # the url path, so a cassette replays against any base_url
+    path: str
+    query_params: Dict[str, str] = attr.ib(factory=dict)
+    body: Optional[bytes] = None
+    ok: bool
+    status_code: Optional[int] = None
+    headers: Dict[str, str] = attr.ib(factory=dict)
+    response_mode: str
+    encoding: str = "utf-8"
+    value: bytes = b""
+    # seconds from sending the request to reading the whole response
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> TKey:
+        return _key(self.method, self.path, self.query_params, self.body)
+
+    def to_json(self) -> Dict[str, Any]:
+        data = attr.asdict(self)
+        data["body"] = _b64(self.body)
+        data["value"] = _b64(self.value)
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Interaction":
+        data = dict(data)
+        data["body"] = None if data["body"] is None else base64.b64decode(data["body"])
+        data["value"] = base64.b64decode(data["value"])
+        return cls(**data)
+
+    def response(self) -> transport.Response:
+        return transport.Response(
+            ok=self.ok,
+            value=self.value,
+            response_mode=transport.ResponseMode[self.response_mode],
+            encoding=self.encoding,
+            status_code=self.status_code,
+            headers=dict(self.headers),
+        )
+
+
+def _b64(value: Optional[bytes]) -> Optional[str]:
+    return None if value is None else base64.b64encode(value).decode("ascii")
+
+
+def _url_path(url: str) -> str:
+    return urllib.parse.urlsplit(url).path
+
+
+def _key(
+    method: str, path: str, query_params: Dict[str, str], body: Optional[bytes]
+) -> TKey:
+    return (method, path, tuple(sorted(query_params.items())), body)
+
+
+def _scrub_query_params(
+    query_params: Optional[MutableMapping[str, str]], fields: FrozenSet[str]
+) -> Dict[str, str]:
+    params = {k: str(v) for k, v in (query_params or {}).items()}
+    for name in fields.intersection(params):
+        params[name] = SCRUBBED
+    return params
+
+
+def _scrub_body(
+    path: str, body: Optional[bytes], fields: FrozenSet[str]
+) -> Optional[bytes]:
+    if body is None:
+        return None
+    if _CREDENTIALS_PATH.search(path):
+        return SCRUBBED.encode("ascii")
+    return _scrub_json(body, fields)
+
+
+def _scrub_json(value: bytes, fields: FrozenSet[str]) -> bytes:
+    # only parse the bodies that could contain one of the fields
+    if not any(b'"%s"' % field.encode("utf-8") in value for field in fields):
+        return value
+    try:
+        data = json.loads(value)
+    except ValueError:
+        return value
+    if not _scrub_fields(data, fields):
+        return value
+    return json.dumps(data).encode("utf-8")
+
+
+def _scrub_fields(data: Any, fields: FrozenSet[str]) -> bool:
+    """Scrub fields in data in place, returns whether any was scrubbed"""
+    scrubbed = False
+    if isinstance(data, dict):
+        for name, value in data.items():
+            if name in fields:
+                if value:
+                    data[name] = SCRUBBED
+                    scrubbed = True
+            elif _scrub_fields(value, fields):
+                scrubbed = True
+    elif isinstance(data, list):
+        for item in data:
+            if _scrub_fields(item, fields):
+                scrubbed = True
+    return scrubbed
+
+
+def _scrub_headers(
+    headers: Optional[MutableMapping[str, str]], scrubbed: Any
+) -> Dict[str, str]:
+    return {
+        name: SCRUBBED if name.lower() in scrubbed else value
+        for name, value in (headers or {}).items()
+    }
+
+
+def load(path: Union[str, "os.PathLike[str]"]) -> List[Interaction]:
+    """The interactions recorded in a cassette, in order"""
+    interactions = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for number, line in enumerate(f):
+            data = json.loads(line)
+            if number == 0:
+                if data.get("cassette") != VERSION:
+                    raise error.SDKError(f"{path} is not a version {VERSION} cassette")
+                continue
+            interactions.append(Interaction.from_json(data))
+    return interactions
+
+
+class RecordingTransport(transport.Transport):
+    """Transport recording every request made through another transport
+
+    Interactions are appended to the cassette as they complete, a streamed
+    response when its stream is exhausted or closed. Call close() to
+    finish writing the cassette.
+
+    scrub_fields: query params and JSON body or response fields recorded
+        as "scrubbed" instead of their value
+    """
+
+    def __init__(
+        self,
+        transport: transport.Transport,
+        path: Union[str, "os.PathLike[str]"],
+        scrub_fields: Iterable[str] = SCRUBBED_FIELDS,
+    ):
+        self.transport = transport
+        self.path = path
+        self.scrub_fields = frozenset(scrub_fields)
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = gzip.open(path, "wt", encoding="utf-8")
+        self._file.write(json.dumps({"cassette": VERSION}) + "\n")
+
+    @classmethod
+    def configure(cls, settings: transport.PTransportSettings) -> transport.Transport:
+        raise error.SDKError(
+            "RecordingTransport wraps a configured transport: "
+            "RecordingTransport(transport, path)"
+        )
+
+    @property  # type: ignore
+    def rate_limiter(self):  # type: ignore
+        return self.transport.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value):
+        self.transport.rate_limiter = value
+
+    def request(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        authenticator: transport.TAuthenticator = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> transport.Response:
+        started = time.perf_counter()
+        response = self.transport.request(
+            method, path, query_params, body, authenticator, transport_options
+        )
+        url_path = _url_path(path)
+        interaction = Interaction(
+            method=method.name,
+            path=url_path,
+            query_params=_scrub_query_params(query_params, self.scrub_fields),
+            body=_scrub_body(url_path, body, self.scrub_fields),
+            ok=response.ok,
+            status_code=response.status_code,
+            headers=_scrub_headers(response.headers, _SCRUBBED_RESPONSE_HEADERS),
+            response_mode=response.response_mode.name,
+            encoding=response.encoding,
+        )
+        if response.stream is None:
+            interaction.value = _scrub_json(response.value, self.scrub_fields)
+            interaction.elapsed = time.perf_counter() - started
+            self._write(interaction)
+        else:
+            response.stream = self._recorded(response.stream, interaction, started)
+        return response
+
+    def _recorded(
+        self,
+        stream: transport.ResponseStream,
+        interaction: Interaction,
+        started: float,
+    ) -> transport.ResponseStream:
+        chunks: List[bytes] = []
+        written = False
+
+        def close() -> None:
+            nonlocal written
+            stream.close()
+            if not written:
+                written = True
+                interaction.value = _scrub_json(b"".join(chunks), self.scrub_fields)
+                interaction.elapsed = time.perf_counter() - started
+                self._write(interaction)
+
+        def read() -> Iterator[bytes]:
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    yield chunk
+            finally:
+                close()
+
+        return transport.ResponseStream(read(), encoding=stream.encoding, close=close)
+
+    def _write(self, interaction: Interaction) -> None:
+        line = json.dumps(interaction.to_json()) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Finish writing the cassette"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReplayTransport(transport.Transport):
+    """Transport serving the responses recorded in a cassette
+
+    Requests are matched on method, url path, query params and body.
+    Repeats of a request are served its recorded responses in order,
+    starting over after the last one, so a short recording can drive a
+    long load test.
+
+    latency: seconds each response takes, None for the time it took when
+        it was recorded
+    bandwidth: bytes per second the response body downloads at, None for
+        no limit
+    scrub_fields: the fields the cassette was recorded with, scrubbed from
+        requests before matching them
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        latency: Optional[float] = 0.0,
+        bandwidth: Optional[float] = None,
+        scrub_fields: Iterable[str] = SCRUBBED_FIELDS,
+    ):
+        self.path = path
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.scrub_fields = frozenset(scrub_fields)
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._interactions: Dict[TKey, Deque[Interaction]] = collections.defaultdict(
+            collections.deque
+        )
+        for interaction in load(path):
+            self._interactions[interaction.key].append(interaction)
+
+    @classmethod
+    def configure(cls, settings: transport.PTransportSettings) -> transport.Transport:
+        raise error.SDKError(
+            "ReplayTransport serves a cassette: ReplayTransport(path)"
+        )
+
+    def request(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        authenticator: transport.TAuthenticator = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> transport.Response:
+        transport_options = transport_options or {}
+        if self.rate_limiter:
+            self.rate_limiter.wait(method, path)
+        if authenticator:
+            authenticator(transport_options)
+        interaction = self._next(method, _url_path(path), query_params, body)
+        timings = transport_options.get("timings")
+        wait = interaction.elapsed if self.latency is None else self.latency
+        self._sleep(wait, timings, "wait")
+        response = interaction.response()
+        # like the transports, error bodies are read even when streaming
+        if transport_options.get("stream") and response.ok:
+            response.stream = transport.ResponseStream(
+                self._chunks(interaction.value, timings),
+                encoding=interaction.encoding,
+            )
+            response.value = b""
+        elif self.bandwidth:
+            self._sleep(len(interaction.value) / self.bandwidth, timings, "download")
+        return response
+
+    def _next(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+        body: Optional[bytes],
+    ) -> Interaction:
+        key = _key(
+            method.name,
+            path,
+            _scrub_query_params(query_params, self.scrub_fields),
+            _scrub_body(path, body, self.scrub_fields),
+        )
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                raise error.SDKError(
+                    f"{self.path} has no recorded response for {method.name} {path}"
+                )
+            interaction = recorded[0]
+            recorded.rotate(-1)
+            self.replayed += 1
+        return interaction
+
+    def _chunks(
+        self, value: bytes, timings: Optional[Dict[str, float]]
+    ) -> Iterator[bytes]:
+        for start in range(0, len(value), transport.STREAM_CHUNK_SIZE):
+            chunk = value[start : start + transport.STREAM_CHUNK_SIZE]
+            if self.bandwidth:
+                self._sleep(len(chunk) / self.bandwidth, timings, "download")
+            yield chunk
+
+    @staticmethod
+    def _sleep(
+        seconds: float, timings: Optional[Dict[str, float]], phase: str
+    ) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+        if timings is not None:
+            transport.add_time(timings, phase, seconds)
+
+
+def record(
+    sdk: Any,
+    path: Union[str, "os.PathLike[str]"],
+    scrub_fields: Iterable[str] = SCRUBBED_FIELDS,
+) -> RecordingTransport:
+    """Record the requests sdk makes, including logins, to a cassette
+
+    Returns the RecordingTransport, close it (or use it as a context
+    manager) to finish the cassette and go back to sdk's transport.
+    """
+    recording = _Recording(sdk, path, scrub_fields)
+    sdk.transport = sdk.auth.transport = recording
+    return recording
+
+
+class _Recording(RecordingTransport):
+    def __init__(
+        self,
+        sdk: Any,
+        path: Union[str, "os.PathLike[str]"],
+        scrub_fields: Iterable[str],
+    ):
+        super().__init__(sdk.transport, path, scrub_fields)
+        self._sdk = sdk
+
+    def close(self) -> None:
+        super().close()
+        if self._sdk.transport is self:
+            self._sdk.transport = self._sdk.auth.transport = self.transport
+
+
+def replay(
+    sdk: Any,
+    path: Union[str, "os.PathLike[str]"],
+    latency: Optional[float] = 0.0,
+    bandwidth: Optional[float] = None,
+    scrub_fields: Iterable[str] = SCRUBBED_FIELDS,
+) -> ReplayTransport:
+    """Serve sdk's requests, including logins, from a cassette"""
+    replaying = ReplayTransport(path, latency, bandwidth, scrub_fields)
+    sdk.transport = sdk.auth.transport = replaying
+    return replaying
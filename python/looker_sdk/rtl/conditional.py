@@ -0,0 +1,164 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Revalidate repeat GETs with ETag / Last-Modified validators
+"""
+import collections
+import threading
+from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple, cast
+
+import attr
+
+from looker_sdk.rtl import transport
+
+TKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def cache_key(
+    identity: str, path: str, query_params: Optional[MutableMapping[str, str]]
+) -> TKey:
+    """identity (see APIMethods._identity) keeps one user's validators and
+    cached models from answering another's requests
+    """
+    return (
+        identity,
+        path,
+        tuple(sorted(query_params.items())) if query_params else (),
+    )
+
+
+@attr.s(auto_attribs=True)
+class Entry:
+    """A cached response and its validators"""
+
+    response: transport.Response
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # deserialized bodies by structure, shared by every 304 served from here
+    results: Dict[Any, Any] = attr.ib(factory=dict)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def result(self, structure: Any, deserialize: Callable[[], Any]) -> Any:
+        """Deserialized body for structure, deserializing only the first time"""
+        try:
+            return self.results[structure]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable structure
+            return deserialize()
+        ret = self.results[structure] = deserialize()
+        return ret
+
+
+class ConditionalCache:
+    """LRU of GET responses that came with an ETag or Last-Modified header
+
+    Repeat GETs of the same path and query by the same user (host, client_id
+    and sudo user) send If-None-Match and
+    If-Modified-Since, and a 304 Not Modified is answered from the cache:
+    the body isn't downloaded again and the model is only deserialized once.
+    Models served from the cache are shared between calls, treat them as
+    read only.
+
+    e.g. sdk.conditional_cache = ConditionalCache()
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "collections.OrderedDict[TKey, Entry]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TKey) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def revalidate(
+        self,
+        identity: str,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]],
+    ) -> "TRevalidated":
+        """(cache, key, entry) for a GET of path and query_params by identity"""
+        key = cache_key(identity, path, query_params)
+        return self, key, self.get(key)
+
+    def options(
+        self,
+        entry: Optional[Entry],
+        transport_options: Optional[transport.TransportOptions],
+    ) -> Optional[transport.TransportOptions]:
+        """transport_options plus the conditional request headers for entry"""
+        if entry is None:
+            return transport_options
+        options = cast(transport.TransportOptions, dict(transport_options or {}))
+        options["headers"] = {**entry.headers(), **options.get("headers", {})}
+        return options
+
+    def update(
+        self, key: TKey, entry: Optional[Entry], response: transport.Response
+    ) -> Optional[Entry]:
+        """The entry answering response, caching or dropping it as needed"""
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self.hits += 1
+            return entry
+        headers = response.headers or {}
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if (
+                response.status_code != 200
+                or response.stream is not None
+                or not (etag or last_modified)
+            ):
+                self._entries.pop(key, None)
+                return None
+            entry = self._entries[key] = Entry(response, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+TRevalidated = Tuple[ConditionalCache, TKey, Optional[Entry]]
@@ -0,0 +1,299 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Transport implementations using the httpx package.
+
+httpx is an optional dependency: ``pip install looker_sdk[async]`` or
+``pip install looker_sdk[http2]`` for HTTP/2 support.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+import httpx
+
+from looker_sdk.rtl import transport
+
+
+def _setting(settings: transport.PTransportSettings, name: str) -> Any:
+    return getattr(settings, name, getattr(transport.PTransportSettings, name))
+
+
+def _client_options(
+    settings: transport.PTransportSettings, http2: bool
+) -> Dict[str, Any]:
+    """httpx client arguments matching RequestsTransport's settings"""
+    pool_maxsize = _setting(settings, "pool_maxsize")
+    return {
+        "verify": settings.verify_ssl,
+        "http2": http2,
+        # requests follows redirects by default, httpx does not
+        "follow_redirects": True,
+        "limits": httpx.Limits(
+            # pool_block caps the connections, requests wait for a free one
+            max_connections=pool_maxsize if _setting(settings, "pool_block") else None,
+            max_keepalive_connections=(
+                pool_maxsize if _setting(settings, "keep_alive") else 0
+            ),
+        ),
+    }
+
+
+def _client_headers(settings: transport.PTransportSettings) -> Dict[str, str]:
+    headers: Dict[str, str] = {transport.LOOKER_API_ID: settings.agent_tag}
+    if settings.headers:
+        headers.update(settings.headers)
+    return headers
+
+
+def _request_options(
+    settings: transport.PTransportSettings,
+    transport_options: Optional[transport.TransportOptions],
+) -> Tuple[Dict[str, str], httpx.Timeout, bool]:
+    """(headers, timeout, stream) for one request"""
+    headers: Dict[str, str] = {}
+    timeout = _setting(settings, "read_timeout") or settings.timeout
+    stream = False
+    if transport_options:
+        if transport_options.get("headers"):
+            headers.update(transport_options["headers"])
+        if transport_options.get("timeout"):
+            timeout = transport_options["timeout"]
+        stream = bool(transport_options.get("stream"))
+    connect_timeout = _setting(settings, "connect_timeout")
+    return headers, httpx.Timeout(timeout, connect=connect_timeout or timeout), stream
+
+
+class _Trace:
+    """httpx trace extension timing connection setup while profiling"""
+
+    _CONNECT = (
+        "connection.connect_tcp",
+        "connection.connect_unix_socket",
+        "connection.start_tls",
+    )
+
+    def __init__(self, timings: Dict[str, float]):
+        self.timings = timings
+        self.started = time.perf_counter()
+        self.connect = 0.0
+        self._connecting: Dict[str, float] = {}
+
+    def record(self, event: str) -> None:
+        name, _, stage = event.rpartition(".")
+        if name not in self._CONNECT:
+            return
+        if stage == "started":
+            self._connecting[name] = time.perf_counter()
+        elif name in self._connecting:
+            self.connect += time.perf_counter() - self._connecting.pop(name)
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self.record(event)
+
+    def headers_received(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        transport.add_time(self.timings, "connect", self.connect)
+        transport.add_time(self.timings, "wait", elapsed - self.connect)
+
+    def read(self, resp: httpx.Response) -> bytes:
+        started = time.perf_counter()
+        value = resp.read()
+        transport.add_time(self.timings, "download", time.perf_counter() - started)
+        return value
+
+
+class _AsyncTrace(_Trace):
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:  # type: ignore
+        self.record(event)
+
+    async def aread(self, resp: httpx.Response) -> bytes:
+        started = time.perf_counter()
+        value = await resp.aread()
+        transport.add_time(self.timings, "download", time.perf_counter() - started)
+        return value
+
+
+# errors raised before any of the request reached the server
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _error_response(exc: BaseException) -> transport.Response:
+    return transport.Response(
+        False,
+        bytes(str(exc), encoding="utf-8"),
+        transport.ResponseMode.STRING,
+        exception=exc,
+        sent=not isinstance(exc, _NOT_SENT),
+    )
+
+
+def _response(resp: httpx.Response, value: bytes) -> transport.Response:
+    ret = transport.Response(
+        not resp.is_error,
+        value,
+        transport.response_mode(resp.headers.get("content-type")),
+        status_code=resp.status_code,
+        headers=resp.headers,
+    )
+    if resp.charset_encoding:
+        ret.encoding = resp.charset_encoding
+    return ret
+
+
+class HttpxTransport(transport.Transport):
+    """Transport using httpx, with HTTP/2 by default.
+
+    A drop in replacement for RequestsTransport: over HTTP/2 concurrent
+    requests from many threads are multiplexed over a few connections
+    instead of each needing its own.
+
+        sdk = looker_sdk.init40(transport_class=HttpxTransport)
+    """
+
+    def __init__(self, settings: transport.PTransportSettings, client: httpx.Client):
+        self.settings = settings
+        client.headers.update(_client_headers(settings))
+        self.client = client
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def configure(
+        cls, settings: transport.PTransportSettings, http2: bool = True
+    ) -> transport.Transport:
+        """HTTP/2 needs the h2 package: pip install looker_sdk[http2]"""
+        return cls(settings, httpx.Client(**_client_options(settings, http2)))
+
+    def request(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        authenticator: transport.TAuthenticator = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> transport.Response:
+
+        headers, timeout, stream = _request_options(self.settings, transport_options)
+        if authenticator:
+            headers = {**authenticator(transport_options or {}), **headers}
+        if self.rate_limiter:
+            self.rate_limiter.wait(method, path)
+        self.logger.info("%s(%s)", method.name, path)
+        timings = (transport_options or {}).get("timings")
+        trace = _Trace(timings) if timings is not None else None
+        try:
+            request = self.client.build_request(
+                method.name,
+                path,
+                params=query_params,
+                content=body,
+                headers=headers,
+                timeout=timeout,
+                extensions={"trace": trace} if trace else None,
+            )
+            resp = self.client.send(request, stream=stream or trace is not None)
+            if trace is not None:
+                trace.headers_received()
+                if not stream:
+                    return _response(resp, trace.read(resp))
+        except (httpx.HTTPError, IOError) as exc:
+            return _error_response(exc)
+        if not stream:
+            return _response(resp, resp.content)
+        if resp.is_error:
+            # error bodies are small so read them even when streaming
+            try:
+                return _response(resp, resp.read())
+            except (httpx.HTTPError, IOError) as exc:
+                return _error_response(exc)
+            finally:
+                resp.close()
+        ret = _response(resp, b"")
+        ret.stream = transport.ResponseStream(
+            resp.iter_bytes(transport.STREAM_CHUNK_SIZE), ret.encoding, resp.close
+        )
+        return ret
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncHttpxTransport(transport.AsyncTransport):
+    """AsyncHttpxTransport implementation of AsyncTransport."""
+
+    def __init__(
+        self, settings: transport.PTransportSettings, client: httpx.AsyncClient
+    ):
+        self.settings = settings
+        client.headers.update(_client_headers(settings))
+        self.client = client
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def configure(
+        cls, settings: transport.PTransportSettings, http2: bool = False
+    ) -> transport.AsyncTransport:
+        return cls(settings, httpx.AsyncClient(**_client_options(settings, http2)))
+
+    async def request(
+        self,
+        method: transport.HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        authenticator: transport.TAsyncAuthenticator = None,
+        transport_options: Optional[transport.TransportOptions] = None,
+    ) -> transport.Response:
+
+        headers, timeout, _ = _request_options(self.settings, transport_options)
+        if authenticator:
+            headers = {**(await authenticator(transport_options or {})), **headers}
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve(method, path)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        self.logger.info("%s(%s)", method.name, path)
+        timings = (transport_options or {}).get("timings")
+        trace = _AsyncTrace(timings) if timings is not None else None
+        try:
+            request = self.client.build_request(
+                method.name,
+                path,
+                params=query_params,
+                content=body,
+                headers=headers,
+                timeout=timeout,
+                extensions={"trace": trace} if trace else None,
+            )
+            resp = await self.client.send(request, stream=trace is not None)
+            if trace is not None:
+                trace.headers_received()
+                return _response(resp, await trace.aread(resp))
+        except (httpx.HTTPError, IOError) as exc:
+            return _error_response(exc)
+        return _response(resp, resp.content)
+
+    async def close(self) -> None:
+        await self.client.aclose()
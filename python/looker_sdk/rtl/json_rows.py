@@ -0,0 +1,166 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Incrementally parse rows from a streamed json or json_bi query result
+"""
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from looker_sdk.rtl import serialize
+
+_WHITESPACE = " \t\n\r"
+# json_bi results are an object whose "rows" member holds the row array
+JSON_BI_ROWS = "rows"
+
+
+class RowReader:
+    """Yield one row at a time from a streamed json or json_bi body
+
+    e.g.
+        with sdk.iter_rows(sdk.run_query, query_id, "json_bi") as rows:
+            for row in rows:
+                ...
+            fields = rows.members["metadata"]["fields"]
+
+    A "json" body is a top level array of rows. For "json_bi" the rows are
+    read from the "rows" member of the top level object; its other members
+    (e.g. "metadata") are parsed whole into `members` as they are reached.
+    Only the row being parsed, buffered up to about twice over, is held in
+    memory.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str = "utf-8",
+        close: Optional[Callable[[], None]] = None,
+    ):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._close = close
+        self.members: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._expect("[{") == "[":
+            yield from self._array()
+        else:
+            yield from self._object()
+
+    def close(self) -> None:
+        """Release the underlying response"""
+        if self._close:
+            self._close()
+
+    def __enter__(self) -> "RowReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append decoded chunks to the buffer, at least one and until it
+        holds `size` unparsed characters. False at end of body.
+        """
+        if self._eof:
+            return False
+        parts = [self._buffer[self._pos :]]
+        length = len(parts[0])
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                parts.append(text)
+                length += len(text)
+                if length >= size:
+                    self._buffer = "".join(parts)
+                    return True
+        parts.append(self._decoder.decode(b"", final=True))
+        self._buffer = "".join(parts)
+        self._eof = True
+        return True
+
+    def _peek(self) -> str:
+        """Next non whitespace character or "" at end of body"""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise serialize.DeserializeError(
+                f"Bad json: expected one of '{chars}' at '{char}'"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as ex:
+                # double what's buffered so a value spanning many chunks is
+                # decoded from the start a logarithmic number of times
+                if self._fill(2 * (len(self._buffer) - self._pos)):
+                    continue
+                raise serialize.DeserializeError(f"Bad json {ex}")
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _object(self) -> Iterator[Any]:
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == JSON_BI_ROWS and self._peek() == "[":
+                self._pos += 1
+                yield from self._array()
+            else:
+                self.members[key] = self._value()
+            if self._expect(",}") == "}":
+                return
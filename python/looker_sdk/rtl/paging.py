@@ -0,0 +1,109 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Iterate over limit/offset paginated SDK methods page by page
+"""
+import concurrent.futures
+import contextvars
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+TPagedMethod = Callable[..., Sequence[T]]
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def paginate(
+    method: TPagedMethod[T],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs: Any,
+) -> Iterator[Sequence[T]]:
+    """Yield successive pages from an SDK method taking limit and offset
+
+    e.g. for page in paginate(sdk.search_users, first_name="Jane", page_size=500)
+
+    Iteration stops at the first page shorter than page_size. With prefetch
+    the next page is requested in the background while the caller processes
+    the current one, so at most two pages are held in memory.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    for reserved in ("limit", "offset"):
+        if reserved in kwargs:
+            raise ValueError(f"'{reserved}' is managed by paginate()")
+
+    def fetch(offset: int) -> Sequence[T]:
+        return method(*args, limit=page_size, offset=offset, **kwargs)
+
+    offset = 0
+    if not prefetch:
+        while True:
+            page = fetch(offset)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="looker_sdk_paging"
+    )
+    # prefetches run in copies of the caller's context, like the fetches
+    # they stand in for
+    pending: Optional["concurrent.futures.Future[Sequence[T]]"] = executor.submit(
+        contextvars.copy_context().run, fetch, offset
+    )
+    try:
+        while pending:
+            page = pending.result()
+            offset += page_size
+            pending = (
+                executor.submit(contextvars.copy_context().run, fetch, offset)
+                if len(page) == page_size
+                else None
+            )
+            if page:
+                yield page
+    finally:
+        # abandoned by the caller: let an in flight prefetch finish unobserved
+        executor.shutdown(wait=False)
+
+
+def iterate(
+    method: TPagedMethod[T],
+    *args: Any,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs: Any,
+) -> Iterator[T]:
+    """Yield each item of an SDK method taking limit and offset
+
+    e.g. for user in iterate(sdk.all_users, fields="id,email")
+
+    See paginate()
+    """
+    for page in paginate(
+        method, *args, page_size=page_size, prefetch=prefetch, **kwargs
+    ):
+        yield from page
@@ -0,0 +1,94 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Where the time of SDK calls goes, phase by phase
+
+e.g.
+    with sdk.profile() as p:
+        sdk.search_dashboards(title="Sales%")
+    print(p.report())
+
+Phases, in seconds:
+    auth: getting an access token, including any /login
+    connect: opening connections (httpx transports only, RequestsTransport
+        counts it as part of wait)
+    wait: sending the request and waiting for the response headers
+    download: reading the response body
+    decode: decoding text bodies
+    parse: parsing json
+    structure: building models from the parsed json
+
+auth, connect, wait and download are spent on the network and the server,
+decode, parse and structure in the client.
+"""
+import collections
+import threading
+from typing import Dict, List, Tuple
+
+PHASES = ("auth", "connect", "wait", "download", "decode", "parse", "structure")
+
+
+class Profile:
+    """Phase timings of SDK calls by SDK method"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[Dict[str, float]]] = collections.defaultdict(
+            list
+        )
+
+    def start(self, method: str) -> Dict[str, float]:
+        """A new sample for a call of method, the call adds its phase times"""
+        timings: Dict[str, float] = {}
+        with self._lock:
+            self._samples[method].append(timings)
+        return timings
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Number of calls and total seconds of each phase by method"""
+        with self._lock:
+            samples = {m: list(s) for m, s in self._samples.items()}
+        summary = {}
+        for method, timings in samples.items():
+            totals = {"calls": float(len(timings))}
+            for phase in PHASES:
+                totals[phase] = sum(t.get(phase, 0.0) for t in timings)
+            summary[method] = totals
+        return summary
+
+    def report(self) -> str:
+        """Table of the mean milliseconds per call of each phase by method"""
+        rows: List[Tuple[str, ...]] = [("method", "calls") + PHASES]
+        for method, totals in sorted(self.summary().items()):
+            calls = totals["calls"]
+            rows.append(
+                (method, str(int(calls)))
+                + tuple(f"{totals[phase] / calls * 1000:.1f}" for phase in PHASES)
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
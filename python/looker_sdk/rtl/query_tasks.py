@@ -0,0 +1,270 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Run many query tasks concurrently, polling them together
+
+QueryTaskManager replaces one create_query_task() plus query_task()
+polling loop per query with one background thread that keeps up to
+max_running query tasks in flight and polls all of them with a single
+query_task_multi_results() call per tick, backing off while none complete.
+
+e.g.
+    with QueryTaskManager(sdk, max_running=20) as manager:
+        futures = [
+            manager.submit(models.WriteCreateQueryTask(query_id=i, result_format="json"))
+            for i in query_ids
+        ]
+        results = [f.result() for f in futures]
+
+submit() returns a concurrent.futures.Future resolving to the task's data
+(parsed json for the json formats, text for csv and the like), or raising
+SDKError if the task can't be created or fails. In asyncio code await
+asyncio.wrap_future(manager.submit(...)).
+"""
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from looker_sdk import error
+from looker_sdk.rtl import model
+
+# multi_results statuses of tasks that finished without results
+FAILED = frozenset(["error", "expired", "missing", "killed"])
+# ids per query_task_multi_results call, keeping the url short
+MAX_IDS_PER_POLL = 100
+
+TPending = Tuple[concurrent.futures.Future, Any, Dict[str, Any]]
+
+
+class QueryTaskManager:
+    """Create query tasks with a concurrency cap and poll them together
+
+    max_running: query tasks in flight at once, further submissions wait
+    poll_interval: seconds between polls after tasks start or complete
+    max_poll_interval: the longest the interval grows to, by backoff times
+        each poll in which no task completes
+    max_poll_failures: consecutive failed polls of a task before its
+        future raises the SDKError
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_running: int = 25,
+        poll_interval: float = 0.25,
+        max_poll_interval: float = 5.0,
+        backoff: float = 1.5,
+        max_poll_failures: int = 3,
+    ):
+        if max_running < 1:
+            raise ValueError("max_running must be at least 1")
+        self.sdk = sdk
+        self.max_running = max_running
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.max_poll_failures = max_poll_failures
+        self.polls = 0
+        self._interval = poll_interval
+        self._cond = threading.Condition()
+        self._pending: Deque[TPending] = collections.deque()
+        # query task id: (future, consecutive failed polls)
+        self._running: Dict[str, Tuple[concurrent.futures.Future, int]] = {}
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, body: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """Queue a query task, returning a Future for its results
+
+        body: WriteCreateQueryTask (or dict) and kwargs the other arguments
+        of create_query_task e.g. limit, apply_formatting, cache
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("QueryTaskManager is closed")
+            self._pending.append((future, body, kwargs))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="looker_sdk_query_tasks", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting query tasks, waiting for the submitted ones"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def __enter__(self) -> "QueryTaskManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def running(self) -> int:
+        """Number of query tasks in flight"""
+        with self._cond:
+            return len(self._running)
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except BaseException as ex:
+            # don't leave anyone waiting on a future nothing will resolve
+            self._abort(ex)
+            raise
+
+    def _abort(self, ex: BaseException) -> None:
+        with self._cond:
+            self._closed = True
+            futures = [future for future, _, _ in self._pending]
+            futures.extend(future for future, _ in self._running.values())
+            self._pending.clear()
+            self._running.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(ex)
+
+    def _loop(self) -> None:
+        next_poll = 0.0
+        while True:
+            if self._start_tasks():
+                self._interval = self.poll_interval
+                next_poll = time.monotonic() + self._interval
+            with self._cond:
+                if not self._running:
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._cond.wait()
+                    continue
+                delay = next_poll - time.monotonic()
+                if delay > 0:
+                    # submit() wakes this early to start its task
+                    self._cond.wait(delay)
+                    continue
+            self._poll()
+            next_poll = time.monotonic() + self._interval
+
+    def _start_tasks(self) -> bool:
+        """Create queued tasks up to max_running, True if any started"""
+        started = False
+        while True:
+            with self._cond:
+                if not self._pending or len(self._running) >= self.max_running:
+                    return started
+                future, body, kwargs = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                task = self.sdk.create_query_task(body=body, **kwargs)
+            except Exception as ex:
+                future.set_exception(ex)
+                continue
+            with self._cond:
+                self._running[task.id] = (future, 0)
+            started = True
+
+    def _poll(self) -> None:
+        with self._cond:
+            ids = list(self._running)
+        completed = False
+        for start in range(0, len(ids), MAX_IDS_PER_POLL):
+            chunk = ids[start : start + MAX_IDS_PER_POLL]
+            self.polls += 1
+            try:
+                results = self.sdk.query_task_multi_results(
+                    query_task_ids=model.DelimSequence(chunk)
+                )
+            except error.SDKError as ex:
+                self._failed_poll(chunk, ex)
+                continue
+            except Exception as ex:
+                self._fail(chunk, ex)
+                continue
+            with self._cond:
+                for task_id in chunk:
+                    self._running[task_id] = (self._running[task_id][0], 0)
+            try:
+                for task_id in chunk:
+                    completed = self._update(task_id, results.get(task_id)) or completed
+            except Exception as ex:
+                # e.g. a malformed response, retrying won't help
+                self._fail(chunk, ex)
+                completed = True
+        if completed:
+            self._interval = self.poll_interval
+        else:
+            self._interval = min(self._interval * self.backoff, self.max_poll_interval)
+
+    def _update(self, task_id: str, result: Optional[Dict[str, Any]]) -> bool:
+        """Resolve the future of a finished task, True if it finished"""
+        status = (result or {}).get("status")
+        if status != "complete" and status not in FAILED:
+            return False
+        with self._cond:
+            future, _ = self._running.pop(task_id)
+        assert result is not None
+        if status == "complete":
+            future.set_result(result.get("data"))
+            return True
+        message = f"Query task {task_id} {status}"
+        messages = _messages(result)
+        if messages:
+            message += f": {messages}"
+        future.set_exception(error.SDKError(message))
+        return True
+
+    def _fail(self, ids: List[str], ex: Exception) -> None:
+        """Fail the futures of the tasks still running among ids"""
+        with self._cond:
+            futures = [self._running.pop(i)[0] for i in ids if i in self._running]
+        for future in futures:
+            future.set_exception(ex)
+
+    def _failed_poll(self, ids: List[str], ex: error.SDKError) -> None:
+        with self._cond:
+            for task_id in ids:
+                future, failures = self._running[task_id]
+                if failures + 1 < self.max_poll_failures:
+                    self._running[task_id] = (future, failures + 1)
+                else:
+                    del self._running[task_id]
+                    future.set_exception(ex)
+
+
+def _messages(result: Dict[str, Any]) -> str:
+    errors = result.get("errors") or []
+    if isinstance(result.get("data"), dict):
+        errors = errors or result["data"].get("errors") or []
+    return "; ".join(
+        str(e.get("message") if isinstance(e, dict) else e) for e in errors
+    )
@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Client side token bucket rate limiting of API requests
+
+Looker rate limits API calls per instance. A RateLimiter spaces out the
+requests of every thread sharing it, and with a FileBackend those of every
+process on the host, instead of letting them burst into 429 responses.
+
+e.g.
+    sdk.transport.rate_limiter = RateLimiter(
+        {"query": RateLimit(2), "read": RateLimit(20, burst=40)},
+        backend=FileBackend(),
+    )
+"""
+import abc
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from typing import IO, Callable, Dict, Mapping, Optional, Tuple
+
+import attr
+
+from looker_sdk.rtl import file_lock
+from looker_sdk.rtl import transport
+
+# run_query, run_inline_query, run_look, run_sql_query, run_lookml_test
+# and the async query and render tasks
+_QUERY_PATH = re.compile(r"/run(/|$)|/query_tasks|/render_tasks")
+
+
+def endpoint_class(method: transport.HttpMethod, path: str) -> str:
+    """Default classification of requests for per class limits:
+
+    "query": anything that runs a query or starts a query/render task
+    "read": other GET (and HEAD) requests
+    "write": other POST, PATCH, PUT and DELETE requests
+    """
+    if _QUERY_PATH.search(urllib.parse.urlsplit(path).path):
+        return "query"
+    if method in (transport.HttpMethod.GET, transport.HttpMethod.HEAD):
+        return "read"
+    return "write"
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RateLimit:
+    """`rate` requests per second on average with bursts of up to `burst`
+    requests (default: one second's worth)
+    """
+
+    rate: float
+    burst: Optional[float] = None
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(self.rate, 1.0)
+
+
+def _reserve(
+    state: Optional[Tuple[float, float]], limit: RateLimit, now: float
+) -> Tuple[Tuple[float, float], float]:
+    """Take a token from the bucket in `state` (tokens, updated).
+
+    Returns the new state and the seconds the caller must wait for its
+    token. Tokens may go negative: later callers queue behind the waiting
+    ones rather than racing them.
+    """
+    tokens, updated = state if state else (limit.capacity, now)
+    tokens = min(limit.capacity, tokens + (now - updated) * limit.rate) - 1
+    wait = -tokens / limit.rate if tokens < 0 else 0.0
+    return (tokens, now), wait
+
+
+class RateLimitBackend(abc.ABC):
+    """Storage for token buckets"""
+
+    @abc.abstractmethod
+    def reserve(self, key: str, limit: RateLimit) -> float:
+        """Atomically take a token from bucket `key`, returning the seconds
+        to wait before using it.
+        """
+
+
+class MemoryBackend(RateLimitBackend):
+    """Buckets shared by all threads of the process using this backend"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(self, key: str, limit: RateLimit) -> float:
+        with self._lock:
+            self._buckets[key], wait = _reserve(
+                self._buckets.get(key), limit, time.monotonic()
+            )
+        return wait
+
+
+class FileBackend(RateLimitBackend):
+    """Buckets shared by every process on the host using the same file
+
+    The buckets are kept as json in `path` (default:
+    ~/.looker/rate_limit.json, pass a path under /dev/shm to keep it in
+    memory) and updated under an exclusive file lock. Like token_store's
+    tokens the file is created readable only by the current user, so
+    another user can't pre-create or tamper with it.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(
+            os.path.expanduser("~"), ".looker", "rate_limit.json"
+        )
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True
+        )
+        self._lock = threading.Lock()
+
+    def _open(self) -> IO[str]:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        return os.fdopen(fd, "r+")
+
+    def reserve(self, key: str, limit: RateLimit) -> float:
+        with self._lock, self._open() as f, file_lock.locked(f):
+            f.seek(0)
+            try:
+                buckets = json.loads(f.read() or "{}")
+            except ValueError:
+                buckets = {}
+            state = buckets.get(key)
+            # wall clock time since monotonic clocks differ between processes
+            new_state, wait = _reserve(
+                tuple(state) if state else None, limit, time.time()
+            )
+            buckets[key] = new_state
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(buckets))
+            f.flush()
+        return wait
+
+
+class RateLimiter:
+    """Token bucket limits per endpoint class and Looker host
+
+    limits: RateLimit by endpoint class. "*" applies to classes without
+        their own limit, requests in a class with no limit are not limited.
+    classify: maps (method, url) to an endpoint class, endpoint_class by
+        default
+    backend: where the buckets live, a MemoryBackend by default
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit],
+        classify: Callable[[transport.HttpMethod, str], str] = endpoint_class,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        self.limits = dict(limits)
+        self.classify = classify
+        self.backend = backend or MemoryBackend()
+
+    def reserve(self, method: transport.HttpMethod, url: str) -> float:
+        """Take a token for the request, returning the seconds to wait"""
+        name = self.classify(method, url)
+        limit = self.limits.get(name, self.limits.get("*"))
+        if limit is None:
+            return 0.0
+        host = urllib.parse.urlsplit(url).netloc
+        return self.backend.reserve(f"{host}/{name}", limit)
+
+    def wait(self, method: transport.HttpMethod, url: str) -> None:
+        """Block until the request may be sent"""
+        delay = self.reserve(method, url)
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,347 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Render many dashboards, looks and queries to files concurrently
+
+RenderPipeline keeps up to max_running render tasks in flight and drives
+all of them from one scheduler thread and a small worker pool instead of
+a polling loop per task: it polls each task's render_task() status with
+backoff, and once the task succeeds streams render_task_results() straight
+to its file, waiting out any 202 Accepted for as long as its Retry-After
+header asks, up to download_timeout.
+
+e.g.
+    with RenderPipeline(sdk, max_running=20) as pipeline:
+        futures = [
+            pipeline.submit_dashboard(d.id, f"exports/{d.id}.pdf")
+            for d in sdk.all_dashboards(fields="id")
+        ]
+    for future in futures:
+        print(future.result())  # the file's path
+
+Files are written to a ".part" file next to the destination and renamed
+when complete, so a failed or interrupted download leaves no truncated
+file behind.
+"""
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+import attr
+
+from looker_sdk import error
+from looker_sdk.rtl import retry
+
+# render_task() statuses
+SUCCESS = "success"
+FAILURE = "failure"
+
+
+TStep = Callable[["_Job"], None]
+
+
+@attr.s(auto_attribs=True)
+class _Job:
+    future: concurrent.futures.Future
+    create: Callable[[], Any]
+    path: str
+    interval: float
+    task_id: str = ""
+    # monotonic time past which a download answered 202 fails
+    download_deadline: Optional[float] = None
+
+
+def _closed_error() -> error.SDKError:
+    return error.SDKError("RenderPipeline was closed before the render finished")
+
+
+class RenderPipeline:
+    """Create render tasks with a concurrency cap and download their results
+
+    max_running: render tasks in flight at once, further submissions wait
+    workers: threads creating, polling and downloading render tasks
+    poll_interval: seconds before a new task's first status poll
+    max_poll_interval: the longest the interval between a task's polls
+        grows to, by backoff times after each poll it isn't finished
+    download_timeout: seconds a successful task's download may keep being
+        answered 202 Accepted before its future fails with an SDKError
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_running: int = 10,
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        backoff: float = 1.5,
+        download_timeout: float = 300.0,
+    ):
+        if max_running < 1:
+            raise ValueError("max_running must be at least 1")
+        self.sdk = sdk
+        self.max_running = max_running
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.download_timeout = download_timeout
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="looker_sdk_render"
+        )
+        self._cond = threading.Condition()
+        self._pending: Deque[_Job] = collections.deque()
+        self._running = 0
+        # (when, sequence, step, job) of the next step of each started job
+        self._scheduled: List[Tuple[float, int, TStep, _Job]] = []
+        self._sequence = itertools.count()
+        self._closed = False
+        # set by close(wait=False), the scheduler exits without finishing
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, create: Callable[[], Any], path: str) -> concurrent.futures.Future:
+        """Queue a render task, returning a Future for the path of its file
+
+        create: makes the render task and returns the RenderTask e.g.
+            functools.partial(sdk.create_look_render_task, "7", "png", 800, 600)
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("RenderPipeline is closed")
+            self._pending.append(_Job(future, create, path, self.poll_interval))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="looker_sdk_render_scheduler", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def submit_dashboard(
+        self,
+        dashboard_id: str,
+        path: str,
+        result_format: str = "pdf",
+        width: int = 1200,
+        height: int = 1600,
+        body: Any = None,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        """Render a dashboard, body is a CreateDashboardRenderTask and kwargs
+        the other arguments of create_dashboard_render_task
+        """
+        return self.submit(
+            lambda: self.sdk.create_dashboard_render_task(
+                dashboard_id,
+                result_format,
+                {} if body is None else body,
+                width,
+                height,
+                **kwargs,
+            ),
+            path,
+        )
+
+    def submit_look(
+        self,
+        look_id: str,
+        path: str,
+        result_format: str = "png",
+        width: int = 1200,
+        height: int = 800,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        """Render a look, kwargs are the other arguments of
+        create_look_render_task
+        """
+        return self.submit(
+            lambda: self.sdk.create_look_render_task(
+                look_id, result_format, width, height, **kwargs
+            ),
+            path,
+        )
+
+    def submit_query(
+        self,
+        query_id: str,
+        path: str,
+        result_format: str = "png",
+        width: int = 1200,
+        height: int = 800,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        """Render a query, kwargs are the other arguments of
+        create_query_render_task
+        """
+        return self.submit(
+            lambda: self.sdk.create_query_render_task(
+                query_id, result_format, width, height, **kwargs
+            ),
+            path,
+        )
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting render tasks, waiting for the submitted ones
+
+        With wait=False return right away instead: render tasks not started
+        yet are cancelled and the started ones fail with an SDKError, those
+        in the middle of a request once it completes.
+        """
+        pending: List[_Job] = []
+        scheduled: List[_Job] = []
+        with self._cond:
+            self._closed = True
+            if not wait:
+                # the scheduler must stop before the pool refuses its steps
+                self._stopped = True
+                pending = list(self._pending)
+                self._pending.clear()
+                scheduled = [job for _, _, _, job in self._scheduled]
+                self._scheduled.clear()
+            self._cond.notify()
+            thread = self._thread
+        for job in pending:
+            job.future.cancel()
+        for job in scheduled:
+            self._finish(job, exception=_closed_error())
+        if wait and thread is not None:
+            thread.join()
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "RenderPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            ready: List[Tuple[TStep, _Job]] = []
+            with self._cond:
+                if self._stopped:
+                    return
+                while self._pending and self._running < self.max_running:
+                    job = self._pending.popleft()
+                    if job.future.set_running_or_notify_cancel():
+                        self._running += 1
+                        ready.append((self._create, job))
+                now = time.monotonic()
+                while self._scheduled and self._scheduled[0][0] <= now:
+                    _, _, step, job = heapq.heappop(self._scheduled)
+                    ready.append((step, job))
+                if not ready:
+                    if self._closed and not self._pending and not self._running:
+                        return
+                    timeout = None
+                    if self._scheduled:
+                        timeout = self._scheduled[0][0] - now
+                    self._cond.wait(timeout)
+                    continue
+                # submitted holding the lock so close() can't shut the pool
+                # down in between
+                for step, job in ready:
+                    self._pool.submit(self._step, step, job)
+
+    def _schedule(self, step: TStep, job: _Job, delay: float) -> None:
+        with self._cond:
+            if self._stopped:
+                raise _closed_error()
+            heapq.heappush(
+                self._scheduled,
+                (time.monotonic() + delay, next(self._sequence), step, job),
+            )
+            self._cond.notify()
+
+    def _step(self, step: TStep, job: _Job) -> None:
+        try:
+            step(job)
+        except Exception as ex:
+            self._finish(job, exception=ex)
+
+    def _finish(
+        self,
+        job: _Job,
+        path: Optional[str] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        with self._cond:
+            self._running -= 1
+            self._cond.notify()
+        if exception is None:
+            job.future.set_result(path)
+        else:
+            job.future.set_exception(exception)
+
+    def _create(self, job: _Job) -> None:
+        task = job.create()
+        job.task_id = task.id
+        self._schedule(self._poll, job, job.interval)
+
+    def _poll(self, job: _Job) -> None:
+        task = self.sdk.render_task(job.task_id, fields="id,status,status_detail")
+        if task.status == SUCCESS:
+            self._download(job)
+        elif task.status == FAILURE:
+            message = f"Render task {job.task_id} failed"
+            if task.status_detail:
+                message += f": {task.status_detail}"
+            raise error.SDKError(message)
+        else:
+            job.interval = min(job.interval * self.backoff, self.max_poll_interval)
+            self._schedule(self._poll, job, job.interval)
+
+    def _download(self, job: _Job) -> None:
+        body = self.sdk.stream(self.sdk.render_task_results, job.task_id)
+        if body.status_code == 202:
+            # still rendering, come back when the server says to
+            body.close()
+            now = time.monotonic()
+            if job.download_deadline is None:
+                job.download_deadline = now + self.download_timeout
+            delay = retry.parse_retry_after((body.headers or {}).get("Retry-After"))
+            if delay is None:
+                delay = job.interval
+            if now + delay > job.download_deadline:
+                raise error.SDKError(
+                    f"Render task {job.task_id} results not ready after "
+                    f"{self.download_timeout:g} seconds"
+                )
+            self._schedule(self._download, job, delay)
+            return
+        directory = os.path.dirname(job.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part = job.path + ".part"
+        try:
+            body.write_to(part)
+            os.replace(part, job.path)
+        except BaseException:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+        self._finish(job, path=job.path)
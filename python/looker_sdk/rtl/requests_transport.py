@@ -24,13 +24,37 @@
 """
 
 import logging
-from typing import cast, Callable, Dict, MutableMapping, Optional
+import threading
+import time
+from typing import cast, Any, Callable, Dict, MutableMapping, Optional, Tuple, Union
 
 import requests
+import urllib3
 
 from looker_sdk.rtl import transport
 
 
+def _setting(settings: transport.PTransportSettings, name: str) -> Any:
+    # settings objects written before the connection settings existed
+    # fall back to the PTransportSettings defaults
+    return getattr(settings, name, getattr(transport.PTransportSettings, name))
+
+
+def _sent(exc: IOError) -> bool:
+    """Whether the request may have reached the server before `exc`.
+
+    requests wraps urllib3's failures to connect (refused, timed out, name
+    resolution) in a ConnectionError, anything else may have happened after
+    the request was sent.
+    """
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return False
+    reason = exc.args[0] if exc.args else None
+    # urllib3 reports the underlying error as MaxRetryError.reason
+    reason = getattr(reason, "reason", reason)
+    return not isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+
 class RequestsTransport(transport.Transport):
     """RequestsTransport implementation of Transport."""
 
@@ -41,14 +65,60 @@ class RequestsTransport(transport.Transport):
         headers: Dict[str, str] = {transport.LOOKER_API_ID: settings.agent_tag}
         if settings.headers:
             headers.update(settings.headers)
+        if not _setting(settings, "keep_alive"):
+            headers["Connection"] = "close"
         session.headers.update(headers)
         session.verify = settings.verify_ssl
-        self.session = session
+        self._session = session
+        self._local: Optional[threading.local] = None
+        if _setting(settings, "session_per_thread"):
+            self._local = threading.local()
+            self._local.session = session
         self.logger = logging.getLogger(__name__)
 
     @classmethod
     def configure(cls, settings: transport.PTransportSettings) -> transport.Transport:
-        return cls(settings, requests.Session())
+        """Create a session whose connection pool is sized by `settings`.
+
+        requests.Session is not documented as thread safe. With
+        session_per_thread each thread gets its own session but all of them
+        mount the same adapters, so connections are pooled across threads.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_setting(settings, "pool_connections"),
+            pool_maxsize=_setting(settings, "pool_maxsize"),
+            pool_block=_setting(settings, "pool_block"),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return cls(settings, session)
+
+    @property
+    def session(self) -> requests.Session:
+        """The requests.Session for the calling thread"""
+        if self._local is None:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._session.headers)
+            session.verify = self._session.verify
+            for prefix, adapter in self._session.adapters.items():
+                session.mount(prefix, adapter)
+            self._local.session = session
+        return session
+
+    def _timeout(
+        self, timeout: Optional[float] = None
+    ) -> Union[float, Tuple[Optional[float], float]]:
+        read_timeout = (
+            timeout or _setting(self.settings, "read_timeout") or self.settings.timeout
+        )
+        connect_timeout = _setting(self.settings, "connect_timeout")
+        if connect_timeout is None:
+            return read_timeout
+        return (connect_timeout, read_timeout)
 
     def request(
         self,
@@ -61,15 +131,27 @@ class RequestsTransport(transport.Transport):
     ) -> transport.Response:
 
         headers = {}
-        timeout = self.settings.timeout
+        timeout = self._timeout()
+        stream = False
+        timings = None
         if authenticator:
             headers.update(authenticator(transport_options or {}))
         if transport_options:
             if transport_options.get("headers"):
                 headers.update(transport_options["headers"])
             if transport_options.get("timeout"):
-                timeout = transport_options["timeout"]
+                timeout = self._timeout(transport_options["timeout"])
+            stream = bool(transport_options.get("stream"))
+            timings = transport_options.get("timings")
+        if self.rate_limiter:
+            self.rate_limiter.wait(method, path)
         self.logger.info("%s(%s)", method.name, path)
+        # when profiling the body is read separately to time its download,
+        # the connection is included in the wait for the response headers
+        kwargs: Dict[str, Any] = (
+            {"stream": True} if stream or timings is not None else {}
+        )
+        started = time.perf_counter()
         try:
             resp = self.session.request(
                 method.name,
@@ -79,24 +161,45 @@ class RequestsTransport(transport.Transport):
                 data=body,
                 headers=headers,
                 timeout=timeout,
+                **kwargs,
             )
         except IOError as exc:
             ret = transport.Response(
                 False,
                 bytes(str(exc), encoding="utf-8"),
                 transport.ResponseMode.STRING,
+                exception=exc,
+                sent=_sent(exc),
             )
         else:
+            if timings is not None:
+                transport.add_time(timings, "wait", time.perf_counter() - started)
             ret = transport.Response(
                 resp.ok,
-                resp.content,
+                b"",
                 transport.response_mode(resp.headers.get("content-type")),
+                status_code=resp.status_code,
+                headers=resp.headers,
             )
             encoding = cast(
                 Optional[str], requests.utils.get_encoding_from_headers(resp.headers)
             )
             if encoding:
                 ret.encoding = encoding
+            if stream and resp.ok:
+                ret.stream = transport.ResponseStream(
+                    resp.iter_content(transport.STREAM_CHUNK_SIZE),
+                    ret.encoding,
+                    resp.close,
+                )
+            else:
+                # error bodies are small so read them even when streaming
+                started = time.perf_counter()
+                ret.value = resp.content
+                if timings is not None:
+                    transport.add_time(
+                        timings, "download", time.perf_counter() - started
+                    )
 
         return ret
 
@@ -0,0 +1,460 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Client side cache of GET responses
+
+Repeat GETs of the same path, query and credentials are answered from the
+cache until their TTL expires, without a request. POST, PATCH, PUT and
+DELETE requests invalidate the cached GETs of the resource type they
+change, e.g. a write to /dashboards/42 drops /dashboards/search results.
+GETs of other resource types that embed it, e.g. /folders/1/dashboards,
+are not invalidated and may be stale until they expire.
+
+e.g.
+    sdk.response_cache = ResponseCache(
+        SQLiteBackend("looker_cache.db"), ttl=300, ttls={"/users/*": 60}
+    )
+"""
+import abc
+import collections
+import fnmatch
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from looker_sdk.rtl import rate_limit
+from looker_sdk.rtl import transport
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# per user, next to token_store's ~/.looker/tokens.json
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".looker", "cache")
+
+_TEntry = Tuple[str, transport.Response, float]
+
+
+def _normalize(path: str) -> str:
+    return "/" + urllib.parse.urlsplit(path).path.lstrip("/")
+
+
+def _resource(path: str) -> str:
+    """The top level collection of path, e.g. /dashboards for
+    /dashboards/42/dashboard_elements
+    """
+    return "/" + path.lstrip("/").split("/", 1)[0]
+
+
+def invalidates(path: str, cached_path: str) -> bool:
+    """Whether writing `path` makes a cached GET of `cached_path` stale:
+    anything under the same top level collection, which covers the resource,
+    its sub-resources and searches or listings of it.
+    """
+    resource = _resource(path)
+    return cached_path == resource or cached_path.startswith(resource + "/")
+
+
+def _copy(response: transport.Response) -> transport.Response:
+    return transport.Response(
+        ok=True,
+        value=response.value,
+        response_mode=response.response_mode,
+        encoding=response.encoding,
+        status_code=200,
+    )
+
+
+class ResponseCacheBackend(abc.ABC):
+    """Storage for cached responses"""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[transport.Response]:
+        """The response stored under key unless it has expired"""
+
+    @abc.abstractmethod
+    def set(
+        self, key: str, path: str, response: transport.Response, expires: float
+    ) -> None:
+        """Store response for a GET of path until `expires` (time.time())"""
+
+    @abc.abstractmethod
+    def invalidate(self, path: str) -> None:
+        """Drop the responses made stale by a write to path, see invalidates"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every response"""
+
+
+class MemoryBackend(ResponseCacheBackend):
+    """LRU of responses in this process, up to max_entries and max_bytes"""
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        # key: (path, response, expires)
+        self._entries: "collections.OrderedDict[str, _TEntry]" = (
+            collections.OrderedDict()
+        )
+
+    def get(self, key: str) -> Optional[transport.Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(
+        self, key: str, path: str, response: transport.Response, expires: float
+    ) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (path, response, expires)
+            self.size += len(response.value)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self.size > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if invalidates(path, e[0])]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1].value)
+
+
+def _private_directory(directory: str) -> None:
+    """Create directory, if need be, readable only by the current user"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+
+class SQLiteBackend(ResponseCacheBackend):
+    """Responses in a SQLite database, shared by every process using it
+
+    path defaults to ~/.looker/cache/responses.sqlite. The database is
+    created readable only by the current user since responses can hold
+    user data. The least recently used responses are evicted beyond
+    max_bytes.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.path = path or os.path.join(CACHE_DIRECTORY, "responses.sqlite")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        _private_directory(os.path.dirname(os.path.abspath(self.path)))
+        # SQLite gives its -wal and -shm files the database's permissions
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
+        self._db = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY,"
+                " path TEXT, value BLOB, mode TEXT, encoding TEXT,"
+                " expires REAL, used REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_path ON responses (path)"
+            )
+
+    def get(self, key: str) -> Optional[transport.Response]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, mode, encoding, expires FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[3] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+        return transport.Response(
+            ok=True,
+            value=row[0],
+            response_mode=transport.ResponseMode[row[1]],
+            encoding=row[2],
+            status_code=200,
+        )
+
+    def set(
+        self, key: str, path: str, response: transport.Response, expires: float
+    ) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    response.value,
+                    response.response_mode.name,
+                    response.encoding,
+                    expires,
+                    time.time(),
+                ),
+            )
+            (size,) = self._db.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses"
+            ).fetchone()
+            if size <= self.max_bytes:
+                return
+            rows = self._db.execute(
+                "SELECT key, LENGTH(value) FROM responses ORDER BY used"
+            ).fetchall()
+            evicted = []
+            for evict, length in rows:
+                if size <= self.max_bytes:
+                    break
+                evicted.append((evict,))
+                size -= length
+            self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def invalidate(self, path: str) -> None:
+        resource = _resource(path)
+        prefix = resource.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (resource, prefix + "/%"),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class FileBackend(ResponseCacheBackend):
+    """One file per response in `directory`, shared by every process using it
+
+    directory defaults to ~/.looker/cache/responses and is created, like its
+    files, readable only by the current user since responses can hold user
+    data. Each file holds a json header line followed by the body. The least
+    recently used files are evicted beyond max_bytes. Invalidation reads the
+    header of every file so prefer SQLiteBackend for large caches.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = directory or os.path.join(CACHE_DIRECTORY, "responses")
+        self.max_bytes = max_bytes
+        _private_directory(self.directory)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest()
+        )
+
+    @staticmethod
+    def _header(name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(name, "rb") as f:
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def get(self, key: str) -> Optional[transport.Response]:
+        name = self._file(key)
+        try:
+            with open(name, "rb") as f:
+                header = json.loads(f.readline())
+                value = f.read()
+        except (OSError, ValueError):
+            return None
+        if header["key"] != key:
+            return None
+        if header["expires"] <= time.time():
+            self._remove(name)
+            return None
+        try:
+            os.utime(name)
+        except OSError:
+            pass
+        return transport.Response(
+            ok=True,
+            value=value,
+            response_mode=transport.ResponseMode[header["mode"]],
+            encoding=header["encoding"],
+            status_code=200,
+        )
+
+    def set(
+        self, key: str, path: str, response: transport.Response, expires: float
+    ) -> None:
+        header = {
+            "key": key,
+            "path": path,
+            "mode": response.response_mode.name,
+            "encoding": response.encoding,
+            "expires": expires,
+        }
+        name = self._file(key)
+        # created 0600
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(response.value)
+        os.replace(tmp, name)
+        self._evict()
+
+    def _entries(self) -> Iterator[os.DirEntry]:
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                yield entry
+
+    def _evict(self) -> None:
+        files = []
+        size = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            size += stat.st_size
+        for _, length, name in sorted(files):
+            if size <= self.max_bytes:
+                break
+            self._remove(name)
+            size -= length
+
+    def invalidate(self, path: str) -> None:
+        for entry in self._entries():
+            header = self._header(entry.path)
+            if header is not None and invalidates(path, header["path"]):
+                self._remove(entry.path)
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(name: str) -> None:
+        try:
+            os.remove(name)
+        except OSError:
+            pass
+
+
+class ResponseCache:
+    """Which GET responses to cache, for how long, and where
+
+    backend: a MemoryBackend by default
+    ttl: seconds to keep responses of "read" endpoints (see
+        rate_limit.endpoint_class), query results and tasks aren't cached
+        unless ttls says so
+    ttls: seconds by path pattern, e.g. {"/dashboards/*": 300,
+        "/users/*": 60, "/session": 0}. The first matching pattern wins and
+        0 disables caching.
+
+    Cached responses are keyed by Looker host, client_id and sudo user so
+    OAuth apps should not share a persistent backend between users.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ResponseCacheBackend] = None,
+        ttl: float = 60,
+        ttls: Optional[Mapping[str, float]] = None,
+    ):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        # counters are updated from every thread using the SDK
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        path = _normalize(path)
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        if rate_limit.endpoint_class(transport.HttpMethod.GET, path) == "read":
+            return self.ttl
+        return 0
+
+    @staticmethod
+    def key(
+        scope: str, path: str, query_params: Optional[Mapping[str, str]]
+    ) -> str:
+        query = ""
+        if query_params:
+            query = urllib.parse.urlencode(sorted(query_params.items()))
+        return f"{scope} {_normalize(path)}?{query}"
+
+    def get(self, key: str) -> Optional[transport.Response]:
+        response = self.backend.get(key)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(self, key: str, path: str, response: transport.Response) -> None:
+        if not response.ok or response.stream is not None:
+            return
+        if response.status_code not in (None, 200):
+            return
+        ttl = self.ttl_for(path)
+        if ttl > 0:
+            self.backend.set(key, _normalize(path), _copy(response), time.time() + ttl)
+
+    def invalidate(self, path: str) -> None:
+        self.backend.invalidate(_normalize(path))
+
+    def clear(self) -> None:
+        self.backend.clear()
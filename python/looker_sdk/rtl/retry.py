@@ -0,0 +1,221 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Retry throttled and transiently failed requests
+"""
+import collections
+import datetime
+import email.utils
+import logging
+import random
+import threading
+from typing import Callable, Counter, Dict, FrozenSet, Optional
+
+import attr
+
+from looker_sdk.rtl import transport
+
+IDEMPOTENT_METHODS = frozenset(
+    [
+        transport.HttpMethod.GET,
+        transport.HttpMethod.HEAD,
+        transport.HttpMethod.PUT,
+        transport.HttpMethod.DELETE,
+        transport.HttpMethod.TRACE,
+    ]
+)
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+
+logger = logging.getLogger(__name__)
+
+
+def retry_after(response: transport.Response) -> Optional[float]:
+    """Seconds to wait according to the response's Retry-After header."""
+    return parse_retry_after((response.headers or {}).get("Retry-After"))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait for a Retry-After header value.
+
+    The header is either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a request
+
+    max_retries: retries after the first attempt, 0 disables retrying
+    backoff: base delay in seconds, doubled on every retry
+    max_backoff: upper bound of the exponential delay
+    jitter: pick the delay uniformly between 0 and the exponential delay
+        ("full jitter") so throttled clients don't retry in lockstep
+    max_retry_after: give up instead of waiting when the server asks for a
+        longer Retry-After than this many seconds
+    status_codes: response statuses that are retried
+    methods: verbs that are retried, idempotent ones by default
+    retry_io_errors: retry when the request failed before it was sent,
+        e.g. the connection was refused or timed out
+    retry_read_errors: retry when the connection failed after the request
+        was sent, e.g. a read timeout. Off by default: the server may have
+        run the request already and re-running an expensive GET such as
+        run_query or run_look doubles the load it was failing under
+    on_retry: called with (method, path, attempt, delay, response) before
+        each retry, e.g. to feed metrics
+    """
+
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    max_retry_after: float = 120.0
+    status_codes: FrozenSet[int] = RETRY_STATUS_CODES
+    methods: FrozenSet[transport.HttpMethod] = IDEMPOTENT_METHODS
+    retry_io_errors: bool = True
+    retry_read_errors: bool = False
+    on_retry: Optional[
+        Callable[[transport.HttpMethod, str, int, float, transport.Response], None]
+    ] = None
+
+    def retryable(
+        self, method: transport.HttpMethod, response: transport.Response
+    ) -> bool:
+        if response.ok or method not in self.methods:
+            return False
+        if response.status_code is None:
+            if response.exception is None:
+                return False
+            if response.sent:
+                return self.retry_read_errors
+            return self.retry_io_errors
+        return response.status_code in self.status_codes
+
+    def delay(
+        self,
+        method: transport.HttpMethod,
+        response: transport.Response,
+        attempt: int,
+    ) -> Optional[float]:
+        """Seconds to wait before retry number `attempt` (starting at 1) or
+        None if the request should not be retried.
+        """
+        if attempt > self.max_retries or not self.retryable(method, response):
+            return None
+        wait = retry_after(response)
+        if wait is not None:
+            return wait if wait <= self.max_retry_after else None
+        wait = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, wait) if self.jitter else wait
+
+
+class RetryStats:
+    """Thread safe counters of the retries an SDK made
+
+    requests: requests sent, including retries
+    retries: requests that were retries
+    reasons: retries by status code, or "io_error"
+    gave_up: requests still failing with a retryable error after the
+        last retry
+    waited: total seconds slept before retrying
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.reasons: Counter[str] = collections.Counter()
+        self.gave_up = 0
+        self.waited = 0.0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, response: transport.Response, delay: float) -> None:
+        reason = (
+            str(response.status_code) if response.status_code is not None else "io_error"
+        )
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+            self.waited += delay
+
+    def record_gave_up(self) -> None:
+        with self._lock:
+            self.gave_up += 1
+
+    def as_dict(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "reasons": dict(self.reasons),
+                "gave_up": self.gave_up,
+                "waited": self.waited,
+            }
+
+
+def next_delay(
+    policy: Optional[RetryPolicy],
+    stats: RetryStats,
+    method: transport.HttpMethod,
+    path: str,
+    response: transport.Response,
+    attempt: int,
+) -> Optional[float]:
+    """Record `response` (to attempt number `attempt`, starting at 1) in
+    stats and return the seconds to wait before retrying it, or None.
+    """
+    stats.record_request()
+    if policy is None or response.ok:
+        return None
+    delay = policy.delay(method, response, attempt)
+    if delay is None:
+        if policy.retryable(method, response):
+            stats.record_gave_up()
+        return None
+    stats.record_retry(response, delay)
+    logger.info(
+        "retry %d of %s(%s) in %.2fs after %s",
+        attempt,
+        method.name,
+        path,
+        delay,
+        response.status_code or "no response",
+    )
+    if policy.on_retry:
+        policy.on_retry(method, path, attempt, delay, response)
+    return delay
@@ -28,16 +28,24 @@ import functools
 import json
 import keyword
 import sys
+import time
 from typing import (
+    Any,
     Callable,
+    Dict,
     MutableMapping,
+    Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     Union,
 )
 
+import attr
 import cattr
 from cattrs.cols import is_sequence, list_structure_factory
+from cattrs.errors import BaseValidationError
 
 from looker_sdk.rtl import model, hooks
 
@@ -46,6 +54,97 @@ class DeserializeError(Exception):
     """Improperly formatted data to deserialize."""
 
 
+def _default(o: Any) -> Any:
+    return o.__dict__
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class JsonCodec:
+    """The json parser and encoder used for API payloads.
+
+    loads accepts str or utf-8 encoded bytes and raises ValueError (which
+    json.JSONDecodeError subclasses) for malformed input. dumps returns
+    utf-8 encoded bytes.
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec(
+        name="json",
+        loads=json.loads,
+        dumps=lambda data: json.dumps(data, default=_default).encode("utf-8"),
+    )
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # type: ignore
+
+    return JsonCodec(
+        name="orjson",
+        loads=orjson.loads,
+        dumps=functools.partial(
+            orjson.dumps, default=_default, option=orjson.OPT_NON_STR_KEYS
+        ),
+    )
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson  # type: ignore
+
+    return JsonCodec(
+        name="ujson",
+        loads=ujson.loads,
+        dumps=lambda data: ujson.dumps(
+            data, default=_default, escape_forward_slashes=False
+        ).encode("utf-8"),
+    )
+
+
+_CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def set_json_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """Choose the json codec for serialize and deserialize.
+
+    codec is "orjson", "ujson", "json" (the standard library) or a custom
+    JsonCodec. The default picks the first of orjson, ujson and json that
+    is installed. Raises ImportError if a named codec is not installed.
+    """
+    global _codec
+    if isinstance(codec, JsonCodec):
+        _codec = codec
+    elif codec is not None:
+        if codec not in _CODECS:
+            raise ValueError(
+                f"Unknown json codec {codec!r}, expected one of {list(_CODECS)}"
+            )
+        _codec = _CODECS[codec]()
+    else:
+        for make_codec in _CODECS.values():
+            try:
+                _codec = make_codec()
+                break
+            except ImportError:
+                continue
+    return _codec
+
+
+def json_codec() -> JsonCodec:
+    """The json codec currently used by serialize and deserialize"""
+    return _codec
+
+
+_codec: JsonCodec = set_json_codec()
+
+
 TModelOrSequence = Union[
     MutableMapping[str, str],
     Sequence[int],
@@ -55,32 +154,63 @@ TModelOrSequence = Union[
 ]
 TDeserializeReturn = TModelOrSequence
 TStructure = Union[Type[Sequence[int]], Type[Sequence[str]], Type[TDeserializeReturn]]
-TDeserialize = Callable[[str, TStructure], TDeserializeReturn]
+TDeserialize = Callable[[Union[str, bytes], TStructure], TDeserializeReturn]
 TSerialize = Callable[[TModelOrSequence], bytes]
 
 
 def deserialize(
-    *, data: str, structure: TStructure, converter: cattr.Converter
+    *,
+    data: Union[str, bytes],
+    structure: TStructure,
+    converter: cattr.Converter,
+    timings: Optional[Dict[str, float]] = None,
 ) -> TDeserializeReturn:
-    """Translate API data into models."""
+    """Translate API data (json text or utf-8 encoded bytes) into models.
+
+    The seconds spent parsing and structuring are added to timings' "parse"
+    and "structure" when given.
+    """
+    started = time.perf_counter() if timings is not None else 0.0
     try:
-        data = json.loads(data)
-    except json.JSONDecodeError as ex:
+        data = _codec.loads(data)
+    except ValueError as ex:
         raise DeserializeError(f"Bad json {ex}")
+    if timings is not None:
+        parsed = time.perf_counter()
+        timings["parse"] = timings.get("parse", 0.0) + parsed - started
+    if converter not in _sequence_factory_registered:
+        register_sequence_factory(converter)
     try:
-        converter.register_structure_hook_factory(is_sequence, list_structure_factory)
         response: TDeserializeReturn = converter.structure(  # type: ignore
             data, structure
         )
-    except (TypeError, AttributeError) as ex:
+    except (TypeError, AttributeError, KeyError, BaseValidationError) as ex:
         raise DeserializeError(f"Bad data {ex}")
+    if timings is not None:
+        timings["structure"] = (
+            timings.get("structure", 0.0) + time.perf_counter() - parsed
+        )
     return response
 
 
+# converters that already structure Sequence[...] annotations as lists
+_sequence_factory_registered: Set[cattr.Converter] = set()
+
+
+def register_sequence_factory(converter: cattr.Converter) -> None:
+    """Structure Sequence[...] annotations as lists rather than tuples.
+
+    Registering a hook factory clears the converter's dispatch cache so
+    this must happen once per converter, not once per response.
+    """
+    converter.register_structure_hook_factory(is_sequence, list_structure_factory)
+    _sequence_factory_registered.add(converter)
+
+
 def serialize(*, api_model: TModelOrSequence, converter: cattr.Converter) -> bytes:
     """Translate api_model into formdata encoded json bytes"""
     data = converter.unstructure(api_model)  # type: ignore
-    return json.dumps(data,default=lambda o: o.__dict__).encode("utf-8")  # type: ignore
+    return _codec.dumps(data)
 
 
 def forward_ref_structure_hook(context, converter, data, forward_ref):
@@ -104,16 +234,119 @@ def forward_ref_structure_hook(context, converter, data, forward_ref):
     return instance
 
 
+def forward_ref_structure_hook_factory(context, converter, forward_ref):
+    """Build the structure hook for a ForwardRef model or enum annotation.
+
+    Unlike forward_ref_structure_hook the forward ref is resolved once,
+    when cattrs first asks for a hook for it, instead of being eval'd for
+    every value. The hook for the resolved type is looked up on first
+    use so that self referencing models do not recurse while their
+    structure functions are being generated.
+    """
+    actual_type = eval(forward_ref.__forward_arg__, context)
+    if not (
+        isinstance(actual_type, type)
+        and issubclass(actual_type, (enum.Enum, model.Model))
+    ):
+        raise DeserializeError(f"Unknown type to deserialize: {actual_type}")
+    hook: Optional[Callable[[Any, Any], Any]] = None
+
+    def forward_ref_hook(data, _):
+        nonlocal hook
+        if hook is None:
+            hook = converter.get_structure_hook(actual_type)
+        return hook(data, actual_type)
+
+    return forward_ref_hook
+
+
+def is_optional(t) -> bool:
+    """Optional[X] annotation predicate for optional_structure_hook_factory"""
+    args = getattr(t, "__args__", ())
+    return (
+        getattr(t, "__origin__", None) is Union
+        and len(args) == 2
+        and type(None) in args
+    )
+
+
+def optional_structure_hook_factory(converter, optional):
+    """Build the structure hook for an Optional[X] annotation.
+
+    The hook for X is bound here instead of being dispatched per value.
+    """
+    (inner,) = [arg for arg in optional.__args__ if arg is not type(None)]
+    inner_hook = converter.get_structure_hook(inner)
+
+    def optional_hook(data, _):
+        if data is None:
+            return None
+        return inner_hook(data, inner)
+
+    return optional_hook
+
+
+def is_model(t) -> bool:
+    """model.Model subclass predicate for model_structure_hook_factory"""
+    return isinstance(t, type) and issubclass(t, model.Model)
+
+
+def model_structure_hook_factory(converter, model_type):
+    """Build a specialized structure function for model_type.
+
+    This is structure_attrs_fromdict with the per-attribute work done once:
+    the json key for each property (reserved python keywords like "from"
+    map to "from_") and its structure hook are looked up on first use
+    rather than for every value.
+    """
+    fields: Optional[Sequence[Tuple[str, str, Callable[[Any, Any], Any], Any]]] = None
+
+    def model_hook(data, _):
+        nonlocal fields
+        if fields is None:
+            fields = [
+                (
+                    a.name[:-1] if keyword.iskeyword(a.name[:-1]) else a.name,
+                    a.name,
+                    converter.get_structure_hook(a.type),
+                    a.type,
+                )
+                for a in attr.fields(model_type)
+            ]
+        kwargs = {}
+        for key, name, hook, type_ in fields:
+            if key in data:
+                kwargs[name] = hook(data[key], type_)
+        return model_type(**kwargs)
+
+    return model_hook
+
+
+_model_structure_fns: Dict[
+    Tuple[cattr.Converter, type], Callable[[Any, Any], Any]
+] = {}
+
+
 def translate_keys_structure_hook(converter, data, model_type):
     """Applied only to models.Model"""
-    new_data = hooks.tr_data_keys(data)
-    ret = converter.structure_attrs_fromdict(new_data, model_type)
-    return ret
+    key = (converter, model_type)
+    structure_fn = _model_structure_fns.get(key)
+    if structure_fn is None:
+        structure_fn = model_structure_hook_factory(converter, model_type)
+        _model_structure_fns[key] = structure_fn
+    return structure_fn(data, model_type)
 
 converter40 = cattr.Converter()
 deserialize40 = functools.partial(deserialize, converter=converter40)
 serialize40 = functools.partial(serialize, converter=converter40)
 
+register_sequence_factory(converter40)
+converter40.register_structure_hook_factory(
+    is_optional, functools.partial(optional_structure_hook_factory, converter40)
+)
+converter40.register_structure_hook_factory(
+    is_model, functools.partial(model_structure_hook_factory, converter40)
+)
 converter40.register_structure_hook(datetime.datetime, hooks.datetime_structure_hook)
 unstructure_hook40 = functools.partial(hooks.unstructure_hook, converter40)  # type: ignore
 converter40.register_unstructure_hook(model.Model, unstructure_hook40)  # type: ignore
@@ -0,0 +1,114 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Coalesce identical concurrent requests into one
+
+e.g. sdk.single_flight = SingleFlight()
+"""
+import asyncio
+import functools
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time, sharing its result with every
+    caller of the same key that arrives while it is in flight.
+
+    calls: calls made
+    shared: callers served another caller's result
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """fn() unless a call for key is in flight, then that call's result"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Same as do() for coroutines of the running event loop
+
+        The call runs in its own task so a caller being cancelled, e.g. by
+        asyncio.wait_for(), neither cancels it nor fails the other callers.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        task = self._futures.get(loop_key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._futures[loop_key] = asyncio.ensure_future(fn())
+            self.calls += 1
+            task.add_done_callback(functools.partial(self._done, loop_key))
+        return await asyncio.shield(task)
+
+    def _done(self, loop_key: Tuple[int, Hashable], task: "asyncio.Future[Any]") -> None:
+        if self._futures.get(loop_key) is task:
+            del self._futures[loop_key]
+        if not task.cancelled():
+            # retrieved, in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,171 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Optional OpenTelemetry tracing and metrics
+
+Requires the opentelemetry-api package: pip install looker_sdk[otel]
+
+Every API call gets a client span named after its verb and path template
+(e.g. "GET /dashboards/{dashboard_id}") with the SDK method, status,
+request/response sizes and retries. /login and sudo logins get child
+spans, a W3C traceparent header propagates the trace to Looker, and call
+latency is recorded in the looker.api.duration histogram. Nothing is
+imported or measured unless telemetry is enabled.
+
+e.g.
+    telemetry.instrument(sdk)
+"""
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, cast
+
+from looker_sdk.rtl import transport
+
+if TYPE_CHECKING:
+    from looker_sdk.rtl import api_methods
+
+TRACER_NAME = "looker_sdk"
+
+
+class Call:
+    """Span, metrics and propagation of one API call"""
+
+    def __init__(
+        self,
+        telemetry: "Telemetry",
+        method: transport.HttpMethod,
+        route: str,
+        body: Optional[bytes],
+        transport_options: Optional[transport.TransportOptions],
+        operation: str,
+    ):
+        from opentelemetry import context, propagate, trace
+
+        self.telemetry = telemetry
+        self.started = time.perf_counter()
+        self.sdk_method = operation
+        self.route = "/" + route.lstrip("/")
+        self.attributes: Dict[str, Any] = {
+            "http.request.method": method.name,
+            "http.route": self.route,
+            "looker.method": self.sdk_method,
+        }
+        self.span = telemetry.tracer.start_span(
+            f"{method.name} {self.route}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                **self.attributes,
+                "http.request.body.size": len(body) if body else 0,
+            },
+        )
+        self.token = context.attach(trace.set_span_in_context(self.span))
+        headers: Dict[str, str] = {}
+        propagate.inject(headers)
+        options = cast(transport.TransportOptions, dict(transport_options or {}))
+        options["headers"] = {**headers, **options.get("headers", {})}
+        self.transport_options = options
+
+    def end(
+        self,
+        response: Optional[transport.Response],
+        attempts: int,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        from opentelemetry import context, trace
+
+        attributes = dict(self.attributes)
+        span = self.span
+        span.set_attribute("looker.retries", max(attempts - 1, 0))
+        if response is not None:
+            if response.status_code is not None:
+                attributes["http.response.status_code"] = response.status_code
+                span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("http.response.body.size", len(response.value))
+            exception = exception or response.exception
+            if not response.ok:
+                span.set_status(trace.Status(trace.StatusCode.ERROR))
+        if exception is not None:
+            attributes["error.type"] = type(exception).__name__
+            span.record_exception(exception)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        self.telemetry.duration.record(
+            time.perf_counter() - self.started, attributes
+        )
+        context.detach(self.token)
+        span.end()
+
+
+class Telemetry:
+    """OpenTelemetry tracer and meter used by APIMethods and AuthSession
+
+    tracer_provider and meter_provider default to the global providers.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        from opentelemetry import metrics, trace
+
+        from looker_sdk.sdk import constants
+
+        self.tracer = trace.get_tracer(
+            TRACER_NAME, constants.sdk_version, tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter(
+            TRACER_NAME, constants.sdk_version, meter_provider=meter_provider
+        )
+        self.duration = meter.create_histogram(
+            "looker.api.duration",
+            unit="s",
+            description="Duration of Looker API calls including retries",
+        )
+
+    def call(
+        self,
+        method: transport.HttpMethod,
+        route: str,
+        body: Optional[bytes],
+        transport_options: Optional[transport.TransportOptions],
+        operation: str = "",
+    ) -> Call:
+        """route: the path template, e.g. "/dashboards/{dashboard_id}"
+        operation: the name of the SDK method making the call
+        """
+        return Call(self, method, route, body, transport_options, operation)
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Any]:
+        """Span around an internal operation, e.g. logging in"""
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+
+def instrument(
+    sdk: "api_methods.APIMethods",
+    tracer_provider: Any = None,
+    meter_provider: Any = None,
+) -> Telemetry:
+    """Enable telemetry for sdk and its AuthSession"""
+    telemetry = Telemetry(tracer_provider, meter_provider)
+    sdk.telemetry = telemetry
+    sdk.auth.telemetry = telemetry
+    return telemetry
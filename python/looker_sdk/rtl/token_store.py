@@ -0,0 +1,179 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Persistent access token storage shared between processes
+
+An AuthSession with a token_store reuses the unexpired API token another
+process (or an earlier run) logged in for instead of calling /login, e.g.
+cron jobs, CLI invocations and serverless cold starts.
+
+e.g.
+    sdk = looker_sdk.init40()
+    sdk.auth.token_store = FileTokenStore()
+"""
+import abc
+import datetime
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from looker_sdk.rtl import auth_token
+from looker_sdk.rtl import file_lock
+
+
+def token_key(base_url: str, client_id: str) -> str:
+    return f"{base_url} {client_id}"
+
+
+def _to_dict(token: auth_token.AuthToken) -> Dict[str, Any]:
+    return {
+        "access_token": token.access_token,
+        "token_type": token.token_type,
+        "refresh_token": token.refresh_token,
+        "expires_in": token.expires_in,
+        # already lag_time ahead of the server's expiry
+        "expires_at": token.expires_at.timestamp(),
+    }
+
+
+def _from_dict(data: Dict[str, Any]) -> auth_token.AuthToken:
+    token = auth_token.AuthToken(
+        auth_token.AccessToken(
+            access_token=data["access_token"],
+            token_type=data["token_type"],
+            refresh_token=data["refresh_token"],
+            expires_in=data["expires_in"],
+        )
+    )
+    token.expires_at = datetime.datetime.fromtimestamp(data["expires_at"])
+    return token
+
+
+class TokenStore(abc.ABC):
+    """Where tokens are kept, by token_key(base_url, client_id)"""
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[auth_token.AuthToken]:
+        """The stored token for key, expired or not"""
+
+    @abc.abstractmethod
+    def save(self, key: str, token: auth_token.AuthToken) -> None:
+        """Store token for key replacing any previous one"""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Forget the token for key"""
+
+
+class FileTokenStore(TokenStore):
+    """Tokens kept as json in a file only the current user can read
+
+    path defaults to ~/.looker/tokens.json. Reads and writes hold an
+    exclusive lock on the file so concurrent processes don't clobber each
+    other's tokens.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(
+            os.path.expanduser("~"), ".looker", "tokens.json"
+        )
+        self._lock = threading.Lock()
+
+    def _update(self, key: str, data: Optional[Dict[str, Any]]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._lock, os.fdopen(fd, "r+") as f, file_lock.locked(f):
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), 0o600)
+            f.seek(0)
+            tokens = self._parse(f.read())
+            if data is None:
+                tokens.pop(key, None)
+            else:
+                tokens[key] = data
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(tokens))
+            f.flush()
+
+    @staticmethod
+    def _parse(text: str) -> Dict[str, Any]:
+        try:
+            tokens = json.loads(text or "{}")
+        except ValueError:
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def load(self, key: str) -> Optional[auth_token.AuthToken]:
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+        except OSError:
+            return None
+        with self._lock, os.fdopen(fd, "r+") as f, file_lock.locked(f):
+            f.seek(0)
+            data = self._parse(f.read()).get(key)
+        try:
+            return _from_dict(data) if data else None
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, token: auth_token.AuthToken) -> None:
+        self._update(key, _to_dict(token))
+
+    def delete(self, key: str) -> None:
+        if os.path.exists(self.path):
+            self._update(key, None)
+
+
+class KeyringTokenStore(TokenStore):
+    """Tokens kept in the OS keyring (macOS Keychain, Windows Credential
+    Locker, Secret Service...)
+
+    Requires the optional keyring package: pip install keyring
+    """
+
+    def __init__(self, service: str = "looker_sdk") -> None:
+        import keyring
+        import keyring.errors
+
+        self.keyring = keyring
+        self.service = service
+
+    def load(self, key: str) -> Optional[auth_token.AuthToken]:
+        value = self.keyring.get_password(self.service, key)
+        if not value:
+            return None
+        try:
+            return _from_dict(json.loads(value))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, token: auth_token.AuthToken) -> None:
+        self.keyring.set_password(self.service, key, json.dumps(_to_dict(token)))
+
+    def delete(self, key: str) -> None:
+        try:
+            self.keyring.delete_password(self.service, key)
+        except self.keyring.errors.PasswordDeleteError:
+            pass
@@ -23,10 +23,23 @@
 """Types and abstract base class for transport implementations.
 """
 import abc
+import codecs
 import enum
+import os
 import re
 import sys
-from typing import Callable, Dict, MutableMapping, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Union,
+)
 
 import attr
 
@@ -38,6 +51,9 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import Protocol, TypedDict
 
+if TYPE_CHECKING:
+    from looker_sdk.rtl.rate_limit import RateLimiter
+    from looker_sdk.rtl.retry import RetryPolicy
 
 AGENT_PREFIX = "PY SDK"
 LOOKER_API_ID = "x-looker-appid"
@@ -61,6 +77,16 @@ class PTransportSettings(Protocol):
     timeout: int
     agent_tag: str
     headers: Optional[MutableMapping[str, str]]
+    # connection pooling, see requests.adapters.HTTPAdapter
+    pool_connections: int = 10  # number of hosts to keep a pool for
+    pool_maxsize: int = 10  # connections kept per host
+    pool_block: bool = False  # wait for a free connection at pool_maxsize
+    keep_alive: bool = True
+    # one session per thread, all sharing a single connection pool
+    session_per_thread: bool = False
+    # separate connect and read timeouts (seconds) instead of `timeout`
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
 
     def is_configured(self):
         if not self.base_url:
@@ -76,9 +102,21 @@ class TransportOptions(TypedDict, total=False):
 
     timeout: int
     headers: MutableMapping[str, str]
+    # return the response body as a ResponseStream instead of reading it
+    # into memory e.g. sdk.run_query(..., transport_options={"stream": True})
+    stream: bool
+    # retry.RetryPolicy for this call instead of the SDK's, None disables
+    # retrying e.g. transport_options={"retry": RetryPolicy(max_retries=10)}
+    retry: Optional["RetryPolicy"]
+    # phase durations in seconds the transport adds to, set by APIMethods
+    # while profiling, see add_time()
+    timings: Dict[str, float]
 
 
 TAuthenticator = Optional[Callable[[TransportOptions], Dict[str, str]]]
+TAsyncAuthenticator = Optional[
+    Callable[[TransportOptions], Awaitable[Dict[str, str]]]
+]
 
 
 class ResponseMode(enum.Enum):
@@ -89,6 +127,76 @@ class ResponseMode(enum.Enum):
     UNKNOWN = 3
 
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseStream:
+    """Response body delivered incrementally as byte chunks
+
+    Iterate over it for the raw chunks, use iter_lines() for decoded lines
+    or write_to() to save it. Close it (or use it as a context manager) if
+    it is abandoned before being fully consumed.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str = "utf-8",
+        close: Optional[Callable[[], None]] = None,
+    ):
+        self._chunks = chunks
+        self.encoding = encoding
+        self._close = close
+        # of the response, set by APIMethods e.g. to tell 202 Accepted apart
+        self.status_code: Optional[int] = None
+        self.headers: Optional[MutableMapping[str, str]] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            if chunk:
+                yield chunk
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield decoded lines without their line endings"""
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        pending = ""
+        for chunk in self:
+            pending += decoder.decode(chunk)
+            lines = pending.split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending.rstrip("\r")
+
+    def write_to(self, file: Union[str, "os.PathLike[str]", IO[bytes]]) -> int:
+        """Write the body to a path or binary file object, returning its size"""
+        size = 0
+        try:
+            if isinstance(file, (str, os.PathLike)):
+                with open(file, "wb") as f:
+                    for chunk in self:
+                        size += f.write(chunk)
+            else:
+                for chunk in self:
+                    size += file.write(chunk)
+        finally:
+            self.close()
+        return size
+
+    def close(self) -> None:
+        """Release the underlying connection"""
+        if self._close:
+            self._close()
+
+    def __enter__(self) -> "ResponseStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 @attr.s(auto_attribs=True)
 class Response:
     """Success Response object."""
@@ -97,6 +205,22 @@ class Response:
     value: bytes
     response_mode: ResponseMode
     encoding: str = "utf-8"
+    # set instead of value when the request was made with "stream" enabled
+    stream: Optional[ResponseStream] = None
+    # None when no response was received, see exception
+    status_code: Optional[int] = None
+    headers: Optional[MutableMapping[str, str]] = None
+    # the error raised when the request failed without a response
+    exception: Optional[BaseException] = None
+    # False when the request failed before it was sent, e.g. the connection
+    # was refused, so the server cannot have acted on it
+    sent: bool = True
+    # phase durations in seconds when the call is profiled
+    timings: Optional[Dict[str, float]] = None
+
+
+def add_time(timings: Dict[str, float], phase: str, seconds: float) -> None:
+    timings[phase] = timings.get(phase, 0.0) + seconds
 
 
 _STRING_MODE = re.compile(constants.RESPONSE_STRING_MODE, re.IGNORECASE)
@@ -119,6 +243,9 @@ def response_mode(content_type: Optional[str] = None) -> ResponseMode:
 class Transport(abc.ABC):
     """Transport base class."""
 
+    # requests wait for this rate_limit.RateLimiter before they are sent
+    rate_limiter: Optional["RateLimiter"] = None
+
     @classmethod
     @abc.abstractmethod
     def configure(cls, settings: PTransportSettings) -> "Transport":
@@ -135,3 +262,30 @@ class Transport(abc.ABC):
         transport_options: Optional[TransportOptions] = None,
     ) -> Response:
         """Send API request."""
+
+
+class AsyncTransport(abc.ABC):
+    """Transport base class for asyncio based implementations."""
+
+    # requests wait for this rate_limit.RateLimiter before they are sent
+    rate_limiter: Optional["RateLimiter"] = None
+
+    @classmethod
+    @abc.abstractmethod
+    def configure(cls, settings: PTransportSettings) -> "AsyncTransport":
+        """Configure and return an instance of AsyncTransport"""
+
+    @abc.abstractmethod
+    async def request(
+        self,
+        method: HttpMethod,
+        path: str,
+        query_params: Optional[MutableMapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        authenticator: TAsyncAuthenticator = None,
+        transport_options: Optional[TransportOptions] = None,
+    ) -> Response:
+        """Send API request."""
+
+    async def close(self) -> None:
+        """Release any connections held by the transport."""
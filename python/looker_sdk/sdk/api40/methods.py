@@ -56,6 +56,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/alerts/{alert_id}/follow",
                 structure=None,
                 transport_options=transport_options,
+                operation="follow_alert",
+                route="/alerts/{alert_id}/follow",
             ),
         )
         return response
@@ -77,6 +79,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/alerts/{alert_id}/follow",
                 structure=None,
                 transport_options=transport_options,
+                operation="unfollow_alert",
+                route="/alerts/{alert_id}/follow",
             ),
         )
         return response
@@ -127,6 +131,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "all_owners": all_owners,
                 },
                 transport_options=transport_options,
+                operation="search_alerts",
+                route="/alerts/search",
             ),
         )
         return response
@@ -148,6 +154,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/alerts/{alert_id}",
                 structure=mdls.Alert,
                 transport_options=transport_options,
+                operation="get_alert",
+                route="/alerts/{alert_id}",
             ),
         )
         return response
@@ -173,6 +181,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Alert,
                 body=body,
                 transport_options=transport_options,
+                operation="update_alert",
+                route="/alerts/{alert_id}",
             ),
         )
         return response
@@ -198,6 +208,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Alert,
                 body=body,
                 transport_options=transport_options,
+                operation="update_alert_field",
+                route="/alerts/{alert_id}",
             ),
         )
         return response
@@ -219,6 +231,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/alerts/{alert_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="delete_alert",
+                route="/alerts/{alert_id}",
             ),
         )
         return response
@@ -273,6 +287,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Alert,
                 body=body,
                 transport_options=transport_options,
+                operation="create_alert",
+                route="/alerts",
             ),
         )
         return response
@@ -297,6 +313,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=None,
                 query_params={"force": force},
                 transport_options=transport_options,
+                operation="enqueue_alert",
+                route="/alerts/{alert_id}/enqueue",
             ),
         )
         return response
@@ -321,6 +339,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.AlertNotifications],
                 query_params={"limit": limit, "offset": offset},
                 transport_options=transport_options,
+                operation="alert_notifications",
+                route="/alert_notifications",
             ),
         )
         return response
@@ -343,6 +363,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/alert_notifications/{alert_notification_id}",
                 structure=mdls.AlertNotifications,
                 transport_options=transport_options,
+                operation="read_alert_notification",
+                route="/alert_notifications/{alert_notification_id}",
             ),
         )
         return response
@@ -399,6 +421,8 @@ class Looker40SDK(api_methods.APIMethods):
                     {"client_id": client_id, "client_secret": client_secret}
                 ),
                 transport_options=transport_options,
+                operation="login",
+                route="/login",
             ),
         )
         return response
@@ -443,6 +467,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/login/{user_id}",
                 structure=mdls.AccessToken,
                 transport_options=transport_options,
+                operation="login_user",
+                route="/login/{user_id}",
             ),
         )
         return response
@@ -458,7 +484,11 @@ class Looker40SDK(api_methods.APIMethods):
         response = cast(
             str,
             self.delete(
-                path="/logout", structure=str, transport_options=transport_options
+                path="/logout",
+                structure=str,
+                transport_options=transport_options,
+                operation="logout",
+                route="/logout",
             ),
         )
         return response
@@ -486,6 +516,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ArtifactUsage,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="artifact_usage",
+                route="/artifact/usage",
             ),
         )
         return response
@@ -513,6 +545,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ArtifactNamespace],
                 query_params={"fields": fields, "limit": limit, "offset": offset},
                 transport_options=transport_options,
+                operation="artifact_namespaces",
+                route="/artifact/namespaces",
             ),
         )
         return response
@@ -541,6 +575,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"key": key},
                 transport_options=transport_options,
+                operation="artifact_value",
+                route="/artifact/{namespace}/value",
             ),
         )
         return response
@@ -564,6 +600,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/artifact/{namespace}/purge",
                 structure=None,
                 transport_options=transport_options,
+                operation="purge_artifacts",
+                route="/artifact/{namespace}/purge",
             ),
         )
         return response
@@ -627,6 +665,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "tally": tally,
                 },
                 transport_options=transport_options,
+                operation="search_artifacts",
+                route="/artifact/{namespace}/search",
             ),
         )
         return response
@@ -669,6 +709,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "tally": tally,
                 },
                 transport_options=transport_options,
+                operation="artifact",
+                route="/artifact/{namespace}",
             ),
         )
         return response
@@ -697,6 +739,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=None,
                 query_params={"key": key},
                 transport_options=transport_options,
+                operation="delete_artifact",
+                route="/artifact/{namespace}",
             ),
         )
         return response
@@ -748,6 +792,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_artifacts",
+                route="/artifacts/{namespace}",
             ),
         )
         return response
@@ -776,6 +822,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedSecret,
                 body=body,
                 transport_options=transport_options,
+                operation="create_embed_secret",
+                route="/embed_config/secrets",
             ),
         )
         return response
@@ -799,6 +847,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/embed_config/secrets/{embed_secret_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_embed_secret",
+                route="/embed_config/secrets/{embed_secret_id}",
             ),
         )
         return response
@@ -862,6 +912,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedUrlResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="create_sso_embed_url",
+                route="/embed/sso_url",
             ),
         )
         return response
@@ -906,6 +958,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedUrlResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="create_embed_url_as_me",
+                route="/embed/token_url/me",
             ),
         )
         return response
@@ -927,6 +981,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedUrlResponse,
                 query_params={"url": url},
                 transport_options=transport_options,
+                operation="validate_embed_url",
+                route="/embed/sso/validate",
             ),
         )
         return response
@@ -978,6 +1034,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedCookielessSessionAcquireResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="acquire_embed_cookieless_session",
+                route="/embed/cookieless_session/acquire",
             ),
         )
         return response
@@ -1005,6 +1063,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/embed/cookieless_session/{session_reference_token}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_embed_cookieless_session",
+                route="/embed/cookieless_session/{session_reference_token}",
             ),
         )
         return response
@@ -1040,6 +1100,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.EmbedCookielessSessionGenerateTokensResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="generate_tokens_for_cookieless_session",
+                route="/embed/cookieless_session/generate_tokens",
             ),
         )
         return response
@@ -1075,6 +1137,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/ldap_config",
                 structure=mdls.LDAPConfig,
                 transport_options=transport_options,
+                operation="ldap_config",
+                route="/ldap_config",
             ),
         )
         return response
@@ -1107,6 +1171,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LDAPConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="update_ldap_config",
+                route="/ldap_config",
             ),
         )
         return response
@@ -1146,6 +1212,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LDAPConfigTestResult,
                 body=body,
                 transport_options=transport_options,
+                operation="test_ldap_config_connection",
+                route="/ldap_config/test_connection",
             ),
         )
         return response
@@ -1187,6 +1255,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LDAPConfigTestResult,
                 body=body,
                 transport_options=transport_options,
+                operation="test_ldap_config_auth",
+                route="/ldap_config/test_auth",
             ),
         )
         return response
@@ -1217,6 +1287,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LDAPConfigTestResult,
                 body=body,
                 transport_options=transport_options,
+                operation="test_ldap_config_user_info",
+                route="/ldap_config/test_user_info",
             ),
         )
         return response
@@ -1247,6 +1319,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LDAPConfigTestResult,
                 body=body,
                 transport_options=transport_options,
+                operation="test_ldap_config_user_auth",
+                route="/ldap_config/test_user_auth",
             ),
         )
         return response
@@ -1268,6 +1342,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.MobileToken,
                 body=body,
                 transport_options=transport_options,
+                operation="register_mobile_device",
+                route="/mobile/device",
             ),
         )
         return response
@@ -1289,6 +1365,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/mobile/device/{device_id}",
                 structure=mdls.MobileToken,
                 transport_options=transport_options,
+                operation="update_mobile_device_registration",
+                route="/mobile/device/{device_id}",
             ),
         )
         return response
@@ -1310,6 +1388,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/mobile/device/{device_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="deregister_mobile_device",
+                route="/mobile/device/{device_id}",
             ),
         )
         return response
@@ -1337,6 +1417,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.OauthClientApp],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_oauth_client_apps",
+                route="/oauth_client_apps",
             ),
         )
         return response
@@ -1363,6 +1445,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.OauthClientApp,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="oauth_client_app",
+                route="/oauth_client_apps/{client_guid}",
             ),
         )
         return response
@@ -1394,6 +1478,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="register_oauth_client_app",
+                route="/oauth_client_apps/{client_guid}",
             ),
         )
         return response
@@ -1422,6 +1508,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_oauth_client_app",
+                route="/oauth_client_apps/{client_guid}",
             ),
         )
         return response
@@ -1451,6 +1539,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/oauth_client_apps/{client_guid}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_oauth_client_app",
+                route="/oauth_client_apps/{client_guid}",
             ),
         )
         return response
@@ -1475,6 +1565,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/oauth_client_apps/{client_guid}/tokens",
                 structure=str,
                 transport_options=transport_options,
+                operation="invalidate_tokens",
+                route="/oauth_client_apps/{client_guid}/tokens",
             ),
         )
         return response
@@ -1508,6 +1600,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="activate_app_user",
+                route="/oauth_client_apps/{client_guid}/users/{user_id}",
             ),
         )
         return response
@@ -1544,6 +1638,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="deactivate_app_user",
+                route="/oauth_client_apps/{client_guid}/users/{user_id}",
             ),
         )
         return response
@@ -1575,6 +1671,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/oidc_config",
                 structure=mdls.OIDCConfig,
                 transport_options=transport_options,
+                operation="oidc_config",
+                route="/oidc_config",
             ),
         )
         return response
@@ -1605,6 +1703,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.OIDCConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="update_oidc_config",
+                route="/oidc_config",
             ),
         )
         return response
@@ -1628,6 +1728,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/oidc_test_configs/{test_slug}",
                 structure=mdls.OIDCConfig,
                 transport_options=transport_options,
+                operation="oidc_test_config",
+                route="/oidc_test_configs/{test_slug}",
             ),
         )
         return response
@@ -1651,6 +1753,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/oidc_test_configs/{test_slug}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_oidc_test_config",
+                route="/oidc_test_configs/{test_slug}",
             ),
         )
         return response
@@ -1673,6 +1777,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.OIDCConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="create_oidc_test_config",
+                route="/oidc_test_configs",
             ),
         )
         return response
@@ -1693,6 +1799,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/password_config",
                 structure=mdls.PasswordConfig,
                 transport_options=transport_options,
+                operation="password_config",
+                route="/password_config",
             ),
         )
         return response
@@ -1715,6 +1823,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.PasswordConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="update_password_config",
+                route="/password_config",
             ),
         )
         return response
@@ -1735,6 +1845,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/password_config/force_password_reset_at_next_login_for_all_users",
                 structure=str,
                 transport_options=transport_options,
+                operation="force_password_reset_at_next_login_for_all_users",
+                route="/password_config/force_password_reset_at_next_login_for_all_users",
             ),
         )
         return response
@@ -1766,6 +1878,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/saml_config",
                 structure=mdls.SamlConfig,
                 transport_options=transport_options,
+                operation="saml_config",
+                route="/saml_config",
             ),
         )
         return response
@@ -1796,6 +1910,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SamlConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="update_saml_config",
+                route="/saml_config",
             ),
         )
         return response
@@ -1819,6 +1935,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/saml_test_configs/{test_slug}",
                 structure=mdls.SamlConfig,
                 transport_options=transport_options,
+                operation="saml_test_config",
+                route="/saml_test_configs/{test_slug}",
             ),
         )
         return response
@@ -1842,6 +1960,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/saml_test_configs/{test_slug}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_saml_test_config",
+                route="/saml_test_configs/{test_slug}",
             ),
         )
         return response
@@ -1864,6 +1984,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SamlConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="create_saml_test_config",
+                route="/saml_test_configs",
             ),
         )
         return response
@@ -1886,6 +2008,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SamlMetadataParseResult,
                 body=body,
                 transport_options=transport_options,
+                operation="parse_saml_idp_metadata",
+                route="/parse_saml_idp_metadata",
             ),
         )
         return response
@@ -1910,6 +2034,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SamlMetadataParseResult,
                 body=body,
                 transport_options=transport_options,
+                operation="fetch_and_parse_saml_idp_metadata",
+                route="/fetch_and_parse_saml_idp_metadata",
             ),
         )
         return response
@@ -1928,6 +2054,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/session_config",
                 structure=mdls.SessionConfig,
                 transport_options=transport_options,
+                operation="session_config",
+                route="/session_config",
             ),
         )
         return response
@@ -1948,6 +2076,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SessionConfig,
                 body=body,
                 transport_options=transport_options,
+                operation="update_session_config",
+                route="/session_config",
             ),
         )
         return response
@@ -1973,6 +2103,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.SupportAccessAllowlistEntry],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_support_access_allowlist_entries",
+                route="/support_access/allowlist",
             ),
         )
         return response
@@ -1997,6 +2129,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.SupportAccessAllowlistEntry],
                 body=body,
                 transport_options=transport_options,
+                operation="add_support_access_allowlist_entries",
+                route="/support_access/allowlist",
             ),
         )
         return response
@@ -2022,6 +2156,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/support_access/allowlist/{entry_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_support_access_allowlist_entry",
+                route="/support_access/allowlist/{entry_id}",
             ),
         )
         return response
@@ -2046,6 +2182,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SupportAccessStatus,
                 body=body,
                 transport_options=transport_options,
+                operation="enable_support_access",
+                route="/support_access/enable",
             ),
         )
         return response
@@ -2068,6 +2206,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/support_access/disable",
                 structure=mdls.SupportAccessStatus,
                 transport_options=transport_options,
+                operation="disable_support_access",
+                route="/support_access/disable",
             ),
         )
         return response
@@ -2090,6 +2230,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/support_access/status",
                 structure=mdls.SupportAccessStatus,
                 transport_options=transport_options,
+                operation="support_access_status",
+                route="/support_access/status",
             ),
         )
         return response
@@ -2111,6 +2253,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.UserLoginLockout],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_user_login_lockouts",
+                route="/user_login_lockouts",
             ),
         )
         return response
@@ -2164,6 +2308,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_user_login_lockouts",
+                route="/user_login_lockouts/search",
             ),
         )
         return response
@@ -2185,6 +2331,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/user_login_lockout/{key}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_login_lockout",
+                route="/user_login_lockout/{key}",
             ),
         )
         return response
@@ -2210,6 +2358,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Board],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_boards",
+                route="/boards",
             ),
         )
         return response
@@ -2233,6 +2383,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_board",
+                route="/boards",
             ),
         )
         return response
@@ -2316,6 +2468,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "permission": permission,
                 },
                 transport_options=transport_options,
+                operation="search_boards",
+                route="/boards/search",
             ),
         )
         return response
@@ -2340,6 +2494,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Board,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="board",
+                route="/boards/{board_id}",
             ),
         )
         return response
@@ -2366,6 +2522,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_board",
+                route="/boards/{board_id}",
             ),
         )
         return response
@@ -2387,6 +2545,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/boards/{board_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_board",
+                route="/boards/{board_id}",
             ),
         )
         return response
@@ -2416,6 +2576,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "board_section_id": board_section_id,
                 },
                 transport_options=transport_options,
+                operation="all_board_items",
+                route="/board_items",
             ),
         )
         return response
@@ -2439,6 +2601,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_board_item",
+                route="/board_items",
             ),
         )
         return response
@@ -2463,6 +2627,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.BoardItem,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="board_item",
+                route="/board_items/{board_item_id}",
             ),
         )
         return response
@@ -2489,6 +2655,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_board_item",
+                route="/board_items/{board_item_id}",
             ),
         )
         return response
@@ -2510,6 +2678,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/board_items/{board_item_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_board_item",
+                route="/board_items/{board_item_id}",
             ),
         )
         return response
@@ -2533,6 +2703,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.BoardSection],
                 query_params={"fields": fields, "sorts": sorts},
                 transport_options=transport_options,
+                operation="all_board_sections",
+                route="/board_sections",
             ),
         )
         return response
@@ -2556,6 +2728,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_board_section",
+                route="/board_sections",
             ),
         )
         return response
@@ -2580,6 +2754,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.BoardSection,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="board_section",
+                route="/board_sections/{board_section_id}",
             ),
         )
         return response
@@ -2606,6 +2782,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_board_section",
+                route="/board_sections/{board_section_id}",
             ),
         )
         return response
@@ -2627,6 +2805,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/board_sections/{board_section_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_board_section",
+                route="/board_sections/{board_section_id}",
             ),
         )
         return response
@@ -2659,6 +2839,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ColorCollection],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_color_collections",
+                route="/color_collections",
             ),
         )
         return response
@@ -2687,6 +2869,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ColorCollection,
                 body=body,
                 transport_options=transport_options,
+                operation="create_color_collection",
+                route="/color_collections",
             ),
         )
         return response
@@ -2713,6 +2897,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ColorCollection],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="color_collections_custom",
+                route="/color_collections/custom",
             ),
         )
         return response
@@ -2739,6 +2925,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ColorCollection],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="color_collections_standard",
+                route="/color_collections/standard",
             ),
         )
         return response
@@ -2761,6 +2949,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/color_collections/default",
                 structure=mdls.ColorCollection,
                 transport_options=transport_options,
+                operation="default_color_collection",
+                route="/color_collections/default",
             ),
         )
         return response
@@ -2785,6 +2975,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ColorCollection,
                 query_params={"collection_id": collection_id},
                 transport_options=transport_options,
+                operation="set_default_color_collection",
+                route="/color_collections/default",
             ),
         )
         return response
@@ -2818,6 +3010,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ColorCollection,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="color_collection",
+                route="/color_collections/{collection_id}",
             ),
         )
         return response
@@ -2842,6 +3036,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ColorCollection,
                 body=body,
                 transport_options=transport_options,
+                operation="update_color_collection",
+                route="/color_collections/{collection_id}",
             ),
         )
         return response
@@ -2870,6 +3066,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/color_collections/{collection_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_color_collection",
+                route="/color_collections/{collection_id}",
             ),
         )
         return response
@@ -2892,6 +3090,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/cloud_storage",
                 structure=mdls.BackupConfiguration,
                 transport_options=transport_options,
+                operation="cloud_storage_configuration",
+                route="/cloud_storage",
             ),
         )
         return response
@@ -2912,6 +3112,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.BackupConfiguration,
                 body=body,
                 transport_options=transport_options,
+                operation="update_cloud_storage_configuration",
+                route="/cloud_storage",
             ),
         )
         return response
@@ -2930,6 +3132,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/custom_welcome_email",
                 structure=mdls.CustomWelcomeEmail,
                 transport_options=transport_options,
+                operation="custom_welcome_email",
+                route="/custom_welcome_email",
             ),
         )
         return response
@@ -2953,6 +3157,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"send_test_welcome_email": send_test_welcome_email},
                 body=body,
                 transport_options=transport_options,
+                operation="update_custom_welcome_email",
+                route="/custom_welcome_email",
             ),
         )
         return response
@@ -2973,6 +3179,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.WelcomeEmailTest,
                 body=body,
                 transport_options=transport_options,
+                operation="update_custom_welcome_email_test",
+                route="/custom_welcome_email_test",
             ),
         )
         return response
@@ -2991,6 +3199,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/digest_emails_enabled",
                 structure=mdls.DigestEmails,
                 transport_options=transport_options,
+                operation="digest_emails_enabled",
+                route="/digest_emails_enabled",
             ),
         )
         return response
@@ -3011,6 +3221,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DigestEmails,
                 body=body,
                 transport_options=transport_options,
+                operation="update_digest_emails_enabled",
+                route="/digest_emails_enabled",
             ),
         )
         return response
@@ -3031,6 +3243,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/digest_email_send",
                 structure=mdls.DigestEmailSend,
                 transport_options=transport_options,
+                operation="create_digest_email_send",
+                route="/digest_email_send",
             ),
         )
         return response
@@ -3053,6 +3267,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/public_egress_ip_addresses",
                 structure=mdls.EgressIpAddresses,
                 transport_options=transport_options,
+                operation="public_egress_ip_addresses",
+                route="/public_egress_ip_addresses",
             ),
         )
         return response
@@ -3071,6 +3287,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/internal_help_resources_content",
                 structure=mdls.InternalHelpResourcesContent,
                 transport_options=transport_options,
+                operation="internal_help_resources_content",
+                route="/internal_help_resources_content",
             ),
         )
         return response
@@ -3091,6 +3309,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.InternalHelpResourcesContent,
                 body=body,
                 transport_options=transport_options,
+                operation="update_internal_help_resources_content",
+                route="/internal_help_resources_content",
             ),
         )
         return response
@@ -3109,6 +3329,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/internal_help_resources_enabled",
                 structure=mdls.InternalHelpResources,
                 transport_options=transport_options,
+                operation="internal_help_resources",
+                route="/internal_help_resources_enabled",
             ),
         )
         return response
@@ -3129,6 +3351,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.InternalHelpResources,
                 body=body,
                 transport_options=transport_options,
+                operation="update_internal_help_resources",
+                route="/internal_help_resources",
             ),
         )
         return response
@@ -3149,6 +3373,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/legacy_features",
                 structure=Sequence[mdls.LegacyFeature],
                 transport_options=transport_options,
+                operation="all_legacy_features",
+                route="/legacy_features",
             ),
         )
         return response
@@ -3172,6 +3398,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/legacy_features/{legacy_feature_id}",
                 structure=mdls.LegacyFeature,
                 transport_options=transport_options,
+                operation="legacy_feature",
+                route="/legacy_features/{legacy_feature_id}",
             ),
         )
         return response
@@ -3197,6 +3425,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LegacyFeature,
                 body=body,
                 transport_options=transport_options,
+                operation="update_legacy_feature",
+                route="/legacy_features/{legacy_feature_id}",
             ),
         )
         return response
@@ -3215,6 +3445,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/locales",
                 structure=Sequence[mdls.Locale],
                 transport_options=transport_options,
+                operation="all_locales",
+                route="/locales",
             ),
         )
         return response
@@ -3233,6 +3465,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/mobile/settings",
                 structure=mdls.MobileSettings,
                 transport_options=transport_options,
+                operation="mobile_settings",
+                route="/mobile/settings",
             ),
         )
         return response
@@ -3284,6 +3518,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Setting,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_setting",
+                route="/setting",
             ),
         )
         return response
@@ -3341,6 +3577,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="set_setting",
+                route="/setting",
             ),
         )
         return response
@@ -3363,6 +3601,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=None,
                 body=body,
                 transport_options=transport_options,
+                operation="set_smtp_settings",
+                route="/smtp_settings",
             ),
         )
         return response
@@ -3384,6 +3624,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SmtpStatus,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="smtp_status",
+                route="/smtp_status",
             ),
         )
         return response
@@ -3402,6 +3644,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/timezones",
                 structure=Sequence[mdls.Timezone],
                 transport_options=transport_options,
+                operation="all_timezones",
+                route="/timezones",
             ),
         )
         return response
@@ -3423,6 +3667,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ApiVersion,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="versions",
+                route="/versions",
             ),
         )
         return response
@@ -3449,6 +3695,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/api_spec/{api_version}/{specification}",
                 structure=Any,
                 transport_options=transport_options,
+                operation="api_spec",
+                route="/api_spec/{api_version}/{specification}",
             ),
         )
         return response
@@ -3474,6 +3722,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.WhitelabelConfiguration,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="whitelabel_configuration",
+                route="/whitelabel_configuration",
             ),
         )
         return response
@@ -3496,6 +3746,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.WhitelabelConfiguration,
                 body=body,
                 transport_options=transport_options,
+                operation="update_whitelabel_configuration",
+                route="/whitelabel_configuration",
             ),
         )
         return response
@@ -3521,6 +3773,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DBConnection],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_connections",
+                route="/connections",
             ),
         )
         return response
@@ -3541,6 +3795,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DBConnection,
                 body=body,
                 transport_options=transport_options,
+                operation="create_connection",
+                route="/connections",
             ),
         )
         return response
@@ -3565,6 +3821,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DBConnection,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="connection",
+                route="/connections/{connection_name}",
             ),
         )
         return response
@@ -3588,6 +3846,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DBConnection,
                 body=body,
                 transport_options=transport_options,
+                operation="update_connection",
+                route="/connections/{connection_name}",
             ),
         )
         return response
@@ -3609,6 +3869,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/connections/{connection_name}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_connection",
+                route="/connections/{connection_name}",
             ),
         )
         return response
@@ -3633,6 +3895,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/connections/{connection_name}/connection_override/{override_context}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_connection_override",
+                route="/connections/{connection_name}/connection_override/{override_context}",
             ),
         )
         return response
@@ -3664,6 +3928,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DBConnectionTestResult],
                 query_params={"tests": tests},
                 transport_options=transport_options,
+                operation="test_connection",
+                route="/connections/{connection_name}/test",
             ),
         )
         return response
@@ -3694,6 +3960,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"tests": tests},
                 body=body,
                 transport_options=transport_options,
+                operation="test_connection_config",
+                route="/connections/test",
             ),
         )
         return response
@@ -3715,6 +3983,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DialectInfo],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_dialect_infos",
+                route="/dialect_info",
             ),
         )
         return response
@@ -3740,6 +4010,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ExternalOauthApplication],
                 query_params={"name": name, "client_id": client_id},
                 transport_options=transport_options,
+                operation="all_external_oauth_applications",
+                route="/external_oauth_applications",
             ),
         )
         return response
@@ -3762,6 +4034,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ExternalOauthApplication,
                 body=body,
                 transport_options=transport_options,
+                operation="create_external_oauth_application",
+                route="/external_oauth_applications",
             ),
         )
         return response
@@ -3787,6 +4061,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ExternalOauthApplication,
                 body=body,
                 transport_options=transport_options,
+                operation="update_external_oauth_application",
+                route="/external_oauth_applications/{client_id}",
             ),
         )
         return response
@@ -3810,6 +4086,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/external_oauth_applications/{client_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_external_oauth_application",
+                route="/external_oauth_applications/{client_id}",
             ),
         )
         return response
@@ -3830,6 +4108,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CreateOAuthApplicationUserStateResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="create_oauth_application_user_state",
+                route="/external_oauth_applications/user_state",
             ),
         )
         return response
@@ -3851,6 +4131,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.SshServer],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_ssh_servers",
+                route="/ssh_servers",
             ),
         )
         return response
@@ -3871,6 +4153,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SshServer,
                 body=body,
                 transport_options=transport_options,
+                operation="create_ssh_server",
+                route="/ssh_servers",
             ),
         )
         return response
@@ -3892,6 +4176,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_server/{ssh_server_id}",
                 structure=mdls.SshServer,
                 transport_options=transport_options,
+                operation="ssh_server",
+                route="/ssh_server/{ssh_server_id}",
             ),
         )
         return response
@@ -3915,6 +4201,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SshServer,
                 body=body,
                 transport_options=transport_options,
+                operation="update_ssh_server",
+                route="/ssh_server/{ssh_server_id}",
             ),
         )
         return response
@@ -3936,6 +4224,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_server/{ssh_server_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_ssh_server",
+                route="/ssh_server/{ssh_server_id}",
             ),
         )
         return response
@@ -3957,6 +4247,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_server/{ssh_server_id}/test",
                 structure=mdls.SshServer,
                 transport_options=transport_options,
+                operation="test_ssh_server",
+                route="/ssh_server/{ssh_server_id}/test",
             ),
         )
         return response
@@ -3978,6 +4270,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.SshTunnel],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_ssh_tunnels",
+                route="/ssh_tunnels",
             ),
         )
         return response
@@ -3998,6 +4292,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SshTunnel,
                 body=body,
                 transport_options=transport_options,
+                operation="create_ssh_tunnel",
+                route="/ssh_tunnels",
             ),
         )
         return response
@@ -4019,6 +4315,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_tunnel/{ssh_tunnel_id}",
                 structure=mdls.SshTunnel,
                 transport_options=transport_options,
+                operation="ssh_tunnel",
+                route="/ssh_tunnel/{ssh_tunnel_id}",
             ),
         )
         return response
@@ -4042,6 +4340,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SshTunnel,
                 body=body,
                 transport_options=transport_options,
+                operation="update_ssh_tunnel",
+                route="/ssh_tunnel/{ssh_tunnel_id}",
             ),
         )
         return response
@@ -4063,6 +4363,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_tunnel/{ssh_tunnel_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_ssh_tunnel",
+                route="/ssh_tunnel/{ssh_tunnel_id}",
             ),
         )
         return response
@@ -4084,6 +4386,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/ssh_tunnel/{ssh_tunnel_id}/test",
                 structure=mdls.SshTunnel,
                 transport_options=transport_options,
+                operation="test_ssh_tunnel",
+                route="/ssh_tunnel/{ssh_tunnel_id}/test",
             ),
         )
         return response
@@ -4104,6 +4408,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/ssh_public_key",
                 structure=mdls.SshPublicKey,
                 transport_options=transport_options,
+                operation="ssh_public_key",
+                route="/ssh_public_key",
             ),
         )
         return response
@@ -4188,6 +4494,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_content_favorites",
+                route="/content_favorite/search",
             ),
         )
         return response
@@ -4212,6 +4520,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ContentFavorite,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="content_favorite",
+                route="/content_favorite/{content_favorite_id}",
             ),
         )
         return response
@@ -4233,6 +4543,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/content_favorite/{content_favorite_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_content_favorite",
+                route="/content_favorite/{content_favorite_id}",
             ),
         )
         return response
@@ -4253,6 +4565,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ContentFavorite,
                 body=body,
                 transport_options=transport_options,
+                operation="create_content_favorite",
+                route="/content_favorite",
             ),
         )
         return response
@@ -4276,6 +4590,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ContentMeta],
                 query_params={"parent_id": parent_id, "fields": fields},
                 transport_options=transport_options,
+                operation="all_content_metadatas",
+                route="/content_metadata",
             ),
         )
         return response
@@ -4300,6 +4616,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ContentMeta,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="content_metadata",
+                route="/content_metadata/{content_metadata_id}",
             ),
         )
         return response
@@ -4323,6 +4641,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ContentMeta,
                 body=body,
                 transport_options=transport_options,
+                operation="update_content_metadata",
+                route="/content_metadata/{content_metadata_id}",
             ),
         )
         return response
@@ -4349,6 +4669,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "fields": fields,
                 },
                 transport_options=transport_options,
+                operation="all_content_metadata_accesses",
+                route="/content_metadata_access",
             ),
         )
         return response
@@ -4375,6 +4697,8 @@ class Looker40SDK(api_methods.APIMethods):
                 },
                 body=body,
                 transport_options=transport_options,
+                operation="create_content_metadata_access",
+                route="/content_metadata_access",
             ),
         )
         return response
@@ -4399,6 +4723,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ContentMetaGroupUser,
                 body=body,
                 transport_options=transport_options,
+                operation="update_content_metadata_access",
+                route="/content_metadata_access/{content_metadata_access_id}",
             ),
         )
         return response
@@ -4420,6 +4746,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/content_metadata_access/{content_metadata_access_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_content_metadata_access",
+                route="/content_metadata_access/{content_metadata_access_id}",
             ),
         )
         return response
@@ -4469,6 +4797,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "per_page": per_page,
                 },
                 transport_options=transport_options,
+                operation="search_content",
+                route="/content/{terms}",
             ),
         )
         return response
@@ -4513,6 +4843,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "sorts": sorts,
                 },
                 transport_options=transport_options,
+                operation="content_summary",
+                route="/content_summary",
             ),
         )
         return response
@@ -4557,6 +4889,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "height": height,
                 },
                 transport_options=transport_options,
+                operation="content_thumbnail",
+                route="/content_thumbnail/{type}/{resource_id}",
             ),
         )
         return response
@@ -4589,6 +4923,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "space_ids": space_ids,
                 },
                 transport_options=transport_options,
+                operation="content_validation",
+                route="/content_validation",
             ),
         )
         return response
@@ -4669,6 +5005,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_content_views",
+                route="/content_view/search",
             ),
         )
         return response
@@ -4701,6 +5039,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"reload": reload},
                 transport_options=transport_options,
+                operation="vector_thumbnail",
+                route="/vector_thumbnail/{type}/{resource_id}",
             ),
         )
         return response
@@ -4770,6 +5110,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "primary_agent_id": primary_agent_id,
                 },
                 transport_options=transport_options,
+                operation="search_agents",
+                route="/agents/search",
             ),
         )
         return response
@@ -4796,6 +5138,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_agent",
+                route="/agents",
             ),
         )
         return response
@@ -4821,6 +5165,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"id": id, "fields": fields},
                 transport_options=transport_options,
+                operation="delete_agent",
+                route="/agents",
             ),
         )
         return response
@@ -4847,6 +5193,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Agent,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_agent",
+                route="/agents/{agent_id}",
             ),
         )
         return response
@@ -4875,6 +5223,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_agent",
+                route="/agents/{agent_id}",
             ),
         )
         return response
@@ -4901,6 +5251,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ConversationMessage],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_conversation_messages",
+                route="/conversations/{conversation_id}/messages",
             ),
         )
         return response
@@ -4933,6 +5285,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_conversation_message",
+                route="/conversations/{conversation_id}/messages",
             ),
         )
         return response
@@ -4961,6 +5315,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"id": id, "fields": fields},
                 transport_options=transport_options,
+                operation="delete_conversation_message",
+                route="/conversations/{conversation_id}/messages",
             ),
         )
         return response
@@ -4990,6 +5346,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ConversationMessage,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_conversation_message",
+                route="/conversations/{conversation_id}/messages/{message_id}",
             ),
         )
         return response
@@ -5021,6 +5379,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_conversation_message",
+                route="/conversations/{conversation_id}/messages/{message_id}",
             ),
         )
         return response
@@ -5078,6 +5438,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "deleted": deleted,
                 },
                 transport_options=transport_options,
+                operation="search_conversations",
+                route="/conversations/search",
             ),
         )
         return response
@@ -5104,6 +5466,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_conversation",
+                route="/conversations",
             ),
         )
         return response
@@ -5129,6 +5493,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"id": id, "fields": fields},
                 transport_options=transport_options,
+                operation="delete_conversation",
+                route="/conversations",
             ),
         )
         return response
@@ -5155,6 +5521,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Conversation,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_conversation",
+                route="/conversations/{conversation_id}",
             ),
         )
         return response
@@ -5183,6 +5551,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_conversation",
+                route="/conversations/{conversation_id}",
             ),
         )
         return response
@@ -5204,6 +5574,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ChatMessage],
                 body=body,
                 transport_options=transport_options,
+                operation="conversational_analytics_chat",
+                route="/conversational_analytics/chat",
             ),
         )
         return response
@@ -5226,6 +5598,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GoldenQuery,
                 body=body,
                 transport_options=transport_options,
+                operation="create_golden_query",
+                route="/golden_queries",
             ),
         )
         return response
@@ -5250,6 +5624,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GoldenQuery,
                 body=body,
                 transport_options=transport_options,
+                operation="update_golden_query",
+                route="/golden_queries/{golden_query_id}",
             ),
         )
         return response
@@ -5272,6 +5648,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/golden_queries/{golden_query_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_golden_query",
+                route="/golden_queries/{golden_query_id}",
             ),
         )
         return response
@@ -5303,6 +5681,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DashboardBase],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_dashboards",
+                route="/dashboards",
             ),
         )
         return response
@@ -5336,6 +5716,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard",
+                route="/dashboards",
             ),
         )
         return response
@@ -5445,6 +5827,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "not_owned_by": not_owned_by,
                 },
                 transport_options=transport_options,
+                operation="search_dashboards",
+                route="/dashboards/search",
             ),
         )
         return response
@@ -5485,6 +5869,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"raw_locale": raw_locale},
                 body=body,
                 transport_options=transport_options,
+                operation="import_lookml_dashboard",
+                route="/dashboards/{lookml_dashboard_id}/import/{space_id}",
             ),
         )
         return response
@@ -5521,6 +5907,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[int],
                 query_params={"raw_locale": raw_locale, "dashboard_ids": dashboard_ids},
                 transport_options=transport_options,
+                operation="sync_lookml_dashboard",
+                route="/dashboards/{lookml_dashboard_id}/sync",
             ),
         )
         return response
@@ -5551,6 +5939,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard",
+                route="/dashboards/{dashboard_id}",
             ),
         )
         return response
@@ -5583,6 +5973,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard",
+                route="/dashboards/{dashboard_id}",
             ),
         )
         return response
@@ -5610,6 +6002,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboards/{dashboard_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_dashboard",
+                route="/dashboards/{dashboard_id}",
             ),
         )
         return response
@@ -5633,6 +6027,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboards/aggregate_table_lookml/{dashboard_id}",
                 structure=mdls.DashboardAggregateTableLookml,
                 transport_options=transport_options,
+                operation="dashboard_aggregate_table_lookml",
+                route="/dashboards/aggregate_table_lookml/{dashboard_id}",
             ),
         )
         return response
@@ -5703,6 +6099,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "sorts": sorts,
                 },
                 transport_options=transport_options,
+                operation="search_lookml_dashboards",
+                route="/dashboards/lookml/search",
             ),
         )
         return response
@@ -5726,6 +6124,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboards/lookml/{dashboard_id}",
                 structure=mdls.DashboardLookml,
                 transport_options=transport_options,
+                operation="dashboard_lookml",
+                route="/dashboards/lookml/{dashboard_id}",
             ),
         )
         return response
@@ -5755,6 +6155,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 query_params={"folder_id": folder_id},
                 transport_options=transport_options,
+                operation="move_dashboard",
+                route="/dashboards/{dashboard_id}/move",
             ),
         )
         return response
@@ -5789,6 +6191,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="import_dashboard_from_lookml",
+                route="/dashboards/lookml",
             ),
         )
         return response
@@ -5809,6 +6213,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_from_lookml",
+                route="/dashboards/from_lookml",
             ),
         )
         return response
@@ -5841,6 +6247,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 query_params={"folder_id": folder_id},
                 transport_options=transport_options,
+                operation="copy_dashboard",
+                route="/dashboards/{dashboard_id}/copy",
             ),
         )
         return response
@@ -5864,6 +6272,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard_certification",
+                route="/dashboards/{dashboard_id}/certification",
             ),
         )
         return response
@@ -5887,6 +6297,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="update_lookml_certification",
+                route="/dashboards/lookml/{dashboard_id}/certification",
             ),
         )
         return response
@@ -5951,6 +6363,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "sorts": sorts,
                 },
                 transport_options=transport_options,
+                operation="search_dashboard_elements",
+                route="/dashboard_elements/search",
             ),
         )
         return response
@@ -5975,6 +6389,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DashboardElement,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_element",
+                route="/dashboard_elements/{dashboard_element_id}",
             ),
         )
         return response
@@ -6001,6 +6417,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard_element",
+                route="/dashboard_elements/{dashboard_element_id}",
             ),
         )
         return response
@@ -6022,6 +6440,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboard_elements/{dashboard_element_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_dashboard_element",
+                route="/dashboard_elements/{dashboard_element_id}",
             ),
         )
         return response
@@ -6046,6 +6466,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DashboardElement],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_dashboard_elements",
+                route="/dashboards/{dashboard_id}/dashboard_elements",
             ),
         )
         return response
@@ -6071,6 +6493,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields, "apply_filters": apply_filters},
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_element",
+                route="/dashboard_elements",
             ),
         )
         return response
@@ -6095,6 +6519,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DashboardFilter,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_filter",
+                route="/dashboard_filters/{dashboard_filter_id}",
             ),
         )
         return response
@@ -6121,6 +6547,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard_filter",
+                route="/dashboard_filters/{dashboard_filter_id}",
             ),
         )
         return response
@@ -6142,6 +6570,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboard_filters/{dashboard_filter_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_dashboard_filter",
+                route="/dashboard_filters/{dashboard_filter_id}",
             ),
         )
         return response
@@ -6166,6 +6596,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DashboardFilter],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_dashboard_filters",
+                route="/dashboards/{dashboard_id}/dashboard_filters",
             ),
         )
         return response
@@ -6189,6 +6621,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_filter",
+                route="/dashboard_filters",
             ),
         )
         return response
@@ -6215,6 +6649,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DashboardLayoutComponent,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_layout_component",
+                route="/dashboard_layout_components/{dashboard_layout_component_id}",
             ),
         )
         return response
@@ -6243,6 +6679,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard_layout_component",
+                route="/dashboard_layout_components/{dashboard_layout_component_id}",
             ),
         )
         return response
@@ -6267,6 +6705,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DashboardLayoutComponent],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_layout_dashboard_layout_components",
+                route="/dashboard_layouts/{dashboard_layout_id}/dashboard_layout_components",
             ),
         )
         return response
@@ -6291,6 +6731,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DashboardLayout,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_layout",
+                route="/dashboard_layouts/{dashboard_layout_id}",
             ),
         )
         return response
@@ -6317,6 +6759,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_dashboard_layout",
+                route="/dashboard_layouts/{dashboard_layout_id}",
             ),
         )
         return response
@@ -6338,6 +6782,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboard_layouts/{dashboard_layout_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_dashboard_layout",
+                route="/dashboard_layouts/{dashboard_layout_id}",
             ),
         )
         return response
@@ -6362,6 +6808,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.DashboardLayout],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="dashboard_dashboard_layouts",
+                route="/dashboards/{dashboard_id}/dashboard_layouts",
             ),
         )
         return response
@@ -6385,6 +6833,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_layout",
+                route="/dashboard_layouts",
             ),
         )
         return response
@@ -6407,6 +6857,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/dashboard_filter_state/{guid}",
                 structure=str,
                 transport_options=transport_options,
+                operation="dashboard_filter_state",
+                route="/dashboard_filter_state/{guid}",
             ),
         )
         return response
@@ -6428,6 +6880,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Dashboard,
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_filter_state",
+                route="/dashboard_filter_state",
             ),
         )
         return response
@@ -6452,6 +6906,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DataActionResponse,
                 body=body,
                 transport_options=transport_options,
+                operation="perform_data_action",
+                route="/data_actions",
             ),
         )
         return response
@@ -6472,6 +6928,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DataActionForm,
                 body=body,
                 transport_options=transport_options,
+                operation="fetch_remote_data_action_form",
+                route="/data_actions/form",
             ),
         )
         return response
@@ -6494,6 +6952,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/datagroups",
                 structure=Sequence[mdls.Datagroup],
                 transport_options=transport_options,
+                operation="all_datagroups",
+                route="/datagroups",
             ),
         )
         return response
@@ -6515,6 +6975,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/datagroups/{datagroup_id}",
                 structure=mdls.Datagroup,
                 transport_options=transport_options,
+                operation="datagroup",
+                route="/datagroups/{datagroup_id}",
             ),
         )
         return response
@@ -6538,6 +7000,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Datagroup,
                 body=body,
                 transport_options=transport_options,
+                operation="update_datagroup",
+                route="/datagroups/{datagroup_id}",
             ),
         )
         return response
@@ -6568,6 +7032,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DependencyGraph,
                 query_params={"format": format, "color": color},
                 transport_options=transport_options,
+                operation="graph_derived_tables_for_model",
+                route="/derived_table/graph/model/{model}",
             ),
         )
         return response
@@ -6594,6 +7060,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DependencyGraph,
                 query_params={"models": models, "workspace": workspace},
                 transport_options=transport_options,
+                operation="graph_derived_tables_for_view",
+                route="/derived_table/graph/view/{view}",
             ),
         )
         return response
@@ -6632,6 +7100,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "source": source,
                 },
                 transport_options=transport_options,
+                operation="start_pdt_build",
+                route="/derived_table/{model_name}/{view_name}/start",
             ),
         )
         return response
@@ -6653,6 +7123,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/derived_table/{materialization_id}/status",
                 structure=mdls.MaterializePDT,
                 transport_options=transport_options,
+                operation="check_pdt_build",
+                route="/derived_table/{materialization_id}/status",
             ),
         )
         return response
@@ -6677,6 +7149,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.MaterializePDT,
                 query_params={"source": source},
                 transport_options=transport_options,
+                operation="stop_pdt_build",
+                route="/derived_table/{materialization_id}/stop",
             ),
         )
         return response
@@ -6740,6 +7214,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "is_users_root": is_users_root,
                 },
                 transport_options=transport_options,
+                operation="search_folders",
+                route="/folders/search",
             ),
         )
         return response
@@ -6764,6 +7240,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Folder,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="folder",
+                route="/folders/{folder_id}",
             ),
         )
         return response
@@ -6787,6 +7265,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Folder,
                 body=body,
                 transport_options=transport_options,
+                operation="update_folder",
+                route="/folders/{folder_id}",
             ),
         )
         return response
@@ -6809,6 +7289,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/folders/{folder_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_folder",
+                route="/folders/{folder_id}",
             ),
         )
         return response
@@ -6832,6 +7314,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.FolderBase],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_folders",
+                route="/folders",
             ),
         )
         return response
@@ -6855,6 +7339,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Folder,
                 body=body,
                 transport_options=transport_options,
+                operation="create_folder",
+                route="/folders",
             ),
         )
         return response
@@ -6896,6 +7382,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "sorts": sorts,
                 },
                 transport_options=transport_options,
+                operation="folder_children",
+                route="/folders/{folder_id}/children",
             ),
         )
         return response
@@ -6924,6 +7412,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Folder],
                 query_params={"fields": fields, "sorts": sorts, "name": name},
                 transport_options=transport_options,
+                operation="folder_children_search",
+                route="/folders/{folder_id}/children/search",
             ),
         )
         return response
@@ -6948,6 +7438,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Folder,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="folder_parent",
+                route="/folders/{folder_id}/parent",
             ),
         )
         return response
@@ -6972,6 +7464,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Folder],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="folder_ancestors",
+                route="/folders/{folder_id}/ancestors",
             ),
         )
         return response
@@ -6997,6 +7491,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.LookWithQuery],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="folder_looks",
+                route="/folders/{folder_id}/looks",
             ),
         )
         return response
@@ -7021,6 +7517,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Dashboard],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="folder_dashboards",
+                route="/folders/{folder_id}/dashboards",
             ),
         )
         return response
@@ -7072,6 +7570,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "can_add_to_content_metadata": can_add_to_content_metadata,
                 },
                 transport_options=transport_options,
+                operation="all_groups",
+                route="/groups",
             ),
         )
         return response
@@ -7095,6 +7595,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_group",
+                route="/groups",
             ),
         )
         return response
@@ -7168,6 +7670,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "externally_orphaned": externally_orphaned,
                 },
                 transport_options=transport_options,
+                operation="search_groups",
+                route="/groups/search",
             ),
         )
         return response
@@ -7241,6 +7745,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "externally_orphaned": externally_orphaned,
                 },
                 transport_options=transport_options,
+                operation="search_groups_with_roles",
+                route="/groups/search/with_roles",
             ),
         )
         return response
@@ -7315,6 +7821,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "externally_orphaned": externally_orphaned,
                 },
                 transport_options=transport_options,
+                operation="search_groups_with_hierarchy",
+                route="/groups/search/with_hierarchy",
             ),
         )
         return response
@@ -7339,6 +7847,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Group,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="group",
+                route="/groups/{group_id}",
             ),
         )
         return response
@@ -7365,6 +7875,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_group",
+                route="/groups/{group_id}",
             ),
         )
         return response
@@ -7386,6 +7898,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/groups/{group_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_group",
+                route="/groups/{group_id}",
             ),
         )
         return response
@@ -7410,6 +7924,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Group],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_group_groups",
+                route="/groups/{group_id}/groups",
             ),
         )
         return response
@@ -7434,6 +7950,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Group,
                 body=body,
                 transport_options=transport_options,
+                operation="add_group_group",
+                route="/groups/{group_id}/groups",
             ),
         )
         return response
@@ -7475,6 +7993,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "sorts": sorts,
                 },
                 transport_options=transport_options,
+                operation="all_group_users",
+                route="/groups/{group_id}/users",
             ),
         )
         return response
@@ -7499,6 +8019,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.User,
                 body=body,
                 transport_options=transport_options,
+                operation="add_group_user",
+                route="/groups/{group_id}/users",
             ),
         )
         return response
@@ -7523,6 +8045,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/groups/{group_id}/users/{user_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="delete_group_user",
+                route="/groups/{group_id}/users/{user_id}",
             ),
         )
         return response
@@ -7547,6 +8071,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/groups/{group_id}/groups/{deleting_group_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="delete_group_from_group",
+                route="/groups/{group_id}/groups/{deleting_group_id}",
             ),
         )
         return response
@@ -7576,6 +8102,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.UserAttributeGroupValue,
                 body=body,
                 transport_options=transport_options,
+                operation="update_user_attribute_group_value",
+                route="/groups/{group_id}/attribute_values/{user_attribute_id}",
             ),
         )
         return response
@@ -7600,6 +8128,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/groups/{group_id}/attribute_values/{user_attribute_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="delete_user_attribute_group_value",
+                route="/groups/{group_id}/attribute_values/{user_attribute_id}",
             ),
         )
         return response
@@ -7625,6 +8155,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.HomepageSection],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_primary_homepage_sections",
+                route="/primary_homepage_sections",
             ),
         )
         return response
@@ -7650,6 +8182,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.IntegrationHub],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_integration_hubs",
+                route="/integration_hubs",
             ),
         )
         return response
@@ -7675,6 +8209,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_integration_hub",
+                route="/integration_hubs",
             ),
         )
         return response
@@ -7699,6 +8235,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.IntegrationHub,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="integration_hub",
+                route="/integration_hubs/{integration_hub_id}",
             ),
         )
         return response
@@ -7727,6 +8265,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_integration_hub",
+                route="/integration_hubs/{integration_hub_id}",
             ),
         )
         return response
@@ -7748,6 +8288,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/integration_hubs/{integration_hub_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_integration_hub",
+                route="/integration_hubs/{integration_hub_id}",
             ),
         )
         return response
@@ -7772,6 +8314,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.IntegrationHubHealthResult,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_integration_hub_health",
+                route="/integration_hubs/{integration_hub_id}/health",
             ),
         )
         return response
@@ -7793,6 +8337,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/integration_hubs/{integration_hub_id}/accept_legal_agreement",
                 structure=mdls.IntegrationHub,
                 transport_options=transport_options,
+                operation="accept_integration_hub_legal_agreement",
+                route="/integration_hubs/{integration_hub_id}/accept_legal_agreement",
             ),
         )
         return response
@@ -7819,6 +8365,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "integration_hub_id": integration_hub_id,
                 },
                 transport_options=transport_options,
+                operation="all_integrations",
+                route="/integrations",
             ),
         )
         return response
@@ -7843,6 +8391,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Integration,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="integration",
+                route="/integrations/{integration_id}",
             ),
         )
         return response
@@ -7869,6 +8419,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_integration",
+                route="/integrations/{integration_id}",
             ),
         )
         return response
@@ -7892,6 +8444,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.DataActionForm,
                 body=body,
                 transport_options=transport_options,
+                operation="fetch_integration_form",
+                route="/integrations/{integration_id}/form",
             ),
         )
         return response
@@ -7913,6 +8467,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/integrations/{integration_id}/test",
                 structure=mdls.IntegrationTestResult,
                 transport_options=transport_options,
+                operation="test_integration",
+                route="/integrations/{integration_id}/test",
             ),
         )
         return response
@@ -7946,6 +8502,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.KdaResponsePayload,
                 body=body,
                 transport_options=transport_options,
+                operation="run_key_driver_analysis",
+                route="/internal/kda/analyze",
             ),
         )
         return response
@@ -7977,6 +8535,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Look],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_looks",
+                route="/looks",
             ),
         )
         return response
@@ -8006,6 +8566,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_look",
+                route="/looks",
             ),
         )
         return response
@@ -8106,6 +8668,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_looks",
+                route="/looks/search",
             ),
         )
         return response
@@ -8132,6 +8696,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookWithQuery,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="look",
+                route="/looks/{look_id}",
             ),
         )
         return response
@@ -8177,6 +8743,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_look",
+                route="/looks/{look_id}",
             ),
         )
         return response
@@ -8204,6 +8772,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/looks/{look_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_look",
+                route="/looks/{look_id}",
             ),
         )
         return response
@@ -8284,6 +8854,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "server_table_calcs": server_table_calcs,
                 },
                 transport_options=transport_options,
+                operation="run_look",
+                route="/looks/{look_id}/run/{result_format}",
             ),
         )
         return response
@@ -8314,6 +8886,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookWithQuery,
                 query_params={"folder_id": folder_id},
                 transport_options=transport_options,
+                operation="copy_look",
+                route="/looks/{look_id}/copy",
             ),
         )
         return response
@@ -8343,6 +8917,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookWithQuery,
                 query_params={"folder_id": folder_id},
                 transport_options=transport_options,
+                operation="move_look",
+                route="/looks/{look_id}/move",
             ),
         )
         return response
@@ -8366,6 +8942,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Look,
                 body=body,
                 transport_options=transport_options,
+                operation="update_look_certification",
+                route="/looks/{look_id}/certification",
             ),
         )
         return response
@@ -8411,6 +8989,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "include_self_service": include_self_service,
                 },
                 transport_options=transport_options,
+                operation="all_lookml_models",
+                route="/lookml_models",
             ),
         )
         return response
@@ -8431,6 +9011,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookmlModel,
                 body=body,
                 transport_options=transport_options,
+                operation="create_lookml_model",
+                route="/lookml_models",
             ),
         )
         return response
@@ -8455,6 +9037,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookmlModel,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="lookml_model",
+                route="/lookml_models/{lookml_model_name}",
             ),
         )
         return response
@@ -8478,6 +9062,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.LookmlModel,
                 body=body,
                 transport_options=transport_options,
+                operation="update_lookml_model",
+                route="/lookml_models/{lookml_model_name}",
             ),
         )
         return response
@@ -8499,6 +9085,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/lookml_models/{lookml_model_name}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_lookml_model",
+                route="/lookml_models/{lookml_model_name}",
             ),
         )
         return response
@@ -8531,6 +9119,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "add_drills_metadata": add_drills_metadata,
                 },
                 transport_options=transport_options,
+                operation="lookml_model_explore",
+                route="/lookml_models/{lookml_model_name}/explores/{explore_name}",
             ),
         )
         return response
@@ -8585,6 +9175,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ModelFieldSuggestions,
                 query_params={"term": term, "filters": filters},
                 transport_options=transport_options,
+                operation="model_fieldname_suggestions",
+                route="/models/{model_name}/views/{view_name}/fields/{field_name}/suggestions",
             ),
         )
         return response
@@ -8606,6 +9198,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/models/{model_name}",
                 structure=mdls.Model,
                 transport_options=transport_options,
+                operation="get_model",
+                route="/models/{model_name}",
             ),
         )
         return response
@@ -8635,6 +9229,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/connections/{connection_name}/databases",
                 structure=Sequence[str],
                 transport_options=transport_options,
+                operation="connection_databases",
+                route="/connections/{connection_name}/databases",
             ),
         )
         return response
@@ -8661,6 +9257,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ConnectionFeatures,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="connection_features",
+                route="/connections/{connection_name}/features",
             ),
         )
         return response
@@ -8689,6 +9287,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Schema],
                 query_params={"database": database, "cache": cache, "fields": fields},
                 transport_options=transport_options,
+                operation="connection_schemas",
+                route="/connections/{connection_name}/schemas",
             ),
         )
         return response
@@ -8735,6 +9335,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "table_limit": table_limit,
                 },
                 transport_options=transport_options,
+                operation="connection_tables",
+                route="/connections/{connection_name}/tables",
             ),
         )
         return response
@@ -8776,6 +9378,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "fields": fields,
                 },
                 transport_options=transport_options,
+                operation="connection_columns",
+                route="/connections/{connection_name}/columns",
             ),
         )
         return response
@@ -8804,6 +9408,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ColumnSearch],
                 query_params={"column_name": column_name, "fields": fields},
                 transport_options=transport_options,
+                operation="connection_search_columns",
+                route="/connections/{connection_name}/search_columns",
             ),
         )
         return response
@@ -8835,6 +9441,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="connection_cost_estimate",
+                route="/connections/{connection_name}/cost_estimate",
             ),
         )
         return response
@@ -8868,6 +9476,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ProjectRun,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_ci_run",
+                route="/projects/{project_id}/ci/runs/{run_id}",
             ),
         )
         return response
@@ -8896,6 +9506,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_ci_run",
+                route="/projects/{project_id}/ci/run",
             ),
         )
         return response
@@ -8922,6 +9534,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_continuous_integration_run",
+                route="/projects/{project_id}/continuous_integration/runs",
             ),
         )
         return response
@@ -8949,6 +9563,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CIRun,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="get_continuous_integration_run",
+                route="/projects/{project_id}/continuous_integration/runs/{run_id}",
             ),
         )
         return response
@@ -8979,6 +9595,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="lock_all",
+                route="/projects/{project_id}/manifest/lock_all",
             ),
         )
         return response
@@ -9002,6 +9620,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git_branches",
                 structure=Sequence[mdls.GitBranch],
                 transport_options=transport_options,
+                operation="all_git_branches",
+                route="/projects/{project_id}/git_branches",
             ),
         )
         return response
@@ -9025,6 +9645,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git_branch",
                 structure=mdls.GitBranch,
                 transport_options=transport_options,
+                operation="git_branch",
+                route="/projects/{project_id}/git_branch",
             ),
         )
         return response
@@ -9056,6 +9678,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GitBranch,
                 body=body,
                 transport_options=transport_options,
+                operation="update_git_branch",
+                route="/projects/{project_id}/git_branch",
             ),
         )
         return response
@@ -9086,6 +9710,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GitBranch,
                 body=body,
                 transport_options=transport_options,
+                operation="create_git_branch",
+                route="/projects/{project_id}/git_branch",
             ),
         )
         return response
@@ -9112,6 +9738,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git_branch/{branch_name}",
                 structure=mdls.GitBranch,
                 transport_options=transport_options,
+                operation="find_git_branch",
+                route="/projects/{project_id}/git_branch/{branch_name}",
             ),
         )
         return response
@@ -9138,6 +9766,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git_branch/{branch_name}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_git_branch",
+                route="/projects/{project_id}/git_branch/{branch_name}",
             ),
         )
         return response
@@ -9172,6 +9802,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"branch": branch, "ref": ref},
                 transport_options=transport_options,
+                operation="deploy_ref_to_production",
+                route="/projects/{project_id}/deploy_ref_to_production",
             ),
         )
         return response
@@ -9203,6 +9835,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.AsyncDeployResponse,
                 query_params={"branch": branch, "ref": ref},
                 transport_options=transport_options,
+                operation="async_deploy_ref_to_production",
+                route="/projects/{project_id}/async_deploy_ref_to_production",
             ),
         )
         return response
@@ -9227,6 +9861,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/deploy_status/{deployment_id}",
                 structure=mdls.DeployStatusResponse,
                 transport_options=transport_options,
+                operation="async_deploy_status",
+                route="/projects/{project_id}/deploy_status/{deployment_id}",
             ),
         )
         return response
@@ -9259,6 +9895,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/deploy_to_production",
                 structure=str,
                 transport_options=transport_options,
+                operation="deploy_to_production",
+                route="/projects/{project_id}/deploy_to_production",
             ),
         )
         return response
@@ -9282,6 +9920,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/reset_to_production",
                 structure=str,
                 transport_options=transport_options,
+                operation="reset_project_to_production",
+                route="/projects/{project_id}/reset_to_production",
             ),
         )
         return response
@@ -9305,6 +9945,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/reset_to_remote",
                 structure=str,
                 transport_options=transport_options,
+                operation="reset_project_to_remote",
+                route="/projects/{project_id}/reset_to_remote",
             ),
         )
         return response
@@ -9328,6 +9970,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Project],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_projects",
+                route="/projects",
             ),
         )
         return response
@@ -9354,6 +9998,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Project,
                 body=body,
                 transport_options=transport_options,
+                operation="create_project",
+                route="/projects",
             ),
         )
         return response
@@ -9380,6 +10026,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Project,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="project",
+                route="/projects/{project_id}",
             ),
         )
         return response
@@ -9431,6 +10079,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_project",
+                route="/projects/{project_id}",
             ),
         )
         return response
@@ -9454,6 +10104,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/manifest",
                 structure=mdls.Manifest,
                 transport_options=transport_options,
+                operation="manifest",
+                route="/projects/{project_id}/manifest",
             ),
         )
         return response
@@ -9477,6 +10129,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git/deploy_key",
                 structure=str,
                 transport_options=transport_options,
+                operation="git_deploy_key",
+                route="/projects/{project_id}/git/deploy_key",
             ),
         )
         return response
@@ -9506,6 +10160,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git/deploy_key",
                 structure=str,
                 transport_options=transport_options,
+                operation="create_git_deploy_key",
+                route="/projects/{project_id}/git/deploy_key",
             ),
         )
         return response
@@ -9541,6 +10197,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ProjectValidationCache,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="project_validation_results",
+                route="/projects/{project_id}/validate",
             ),
         )
         return response
@@ -9573,6 +10231,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ProjectValidation,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="validate_project",
+                route="/projects/{project_id}/validate",
             ),
         )
         return response
@@ -9599,6 +10259,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ProjectWorkspace,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="project_workspace",
+                route="/projects/{project_id}/current_workspace",
             ),
         )
         return response
@@ -9625,6 +10287,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ProjectFile],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_project_files",
+                route="/projects/{project_id}/files",
             ),
         )
         return response
@@ -9653,6 +10317,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ProjectFile,
                 query_params={"file_id": file_id, "fields": fields},
                 transport_options=transport_options,
+                operation="project_file",
+                route="/projects/{project_id}/files/file",
             ),
         )
         return response
@@ -9683,6 +10349,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.GitConnectionTest],
                 query_params={"remote_url": remote_url},
                 transport_options=transport_options,
+                operation="all_git_connection_tests",
+                route="/projects/{project_id}/git_connection_tests",
             ),
         )
         return response
@@ -9721,6 +10389,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "use_production": use_production,
                 },
                 transport_options=transport_options,
+                operation="run_git_connection_test",
+                route="/projects/{project_id}/git_connection_tests/{test_id}",
             ),
         )
         return response
@@ -9749,6 +10419,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.LookmlTest],
                 query_params={"file_id": file_id},
                 transport_options=transport_options,
+                operation="all_lookml_tests",
+                route="/projects/{project_id}/lookml_tests",
             ),
         )
         return response
@@ -9779,6 +10451,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.LookmlTestResult],
                 query_params={"file_id": file_id, "test": test, "model": model},
                 transport_options=transport_options,
+                operation="run_lookml_test",
+                route="/projects/{project_id}/lookml_tests/run",
             ),
         )
         return response
@@ -9813,6 +10487,8 @@ class Looker40SDK(api_methods.APIMethods):
                 },
                 body=body,
                 transport_options=transport_options,
+                operation="tag_ref",
+                route="/projects/{project_id}/tag",
             ),
         )
         return response
@@ -9836,6 +10512,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GitDiagnosticReport,
                 body=body,
                 transport_options=transport_options,
+                operation="create_git_diagnostic_report",
+                route="/projects/{project_id}/git_diagnostic_report",
             ),
         )
         return response
@@ -9860,6 +10538,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{project_id}/git_diagnostic_report/{report_id}",
                 structure=mdls.GitDiagnosticReport,
                 transport_options=transport_options,
+                operation="get_git_diagnostic_report",
+                route="/projects/{project_id}/git_diagnostic_report/{report_id}",
             ),
         )
         return response
@@ -9886,6 +10566,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.GitDiagnosticReport,
                 body=body,
                 transport_options=transport_options,
+                operation="repair_git_diagnostic_report",
+                route="/projects/{project_id}/git_diagnostic_report/{report_id}/repair",
             ),
         )
         return response
@@ -9917,6 +10599,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.RepositoryCredential,
                 body=body,
                 transport_options=transport_options,
+                operation="update_repository_credential",
+                route="/projects/{root_project_id}/credential/{credential_id}",
             ),
         )
         return response
@@ -9946,6 +10630,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{root_project_id}/credential/{credential_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_repository_credential",
+                route="/projects/{root_project_id}/credential/{credential_id}",
             ),
         )
         return response
@@ -9969,6 +10655,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/projects/{root_project_id}/credentials",
                 structure=Sequence[mdls.RepositoryCredential],
                 transport_options=transport_options,
+                operation="get_all_repository_credentials",
+                route="/projects/{root_project_id}/credentials",
             ),
         )
         return response
@@ -10033,6 +10721,8 @@ class Looker40SDK(api_methods.APIMethods):
                 },
                 body=body,
                 transport_options=transport_options,
+                operation="create_query_task",
+                route="/query_tasks",
             ),
         )
         return response
@@ -10060,6 +10750,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=MutableMapping[str, Any],
                 query_params={"query_task_ids": query_task_ids},
                 transport_options=transport_options,
+                operation="query_task_multi_results",
+                route="/query_tasks/multi_results",
             ),
         )
         return response
@@ -10090,6 +10782,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.QueryTask,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="query_task",
+                route="/query_tasks/{query_task_id}",
             ),
         )
         return response
@@ -10133,6 +10827,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/query_tasks/{query_task_id}/results",
                 structure=str,
                 transport_options=transport_options,
+                operation="query_task_results",
+                route="/query_tasks/{query_task_id}/results",
             ),
         )
         return response
@@ -10173,6 +10869,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Query,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="query",
+                route="/queries/{query_id}",
             ),
         )
         return response
@@ -10213,6 +10911,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Query,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="query_for_slug",
+                route="/queries/slug/{slug}",
             ),
         )
         return response
@@ -10243,6 +10943,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_query",
+                route="/queries",
             ),
         )
         return response
@@ -10326,6 +11028,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "server_table_calcs": server_table_calcs,
                 },
                 transport_options=transport_options,
+                operation="run_query",
+                route="/queries/{query_id}/run/{result_format}",
             ),
         )
         return response
@@ -10437,6 +11141,8 @@ class Looker40SDK(api_methods.APIMethods):
                 },
                 body=body,
                 transport_options=transport_options,
+                operation="run_inline_query",
+                route="/queries/run/{result_format}",
             ),
         )
         return response
@@ -10516,6 +11222,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/queries/models/{model_name}/views/{view_name}/run/{result_format}",
                 structure=Union[str, bytes],  # type: ignore
                 transport_options=transport_options,
+                operation="run_url_encoded_query",
+                route="/queries/models/{model_name}/views/{view_name}/run/{result_format}",
             ),
         )
         return response
@@ -10542,6 +11250,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.MergeQuery,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="merge_query",
+                route="/merge_queries/{merge_query_id}",
             ),
         )
         return response
@@ -10581,6 +11291,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_merge_query",
+                route="/merge_queries",
             ),
         )
         return response
@@ -10599,6 +11311,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/running_queries",
                 structure=Sequence[mdls.RunningQueries],
                 transport_options=transport_options,
+                operation="all_running_queries",
+                route="/running_queries",
             ),
         )
         return response
@@ -10620,6 +11334,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/running_queries/{query_task_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="kill_query",
+                route="/running_queries/{query_task_id}",
             ),
         )
         return response
@@ -10642,6 +11358,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SqlQuery,
                 body=body,
                 transport_options=transport_options,
+                operation="create_sql_query",
+                route="/sql_queries",
             ),
         )
         return response
@@ -10663,6 +11381,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/sql_queries/{slug}",
                 structure=mdls.SqlQuery,
                 transport_options=transport_options,
+                operation="sql_query",
+                route="/sql_queries/{slug}",
             ),
         )
         return response
@@ -10690,6 +11410,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=str,
                 query_params={"download": download},
                 transport_options=transport_options,
+                operation="run_sql_query",
+                route="/sql_queries/{slug}/run/{result_format}",
             ),
         )
         return response
@@ -10729,6 +11451,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.RenderTask,
                 query_params={"width": width, "height": height, "fields": fields},
                 transport_options=transport_options,
+                operation="create_look_render_task",
+                route="/render_tasks/looks/{look_id}/{result_format}",
             ),
         )
         return response
@@ -10764,6 +11488,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.RenderTask,
                 query_params={"width": width, "height": height, "fields": fields},
                 transport_options=transport_options,
+                operation="create_query_render_task",
+                route="/render_tasks/queries/{query_id}/{result_format}",
             ),
         )
         return response
@@ -10817,6 +11543,8 @@ class Looker40SDK(api_methods.APIMethods):
                 },
                 body=body,
                 transport_options=transport_options,
+                operation="create_dashboard_render_task",
+                route="/render_tasks/dashboards/{dashboard_id}/{result_format}",
             ),
         )
         return response
@@ -10845,6 +11573,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.RenderTask,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="render_task",
+                route="/render_tasks/{render_task_id}",
             ),
         )
         return response
@@ -10882,6 +11612,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/render_tasks/{render_task_id}/results",
                 structure=bytes,
                 transport_options=transport_options,
+                operation="render_task_results",
+                route="/render_tasks/{render_task_id}/results",
             ),
         )
         return response
@@ -10917,6 +11649,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.RenderTask,
                 query_params={"width": width, "height": height, "fields": fields},
                 transport_options=transport_options,
+                operation="create_dashboard_element_render_task",
+                route="/render_tasks/dashboard_elements/{dashboard_element_id}/{result_format}",
             ),
         )
         return response
@@ -10991,6 +11725,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "next_page_token": next_page_token,
                 },
                 transport_options=transport_options,
+                operation="search_reports",
+                route="/reports/search",
             ),
         )
         return response
@@ -11066,6 +11802,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "models": models,
                 },
                 transport_options=transport_options,
+                operation="search_model_sets",
+                route="/model_sets/search",
             ),
         )
         return response
@@ -11090,6 +11828,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ModelSet,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="model_set",
+                route="/model_sets/{model_set_id}",
             ),
         )
         return response
@@ -11113,6 +11853,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ModelSet,
                 body=body,
                 transport_options=transport_options,
+                operation="update_model_set",
+                route="/model_sets/{model_set_id}",
             ),
         )
         return response
@@ -11134,6 +11876,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/model_sets/{model_set_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_model_set",
+                route="/model_sets/{model_set_id}",
             ),
         )
         return response
@@ -11155,6 +11899,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ModelSet],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_model_sets",
+                route="/model_sets",
             ),
         )
         return response
@@ -11175,6 +11921,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ModelSet,
                 body=body,
                 transport_options=transport_options,
+                operation="create_model_set",
+                route="/model_sets",
             ),
         )
         return response
@@ -11193,6 +11941,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/permissions",
                 structure=Sequence[mdls.Permission],
                 transport_options=transport_options,
+                operation="all_permissions",
+                route="/permissions",
             ),
         )
         return response
@@ -11264,6 +12014,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "permissions": permissions,
                 },
                 transport_options=transport_options,
+                operation="search_permission_sets",
+                route="/permission_sets/search",
             ),
         )
         return response
@@ -11288,6 +12040,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.PermissionSet,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="permission_set",
+                route="/permission_sets/{permission_set_id}",
             ),
         )
         return response
@@ -11312,6 +12066,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.PermissionSet,
                 body=body,
                 transport_options=transport_options,
+                operation="update_permission_set",
+                route="/permission_sets/{permission_set_id}",
             ),
         )
         return response
@@ -11333,6 +12089,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/permission_sets/{permission_set_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_permission_set",
+                route="/permission_sets/{permission_set_id}",
             ),
         )
         return response
@@ -11354,6 +12112,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.PermissionSet],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_permission_sets",
+                route="/permission_sets",
             ),
         )
         return response
@@ -11375,6 +12135,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.PermissionSet,
                 body=body,
                 transport_options=transport_options,
+                operation="create_permission_set",
+                route="/permission_sets",
             ),
         )
         return response
@@ -11404,6 +12166,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "get_all_support_roles": get_all_support_roles,
                 },
                 transport_options=transport_options,
+                operation="all_roles",
+                route="/roles",
             ),
         )
         return response
@@ -11424,6 +12188,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Role,
                 body=body,
                 transport_options=transport_options,
+                operation="create_role",
+                route="/roles",
             ),
         )
         return response
@@ -11497,6 +12263,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_roles",
+                route="/roles/search",
             ),
         )
         return response
@@ -11565,6 +12333,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_roles_with_user_count",
+                route="/roles/search/with_user_count",
             ),
         )
         return response
@@ -11586,6 +12356,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/roles/{role_id}",
                 structure=mdls.Role,
                 transport_options=transport_options,
+                operation="role",
+                route="/roles/{role_id}",
             ),
         )
         return response
@@ -11609,6 +12381,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Role,
                 body=body,
                 transport_options=transport_options,
+                operation="update_role",
+                route="/roles/{role_id}",
             ),
         )
         return response
@@ -11630,6 +12404,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/roles/{role_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_role",
+                route="/roles/{role_id}",
             ),
         )
         return response
@@ -11654,6 +12430,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Group],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="role_groups",
+                route="/roles/{role_id}/groups",
             ),
         )
         return response
@@ -11679,6 +12457,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Group],
                 body=body,
                 transport_options=transport_options,
+                operation="set_role_groups",
+                route="/roles/{role_id}/groups",
             ),
         )
         return response
@@ -11708,6 +12488,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "direct_association_only": direct_association_only,
                 },
                 transport_options=transport_options,
+                operation="role_users",
+                route="/roles/{role_id}/users",
             ),
         )
         return response
@@ -11731,6 +12513,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.User],
                 body=body,
                 transport_options=transport_options,
+                operation="set_role_users",
+                route="/roles/{role_id}/users",
             ),
         )
         return response
@@ -11761,6 +12545,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.ScheduledPlan],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="scheduled_plans_for_space",
+                route="/scheduled_plans/space/{space_id}",
             ),
         )
         return response
@@ -11787,6 +12573,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ScheduledPlan,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="scheduled_plan",
+                route="/scheduled_plans/{scheduled_plan_id}",
             ),
         )
         return response
@@ -11851,6 +12639,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ScheduledPlan,
                 body=body,
                 transport_options=transport_options,
+                operation="update_scheduled_plan",
+                route="/scheduled_plans/{scheduled_plan_id}",
             ),
         )
         return response
@@ -11876,6 +12666,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/scheduled_plans/{scheduled_plan_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_scheduled_plan",
+                route="/scheduled_plans/{scheduled_plan_id}",
             ),
         )
         return response
@@ -11915,6 +12707,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "all_users": all_users,
                 },
                 transport_options=transport_options,
+                operation="all_scheduled_plans",
+                route="/scheduled_plans",
             ),
         )
         return response
@@ -11992,6 +12786,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ScheduledPlan,
                 body=body,
                 transport_options=transport_options,
+                operation="create_scheduled_plan",
+                route="/scheduled_plans",
             ),
         )
         return response
@@ -12048,6 +12844,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ScheduledPlan,
                 body=body,
                 transport_options=transport_options,
+                operation="scheduled_plan_run_once",
+                route="/scheduled_plans/run_once",
             ),
         )
         return response
@@ -12126,6 +12924,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_scheduled_plans",
+                route="/scheduled_plans/search",
             ),
         )
         return response
@@ -12168,6 +12968,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "all_users": all_users,
                 },
                 transport_options=transport_options,
+                operation="scheduled_plans_for_look",
+                route="/scheduled_plans/look/{look_id}",
             ),
         )
         return response
@@ -12210,6 +13012,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "fields": fields,
                 },
                 transport_options=transport_options,
+                operation="scheduled_plans_for_dashboard",
+                route="/scheduled_plans/dashboard/{dashboard_id}",
             ),
         )
         return response
@@ -12252,6 +13056,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "all_users": all_users,
                 },
                 transport_options=transport_options,
+                operation="scheduled_plans_for_lookml_dashboard",
+                route="/scheduled_plans/lookml_dashboard/{lookml_dashboard_id}",
             ),
         )
         return response
@@ -12321,6 +13127,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ScheduledPlan,
                 body=body,
                 transport_options=transport_options,
+                operation="scheduled_plan_run_once_by_id",
+                route="/scheduled_plans/{scheduled_plan_id}/run_once",
             ),
         )
         return response
@@ -12349,6 +13157,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[str],
                 query_params={"google_sheets": google_sheets},
                 transport_options=transport_options,
+                operation="get_self_service_model_allowed_connections",
+                route="/self_service_models/allowed_connections",
             ),
         )
         return response
@@ -12370,6 +13180,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/self_service_models/{model_name}/lookml",
                 structure=str,
                 transport_options=transport_options,
+                operation="get_self_service_model_lookml",
+                route="/self_service_models/{model_name}/lookml",
             ),
         )
         return response
@@ -12393,6 +13205,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Certification,
                 body=body,
                 transport_options=transport_options,
+                operation="update_self_service_explore_certification",
+                route="/self_service_models/{model_name}/certification",
             ),
         )
         return response
@@ -12417,6 +13231,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/session",
                 structure=mdls.ApiSession,
                 transport_options=transport_options,
+                operation="session",
+                route="/session",
             ),
         )
         return response
@@ -12456,6 +13272,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ApiSession,
                 body=body,
                 transport_options=transport_options,
+                operation="update_session",
+                route="/session",
             ),
         )
         return response
@@ -12481,6 +13299,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SqlInterfaceQueryMetadata,
                 query_params={"avatica_request": avatica_request},
                 transport_options=transport_options,
+                operation="sql_interface_metadata",
+                route="/sql_interface_queries/metadata",
             ),
         )
         return response
@@ -12514,6 +13334,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/sql_interface_queries/{query_id}/run/{result_format}",
                 structure=mdls.JsonBi,
                 transport_options=transport_options,
+                operation="run_sql_interface_query",
+                route="/sql_interface_queries/{query_id}/run/{result_format}",
             ),
         )
         return response
@@ -12541,6 +13363,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.SqlInterfaceQuery,
                 body=body,
                 transport_options=transport_options,
+                operation="create_sql_interface_query",
+                route="/sql_interface_queries",
             ),
         )
         return response
@@ -12572,6 +13396,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Theme],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_themes",
+                route="/themes",
             ),
         )
         return response
@@ -12606,6 +13432,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 body=body,
                 transport_options=transport_options,
+                operation="create_theme",
+                route="/themes",
             ),
         )
         return response
@@ -12693,6 +13521,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "theme_type": theme_type,
                 },
                 transport_options=transport_options,
+                operation="search_themes",
+                route="/themes/search",
             ),
         )
         return response
@@ -12722,6 +13552,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"ts": ts},
                 transport_options=transport_options,
+                operation="default_theme",
+                route="/themes/default",
             ),
         )
         return response
@@ -12755,6 +13587,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"name": name},
                 transport_options=transport_options,
+                operation="set_default_theme",
+                route="/themes/default",
             ),
         )
         return response
@@ -12786,6 +13620,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"ts": ts, "theme_type": theme_type},
                 transport_options=transport_options,
+                operation="default_theme_by_type",
+                route="/themes/default_theme",
             ),
         )
         return response
@@ -12819,6 +13655,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"name": name, "theme_type": theme_type},
                 transport_options=transport_options,
+                operation="set_default_theme_by_type",
+                route="/themes/default_theme",
             ),
         )
         return response
@@ -12859,6 +13697,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "fields": fields,
                 },
                 transport_options=transport_options,
+                operation="active_themes",
+                route="/themes/active",
             ),
         )
         return response
@@ -12887,6 +13727,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"name": name, "ts": ts},
                 transport_options=transport_options,
+                operation="theme_or_default",
+                route="/themes/theme_or_default",
             ),
         )
         return response
@@ -12913,6 +13755,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.ValidationError,
                 body=body,
                 transport_options=transport_options,
+                operation="validate_theme",
+                route="/themes/validate",
             ),
         )
         return response
@@ -12941,6 +13785,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="theme",
+                route="/themes/{theme_id}",
             ),
         )
         return response
@@ -12966,6 +13812,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Theme,
                 body=body,
                 transport_options=transport_options,
+                operation="update_theme",
+                route="/themes/{theme_id}",
             ),
         )
         return response
@@ -12995,6 +13843,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/themes/{theme_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_theme",
+                route="/themes/{theme_id}",
             ),
         )
         return response
@@ -13069,6 +13919,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "filter_or": filter_or,
                 },
                 transport_options=transport_options,
+                operation="search_credentials_email",
+                route="/credentials_email/search",
             ),
         )
         return response
@@ -13090,6 +13942,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.User,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="me",
+                route="/user",
             ),
         )
         return response
@@ -13131,6 +13985,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "ids": ids,
                 },
                 transport_options=transport_options,
+                operation="all_users",
+                route="/users",
             ),
         )
         return response
@@ -13154,6 +14010,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_user",
+                route="/users",
             ),
         )
         return response
@@ -13260,6 +14118,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "is_service_account": is_service_account,
                 },
                 transport_options=transport_options,
+                operation="search_users",
+                route="/users/search",
             ),
         )
         return response
@@ -13324,6 +14184,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "is_disabled": is_disabled,
                 },
                 transport_options=transport_options,
+                operation="search_users_names",
+                route="/users/search/names/{pattern}",
             ),
         )
         return response
@@ -13352,6 +14214,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.User,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user",
+                route="/users/{user_id}",
             ),
         )
         return response
@@ -13378,6 +14242,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_user",
+                route="/users/{user_id}",
             ),
         )
         return response
@@ -13413,6 +14279,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user",
+                route="/users/{user_id}",
             ),
         )
         return response
@@ -13469,6 +14337,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.User,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_for_credential",
+                route="/users/credential/{credential_type}/{credential_id}",
             ),
         )
         return response
@@ -13497,6 +14367,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_service_account",
+                route="/users/service_accounts/{user_id}",
             ),
         )
         return response
@@ -13528,6 +14400,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/service_accounts/{user_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_service_account",
+                route="/users/service_accounts/{user_id}",
             ),
         )
         return response
@@ -13554,6 +14428,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsEmail,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_email",
+                route="/users/{user_id}/credentials_email",
             ),
         )
         return response
@@ -13582,6 +14458,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_user_credentials_email",
+                route="/users/{user_id}/credentials_email",
             ),
         )
         return response
@@ -13610,6 +14488,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_user_credentials_email",
+                route="/users/{user_id}/credentials_email",
             ),
         )
         return response
@@ -13633,6 +14513,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_email",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_email",
+                route="/users/{user_id}/credentials_email",
             ),
         )
         return response
@@ -13659,6 +14541,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsTotp,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_totp",
+                route="/users/{user_id}/credentials_totp",
             ),
         )
         return response
@@ -13688,6 +14572,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_user_credentials_totp",
+                route="/users/{user_id}/credentials_totp",
             ),
         )
         return response
@@ -13711,6 +14597,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_totp",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_totp",
+                route="/users/{user_id}/credentials_totp",
             ),
         )
         return response
@@ -13737,6 +14625,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsLDAP,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_ldap",
+                route="/users/{user_id}/credentials_ldap",
             ),
         )
         return response
@@ -13760,6 +14650,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_ldap",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_ldap",
+                route="/users/{user_id}/credentials_ldap",
             ),
         )
         return response
@@ -13784,6 +14676,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsGoogle,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_google",
+                route="/users/{user_id}/credentials_google",
             ),
         )
         return response
@@ -13805,6 +14699,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_google",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_google",
+                route="/users/{user_id}/credentials_google",
             ),
         )
         return response
@@ -13829,6 +14725,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsSaml,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_saml",
+                route="/users/{user_id}/credentials_saml",
             ),
         )
         return response
@@ -13850,6 +14748,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_saml",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_saml",
+                route="/users/{user_id}/credentials_saml",
             ),
         )
         return response
@@ -13874,6 +14774,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsOIDC,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_oidc",
+                route="/users/{user_id}/credentials_oidc",
             ),
         )
         return response
@@ -13895,6 +14797,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_oidc",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_oidc",
+                route="/users/{user_id}/credentials_oidc",
             ),
         )
         return response
@@ -13922,6 +14826,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsApi3,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_api3",
+                route="/users/{user_id}/credentials_api3/{credentials_api3_id}",
             ),
         )
         return response
@@ -13951,6 +14857,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_user_credentials_api3",
+                route="/users/{user_id}/credentials_api3/{credentials_api3_id}",
             ),
         )
         return response
@@ -13975,6 +14883,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_api3/{credentials_api3_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_api3",
+                route="/users/{user_id}/credentials_api3/{credentials_api3_id}",
             ),
         )
         return response
@@ -13999,6 +14909,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.CredentialsApi3],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_user_credentials_api3s",
+                route="/users/{user_id}/credentials_api3",
             ),
         )
         return response
@@ -14023,6 +14935,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CreateCredentialsApi3,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="create_user_credentials_api3",
+                route="/users/{user_id}/credentials_api3",
             ),
         )
         return response
@@ -14052,6 +14966,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsEmbed,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_embed",
+                route="/users/{user_id}/credentials_embed/{credentials_embed_id}",
             ),
         )
         return response
@@ -14078,6 +14994,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_embed/{credentials_embed_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_embed",
+                route="/users/{user_id}/credentials_embed/{credentials_embed_id}",
             ),
         )
         return response
@@ -14104,6 +15022,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.CredentialsEmbed],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_user_credentials_embeds",
+                route="/users/{user_id}/credentials_embed",
             ),
         )
         return response
@@ -14130,6 +15050,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsLookerOpenid,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_credentials_looker_openid",
+                route="/users/{user_id}/credentials_looker_openid",
             ),
         )
         return response
@@ -14153,6 +15075,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/credentials_looker_openid",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_credentials_looker_openid",
+                route="/users/{user_id}/credentials_looker_openid",
             ),
         )
         return response
@@ -14180,6 +15104,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.Session,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_session",
+                route="/users/{user_id}/sessions/{session_id}",
             ),
         )
         return response
@@ -14204,6 +15130,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/sessions/{session_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_session",
+                route="/users/{user_id}/sessions/{session_id}",
             ),
         )
         return response
@@ -14228,6 +15156,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.Session],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_user_sessions",
+                route="/users/{user_id}/sessions",
             ),
         )
         return response
@@ -14264,6 +15194,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsEmail,
                 query_params={"expires": expires, "fields": fields},
                 transport_options=transport_options,
+                operation="create_user_credentials_email_password_reset",
+                route="/users/{user_id}/credentials_email/password_reset",
             ),
         )
         return response
@@ -14293,6 +15225,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "direct_association_only": direct_association_only,
                 },
                 transport_options=transport_options,
+                operation="user_roles",
+                route="/users/{user_id}/roles",
             ),
         )
         return response
@@ -14319,6 +15253,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="set_user_roles",
+                route="/users/{user_id}/roles",
             ),
         )
         return response
@@ -14369,6 +15305,8 @@ class Looker40SDK(api_methods.APIMethods):
                     "include_unset": include_unset,
                 },
                 transport_options=transport_options,
+                operation="user_attribute_user_values",
+                route="/users/{user_id}/attribute_values",
             ),
         )
         return response
@@ -14397,6 +15335,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.UserAttributeWithValue,
                 body=body,
                 transport_options=transport_options,
+                operation="set_user_attribute_user_value",
+                route="/users/{user_id}/attribute_values/{user_attribute_id}",
             ),
         )
         return response
@@ -14426,6 +15366,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/users/{user_id}/attribute_values/{user_attribute_id}",
                 structure=None,
                 transport_options=transport_options,
+                operation="delete_user_attribute_user_value",
+                route="/users/{user_id}/attribute_values/{user_attribute_id}",
             ),
         )
         return response
@@ -14458,6 +15400,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.CredentialsEmail,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="send_user_credentials_email_password_reset",
+                route="/users/{user_id}/credentials_email/send_password_reset",
             ),
         )
         return response
@@ -14492,6 +15436,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="wipeout_user_emails",
+                route="/users/{user_id}/update_emails",
             ),
         )
         return response
@@ -14514,6 +15460,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.UserPublic,
                 body=body,
                 transport_options=transport_options,
+                operation="create_embed_user",
+                route="/users/embed_user",
             ),
         )
         return response
@@ -14537,6 +15485,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_service_account",
+                route="/users/service_accounts",
             ),
         )
         return response
@@ -14564,6 +15514,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.UserAttribute],
                 query_params={"fields": fields, "sorts": sorts},
                 transport_options=transport_options,
+                operation="all_user_attributes",
+                route="/user_attributes",
             ),
         )
         return response
@@ -14596,6 +15548,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="create_user_attribute",
+                route="/user_attributes",
             ),
         )
         return response
@@ -14620,6 +15574,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=mdls.UserAttribute,
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="user_attribute",
+                route="/user_attributes/{user_attribute_id}",
             ),
         )
         return response
@@ -14646,6 +15602,8 @@ class Looker40SDK(api_methods.APIMethods):
                 query_params={"fields": fields},
                 body=body,
                 transport_options=transport_options,
+                operation="update_user_attribute",
+                route="/user_attributes/{user_attribute_id}",
             ),
         )
         return response
@@ -14667,6 +15625,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/user_attributes/{user_attribute_id}",
                 structure=str,
                 transport_options=transport_options,
+                operation="delete_user_attribute",
+                route="/user_attributes/{user_attribute_id}",
             ),
         )
         return response
@@ -14697,6 +15657,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.UserAttributeGroupValue],
                 query_params={"fields": fields},
                 transport_options=transport_options,
+                operation="all_user_attribute_group_values",
+                route="/user_attributes/{user_attribute_id}/group_values",
             ),
         )
         return response
@@ -14739,6 +15701,8 @@ class Looker40SDK(api_methods.APIMethods):
                 structure=Sequence[mdls.UserAttributeGroupValue],
                 body=body,
                 transport_options=transport_options,
+                operation="set_user_attribute_group_values",
+                route="/user_attributes/{user_attribute_id}/group_values",
             ),
         )
         return response
@@ -14763,6 +15727,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path="/workspaces",
                 structure=Sequence[mdls.Workspace],
                 transport_options=transport_options,
+                operation="all_workspaces",
+                route="/workspaces",
             ),
         )
         return response
@@ -14812,6 +15778,8 @@ class Looker40SDK(api_methods.APIMethods):
                 path=f"/workspaces/{workspace_id}",
                 structure=mdls.Workspace,
                 transport_options=transport_options,
+                operation="workspace",
+                route="/workspaces/{workspace_id}",
             ),
         )
         return response
@@ -14819,4 +15787,8 @@ class Looker40SDK(api_methods.APIMethods):
     # endregion
 
 
+class AsyncLooker40SDK(Looker40SDK, api_methods.AsyncAPIMethods):
+    """Looker40SDK for use with an AsyncTransport: every method returns an awaitable"""
+
+
 LookerSDK = Looker40SDK
@@ -20595,11 +20595,11 @@ class WriteWhitelabelConfiguration(model.Model):
 
 import functools  # noqa:E402
 
-forward_ref_structure_hook = functools.partial(
-    sr.forward_ref_structure_hook, globals(), sr.converter40
+forward_ref_structure_hook_factory = functools.partial(
+    sr.forward_ref_structure_hook_factory, globals(), sr.converter40
 )
-sr.converter40.register_structure_hook_func(
-    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook
+sr.converter40.register_structure_hook_factory(
+    lambda t: t.__class__ is ForwardRef, forward_ref_structure_hook_factory
 )
 translate_keys_structure_hook = functools.partial(
     sr.translate_keys_structure_hook, sr.converter40
@@ -33,25 +33,36 @@ VERSION = version["__version__"]
 REQUIRES = [
     "requests >= 2.22",
     "typing-extensions >= 4.1.1",
-    # Python 3.7+
-    "attrs >= 20.1.0;python_version>='3.7'",
-    "cattrs >= 1.3;python_version>='3.7'",
+    "attrs >= 20.1.0",
+    # cattrs.cols, which needs python 3.8+
+    "cattrs >= 24.1",
 ]
+EXTRAS_REQUIRE = {
+    "async": ["httpx >= 0.23"],
+    "http2": ["httpx[http2] >= 0.23"],
+    "keyring": ["keyring"],
+    "otel": ["opentelemetry-api"],
+    "arrow": ["pyarrow"],
+    "orjson": ["orjson >= 3"],
+    "numpy": ["numpy"],
+    "pandas": ["pandas"],
+}
 
 
 setup(
     author="Looker Data Sciences, Inc.",
     description="Looker REST API",
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     license="MIT",
     long_description=open("README.rst").read(),
     long_description_content_type="text/x-rst",
     keywords=["Looker", "Looker API", "looker_sdk", "Looker API 4.0"],
     name=NAME,
     package_data={"looker_sdk": ["py.typed", "looker_sdk/looker-sample.ini"]},
-    packages=find_packages(exclude=("tests",)),
+    packages=find_packages(exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")),
     # restrict python to <=3.9.9 due to https://github.com/looker-open-source/sdk-codegen/issues/944
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     url="https://pypi.python.org/pypi/looker_sdk",
     version=VERSION,
 )
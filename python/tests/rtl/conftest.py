@@ -0,0 +1,136 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Fakes and factories shared by the runtime tests"""
+from typing import Any, Optional, Type
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import api_settings
+from looker_sdk.rtl import auth_session
+from looker_sdk.rtl import serialize
+from looker_sdk.rtl import transport
+from looker_sdk.sdk import constants
+from looker_sdk.sdk.api40 import methods
+
+LOGIN = b'{"access_token": "token", "expires_in": 3600}'
+
+
+def response(
+    status_code: Optional[int] = 200,
+    value: bytes = b"",
+    headers: Any = None,
+    exception: Optional[BaseException] = None,
+    sent: bool = True,
+) -> transport.Response:
+    """A string response, failed when status_code is None or an error"""
+    return transport.Response(
+        ok=status_code is not None and status_code < 400,
+        value=value,
+        response_mode=transport.ResponseMode.STRING,
+        status_code=status_code,
+        headers=headers,
+        exception=exception,
+        sent=sent,
+    )
+
+
+def chunked(data: bytes, size: int = 3):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class NoAuth(auth_session.AuthSession):
+    def authenticate(self, transport_options):
+        return {}
+
+
+class NoAsyncAuth(auth_session.AsyncAuthSession):
+    async def authenticate(self, transport_options):
+        return {}
+
+
+class FakeTransport(transport.Transport):
+    """Answers /login with login_value and every other request with
+    respond()
+    """
+
+    login_value = LOGIN
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        if path.endswith("/login"):
+            return self.login(transport_options)
+        return self.respond(
+            method, path, query_params, body, authenticator, transport_options
+        )
+
+    def login(self, transport_options):
+        return response(
+            value=self.login_value,
+            headers={"Content-Type": "application/json"},
+        )
+
+    def respond(
+        self, method, path, query_params, body, authenticator, transport_options
+    ):
+        raise NotImplementedError
+
+
+def sdk(
+    fake: Any,
+    api: Type[Any] = methods.Looker40SDK,
+    auth: Type[Any] = auth_session.AuthSession,
+) -> Any:
+    """An SDK of class api whose auth and requests go through fake
+
+    e.g. sdk(fake, api_methods.AsyncAPIMethods, NoAsyncAuth)
+    """
+    settings = api_settings.ApiSettings(
+        filename="../looker.ini", env_prefix=constants.environment_prefix
+    )
+    return api(
+        auth(settings, fake, serialize.deserialize40, "4.0"),
+        serialize.deserialize40,
+        serialize.serialize40,
+        fake,
+        "4.0",
+    )
+
+
+@pytest.fixture
+def stdlib_json():
+    """Expected payloads written in json.dumps format, whatever the codec"""
+    previous = serialize.json_codec()
+    serialize.set_json_codec("json")
+    yield
+    serialize.set_json_codec(previous)
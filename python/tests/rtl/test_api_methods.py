@@ -20,8 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import asyncio
 import datetime
+import functools
 import json
+import re
 from typing import MutableMapping, Optional, Union
 
 import pytest  # type: ignore
@@ -34,9 +37,13 @@ from looker_sdk.rtl import requests_transport
 from looker_sdk.rtl import serialize
 from looker_sdk.rtl import transport
 from looker_sdk.sdk import constants
+from looker_sdk.sdk.api40 import methods
 from looker_sdk.sdk.api40 import models
 
 
+pytestmark = pytest.mark.usefixtures("stdlib_json")
+
+
 @pytest.fixture(scope="module")
 def api() -> api_methods.APIMethods:
     settings = api_settings.ApiSettings(
@@ -188,6 +195,53 @@ def test_return(
     assert actual == expected
 
 
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_return_deserializes_bytes(api, codec, encoding):
+    pytest.importorskip(codec)
+    serialize.set_json_codec(codec)
+    actual = api._return(
+        transport.Response(
+            ok=True,
+            value='{"id": "1", "first_name": "Zoë"}'.encode(encoding),
+            response_mode=transport.ResponseMode.STRING,
+            encoding=encoding,
+        ),
+        models.User,
+    )
+    assert actual == models.User(id="1", first_name="Zoë")
+
+
+def test_return_passes_through_response_stream(api):
+    stream = transport.ResponseStream(iter([b"a,b\n"]))
+    actual = api._return(
+        transport.Response(
+            ok=True,
+            value=b"",
+            response_mode=transport.ResponseMode.STRING,
+            stream=stream,
+            status_code=202,
+            headers={"Retry-After": "5"},
+        ),
+        Union[str, bytes],
+    )
+    assert actual is stream
+    assert stream.status_code == 202
+    assert stream.headers == {"Retry-After": "5"}
+
+
+def test_stream_requires_a_response_body(api):
+    def no_body(transport_options=None):
+        assert transport_options == {"stream": True, "timeout": 5}
+        return None
+
+    with pytest.raises(error.SDKError, match="no_body"):
+        api.stream(no_body, transport_options={"timeout": 5})
+    # partials and other callables have no __name__
+    with pytest.raises(error.SDKError, match="functools.partial"):
+        api.stream(functools.partial(no_body), transport_options={"timeout": 5})
+
+
 def test_return_raises_an_SDKError_for_bad_responses(api):
     with pytest.raises(error.SDKError) as exc:
         api._return(
@@ -214,3 +268,83 @@ def test_api_versioned_url_is_built_properly(
     api: api_methods.APIMethods, method_path: str, expected_url: str
 ):
     assert api._path(method_path).endswith(expected_url)
+
+
+class FakeAsyncTransport(transport.AsyncTransport):
+    """Serves a canned /login and records every API request"""
+
+    def __init__(self, value: bytes):
+        self.value = value
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls(b"")
+
+    async def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        if path.endswith("/login"):
+            value = b'{"access_token": "token", "expires_in": 3600}'
+        else:
+            headers = await authenticator(transport_options or {})
+            self.requests.append((method, path, query_params, body, headers))
+            value = self.value
+        return transport.Response(
+            ok=True, value=value, response_mode=transport.ResponseMode.STRING
+        )
+
+
+def test_async_sdk_methods_are_awaitable():
+    settings = api_settings.ApiSettings(
+        filename="../looker.ini", env_prefix=constants.environment_prefix
+    )
+    fake = FakeAsyncTransport(b'{"id": "1", "first_name": "Jane"}')
+    sdk = methods.AsyncLooker40SDK(
+        auth_session.AsyncAuthSession(settings, fake, serialize.deserialize40, "4.0"),
+        serialize.deserialize40,
+        serialize.serialize40,
+        fake,
+        "4.0",
+    )
+
+    async def run():
+        return await asyncio.gather(
+            sdk.user("1", fields="id"),
+            sdk.update_user("1", models.WriteUser(first_name="Jane")),
+        )
+
+    user, updated = asyncio.run(run())
+    assert user == models.User(id="1", first_name="Jane")
+    assert updated == user
+    (get, patch) = fake.requests
+    assert get[0] == transport.HttpMethod.GET
+    assert get[1].endswith("/api/4.0/users/1")
+    assert get[2] == {"fields": "id"}
+    assert get[4] == {"Authorization": "Bearer token"}
+    assert patch[0] == transport.HttpMethod.PATCH
+    assert patch[3] == b'{"first_name": "Jane"}'
+
+
+@pytest.mark.parametrize("helper", ["batch", "stream", "iter_rows", "paginate", "iterate"])
+def test_async_sdk_rejects_blocking_helpers(helper):
+    settings = api_settings.ApiSettings(
+        filename="../looker.ini", env_prefix=constants.environment_prefix
+    )
+    fake = FakeAsyncTransport(b"[]")
+    sdk = methods.AsyncLooker40SDK(
+        auth_session.AsyncAuthSession(settings, fake, serialize.deserialize40, "4.0"),
+        serialize.deserialize40,
+        serialize.serialize40,
+        fake,
+        "4.0",
+    )
+    with pytest.raises(TypeError, match=re.escape(f"AsyncLooker40SDK.{helper}()")):
+        getattr(sdk, helper)(sdk.all_users)
+    assert fake.requests == []
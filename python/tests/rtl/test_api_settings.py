@@ -66,6 +66,16 @@ base_url=""
 [QUOTED_CONFIG_VARS]
 base_url="https://host4.looker.com:19999"
 verify_ssl='false'
+
+[CONNECTION_POOL]
+base_url=https://host5.looker.com:19999
+pool_connections=2
+pool_maxsize=64
+pool_block=true
+keep_alive=false
+session_per_thread=yes
+connect_timeout=3.5
+read_timeout=600
 """
     )
     return filename
@@ -250,3 +260,27 @@ def test_it_unquotes_quoted_env_var_values(monkeypatch):
     assert settings.base_url == "https://host1.looker.com:19999"
     assert settings.verify_ssl is False
     assert settings.timeout == 100
+
+
+def test_it_reads_connection_settings(config_file, monkeypatch):
+    """ApiSettings should read pool and timeout settings, env taking precedence."""
+    settings = api_settings.ApiSettings(filename=config_file)
+    assert settings.pool_connections == 10
+    assert settings.pool_maxsize == 10
+    assert settings.pool_block is False
+    assert settings.keep_alive is True
+    assert settings.session_per_thread is False
+    assert settings.connect_timeout is None
+    assert settings.read_timeout is None
+
+    monkeypatch.setenv("LOOKERSDK_POOL_MAXSIZE", "128")
+    settings = api_settings.ApiSettings(
+        filename=config_file, section="CONNECTION_POOL", env_prefix="LOOKERSDK"
+    )
+    assert settings.pool_connections == 2
+    assert settings.pool_maxsize == 128
+    assert settings.pool_block is True
+    assert settings.keep_alive is False
+    assert settings.session_per_thread is True
+    assert settings.connect_timeout == 3.5
+    assert settings.read_timeout == 600
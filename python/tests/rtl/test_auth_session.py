@@ -20,7 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import asyncio
+import concurrent.futures
+import datetime
 import json
+import threading
+import time
 import pytest  # type: ignore
 import urllib.parse
 
@@ -28,6 +33,7 @@ from looker_sdk import error
 from looker_sdk.rtl import auth_session as auth
 from looker_sdk.rtl import api_settings
 from looker_sdk.rtl import serialize
+from looker_sdk.rtl import token_store
 from looker_sdk.rtl import transport
 
 
@@ -90,6 +96,8 @@ class MockTransport(transport.Transport):
     ):
         if authenticator:
             authenticator(transport_options)
+        if transport_options and transport_options.get("stream"):
+            raise TypeError("Must not stream auth requests")
         if method == transport.HttpMethod.POST:
             if path.endswith(("login", "login/5")):
                 if path.endswith("login"):
@@ -153,6 +161,11 @@ def test_auto_login_with_transport_options(auth_session: auth.AuthSession):
     assert auth_session.is_authenticated
 
 
+def test_login_does_not_stream(auth_session: auth.AuthSession):
+    auth_header = auth_session.authenticate({"stream": True})
+    assert auth_header["Authorization"] == "Bearer AdminAccessToken"
+
+
 def test_sudo_login_auto_logs_in(auth_session: auth.AuthSession):
     assert not auth_session.is_authenticated
     assert not auth_session.is_sudo_authenticated
@@ -176,6 +189,136 @@ def test_login_sudo_login_sudo(auth_session: auth.AuthSession):
         auth_session.login_user(10)
 
 
+class SlowLoginTransport(MockTransport):
+    """MockTransport whose /login takes a while and counts the calls"""
+
+    def __init__(self):
+        self.logins = 0
+        self.count_lock = threading.Lock()
+
+    def request(self, method, path, *args, **kwargs):
+        if path.endswith("login"):
+            with self.count_lock:
+                self.logins += 1
+            time.sleep(0.05)
+        return super().request(method, path, *args, **kwargs)
+
+
+@pytest.fixture(scope="function")
+def threaded_auth_session(config_file):
+    settings = api_settings.ApiSettings(filename=config_file, env_prefix="LOOKERSDK")
+    return auth.AuthSession(
+        settings, SlowLoginTransport(), serialize.deserialize40, "4.0"
+    )
+
+
+def test_concurrent_authenticate_logs_in_once(
+    threaded_auth_session: auth.AuthSession,
+):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        headers = list(
+            executor.map(lambda _: threaded_auth_session.authenticate({}), range(32))
+        )
+    assert all(h["Authorization"] == "Bearer AdminAccessToken" for h in headers)
+    assert threaded_auth_session.transport.logins == 1
+
+
+def test_token_renewed_in_background_before_expiry(
+    threaded_auth_session: auth.AuthSession,
+):
+    threaded_auth_session.authenticate({})
+    assert threaded_auth_session.transport.logins == 1
+    expiring = threaded_auth_session.token
+    expiring.expires_at = datetime.datetime.now() + datetime.timedelta(seconds=30)
+
+    # the still active token is handed out without waiting on /login
+    auth_header = threaded_auth_session.authenticate({})
+    assert auth_header["Authorization"] == "Bearer AdminAccessToken"
+    assert threaded_auth_session._renewal is not None
+    threaded_auth_session._renewal.join()
+    assert threaded_auth_session.transport.logins == 2
+    assert threaded_auth_session.token is not expiring
+    assert not threaded_auth_session.token.expires_within(
+        threaded_auth_session.renew_ahead
+    )
+
+
+def test_authenticate_does_not_wait_on_background_renewal(
+    threaded_auth_session: auth.AuthSession,
+):
+    threaded_auth_session.authenticate({})
+    expiring = threaded_auth_session.token
+    expiring.expires_at = datetime.datetime.now() + datetime.timedelta(seconds=30)
+    release = threading.Event()
+    transport = threaded_auth_session.transport
+    request = transport.request
+
+    def blocked_login(method, path, *args, **kwargs):
+        if path.endswith("login"):
+            release.wait(timeout=5)
+        return request(method, path, *args, **kwargs)
+
+    transport.request = blocked_login
+    threaded_auth_session.authenticate({})
+    renewal = threaded_auth_session._renewal
+    assert renewal is not None
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            headers = list(
+                executor.map(lambda _: threaded_auth_session.authenticate({}), range(8))
+            )
+        # answered with the expiring token while /login is still blocked
+        assert renewal.is_alive()
+        assert all(h["Authorization"] == "Bearer AdminAccessToken" for h in headers)
+        assert threaded_auth_session.token is expiring
+    finally:
+        release.set()
+    renewal.join()
+    assert threaded_auth_session.token is not expiring
+    assert transport.logins == 2
+
+
+def test_background_renewal_disabled(threaded_auth_session: auth.AuthSession):
+    threaded_auth_session.renew_ahead = 0
+    threaded_auth_session.authenticate({})
+    threaded_auth_session.token.expires_at = datetime.datetime.now() + datetime.timedelta(
+        seconds=30
+    )
+    threaded_auth_session.authenticate({})
+    assert threaded_auth_session._renewal is None
+    assert threaded_auth_session.transport.logins == 1
+
+
+def test_token_store_shares_token_between_sessions(config_file, tmp_path):
+    settings = api_settings.ApiSettings(filename=config_file, env_prefix="LOOKERSDK")
+    store = token_store.FileTokenStore(str(tmp_path / "tokens.json"))
+    sessions = []
+    for _ in range(2):
+        session = auth.AuthSession(
+            settings, SlowLoginTransport(), serialize.deserialize40, "4.0"
+        )
+        session.token_store = store
+        sessions.append(session)
+    first, second = sessions
+    first.authenticate({})
+    assert second.authenticate({}) == {"Authorization": "Bearer AdminAccessToken"}
+    assert (first.transport.logins, second.transport.logins) == (1, 0)
+    assert second.token.expires_at == first.token.expires_at
+
+    # an expiring stored token is renewed rather than reused
+    first.token.expires_at = datetime.datetime.now() + datetime.timedelta(seconds=30)
+    store.save(first._token_key(), first.token)
+    third = auth.AuthSession(
+        settings, SlowLoginTransport(), serialize.deserialize40, "4.0"
+    )
+    third.token_store = store
+    third.authenticate({})
+    assert third.transport.logins == 1
+
+    third.logout()
+    assert store.load(third._token_key()) is None
+
+
 @pytest.mark.parametrize(
     "test_section, test_env_client_id, test_env_client_secret",
     [
@@ -282,3 +425,84 @@ def test_oauth_redeem_auth_code(oauth_session):
     assert oauth_session.token.access_token == "anOauthToken"
     assert oauth_session.token.refresh_token == "anOauthRefreshToken"
     assert oauth_session.token.token_type == "Bearer"
+
+
+class MockAsyncTransport(transport.AsyncTransport):
+    """Async flavor of MockTransport which counts /login requests"""
+
+    def __init__(self):
+        self.mock = MockTransport()
+        self.logins = 0
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    async def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        if authenticator:
+            await authenticator(transport_options)
+        if path.endswith("login"):
+            self.logins += 1
+        # yield to the event loop like a real network call would
+        await asyncio.sleep(0)
+        return self.mock.request(
+            method, path, query_params, body, None, transport_options
+        )
+
+
+@pytest.fixture(scope="function")
+def async_auth_session(config_file):
+    settings = api_settings.ApiSettings(filename=config_file, env_prefix="LOOKERSDK")
+    return auth.AsyncAuthSession(
+        settings, MockAsyncTransport.configure(settings), serialize.deserialize40, "4.0"
+    )
+
+
+def test_async_auto_login(async_auth_session: auth.AsyncAuthSession):
+    async def run():
+        assert not async_auth_session.is_authenticated
+        auth_header = await async_auth_session.authenticate({})
+        assert auth_header["Authorization"] == "Bearer AdminAccessToken"
+        assert async_auth_session.is_authenticated
+
+        await async_auth_session.logout()
+        assert not async_auth_session.is_authenticated
+
+    asyncio.run(run())
+
+
+def test_async_concurrent_authenticate_logs_in_once(
+    async_auth_session: auth.AsyncAuthSession,
+):
+    async def run():
+        return await asyncio.gather(
+            *(async_auth_session.authenticate({}) for _ in range(20))
+        )
+
+    headers = asyncio.run(run())
+    assert all(h["Authorization"] == "Bearer AdminAccessToken" for h in headers)
+    assert async_auth_session.transport.logins == 1
+
+
+def test_async_sudo_login(async_auth_session: auth.AsyncAuthSession):
+    async def run():
+        await async_auth_session.login_user(5)
+        assert async_auth_session.is_authenticated
+        assert async_auth_session.is_sudo_authenticated
+        auth_header = await async_auth_session.authenticate({})
+        assert auth_header["Authorization"] == "Bearer UserAccessToken"
+        with pytest.raises(error.SDKError):
+            await async_auth_session.login_user(10)
+        await async_auth_session.logout()
+        assert not async_auth_session.is_sudo_authenticated
+        assert async_auth_session.is_authenticated
+
+    asyncio.run(run())
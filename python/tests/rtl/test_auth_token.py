@@ -68,3 +68,16 @@ def test_lag_time_is_used():
 
     assert actual.expires_in == 11
     assert actual.is_active is True
+
+
+def test_expires_within():
+    """Confirm expires_within compares against the lagged expiration."""
+    actual = auth_token.AuthToken(
+        auth_token.AccessToken(
+            access_token="all-access", token_type="backstage", expires_in=70
+        ),
+    )
+
+    assert actual.expires_within(0) is False
+    assert actual.expires_within(30) is False
+    assert actual.expires_within(61) is True
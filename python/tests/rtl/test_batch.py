@@ -0,0 +1,114 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import functools
+import threading
+import time
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import batch
+
+
+class Tracker:
+    """Callable recording the peak number of concurrent calls"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        if value < 0:
+            raise error.SDKError(f"bad value {value}")
+        return value * 2
+
+
+def test_run_preserves_order_and_collects_errors():
+    tracker = Tracker()
+    executor = batch.BatchExecutor(max_workers=4)
+    results = executor.run(
+        [functools.partial(tracker, i) for i in [3, -1, 2, 1, -5, 0]]
+    )
+    assert [r.value for r in results] == [6, None, 4, 2, None, 0]
+    assert [r.ok for r in results] == [True, False, True, True, False, True]
+    assert "bad value -1" in str(results[1].sdk_error)
+    assert all(r.elapsed > 0 for r in results)
+
+
+def test_run_caps_concurrency():
+    tracker = Tracker()
+    executor = batch.BatchExecutor(max_workers=3)
+    executor.run([functools.partial(tracker, i) for i in range(20)])
+    assert 1 < tracker.peak <= 3
+
+
+def run_together(*executors, calls):
+    threads = [
+        threading.Thread(target=executor.run, args=(calls,)) for executor in executors
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_executors_share_limits():
+    tracker = Tracker()
+    limits = batch.BatchLimits()
+    first = batch.BatchExecutor(max_workers=4, max_per_host=2, limits=limits)
+    second = batch.BatchExecutor(max_workers=4, max_per_host=2, limits=limits)
+    run_together(first, second, calls=[functools.partial(tracker, i) for i in range(10)])
+    assert tracker.peak <= 2
+
+
+def test_executors_honor_their_own_max_per_host():
+    limits = batch.BatchLimits()
+    batch.BatchExecutor(max_workers=4, max_per_host=2, limits=limits)
+    tracker = Tracker()
+    wider = batch.BatchExecutor(max_workers=6, max_per_host=6, limits=limits)
+    wider.run([functools.partial(tracker, i) for i in range(30)])
+    assert 2 < tracker.peak <= 6
+
+
+def test_executors_without_shared_limits_are_independent():
+    tracker = Tracker()
+    first = batch.BatchExecutor(max_workers=2)
+    second = batch.BatchExecutor(max_workers=2)
+    run_together(first, second, calls=[functools.partial(tracker, i) for i in range(20)])
+    assert 2 < tracker.peak <= 4
+
+
+def test_other_exceptions_propagate():
+    def boom():
+        raise KeyError("boom")
+
+    executor = batch.BatchExecutor()
+    with pytest.raises(KeyError):
+        executor.run([boom])
@@ -0,0 +1,218 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import gzip
+import json
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import cassette
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import models
+from tests.rtl import conftest
+
+LOGIN = b'{"access_token": "secret-token", "token_type": "Bearer", "expires_in": 3600}'
+CSV = b"a,b\n" + b"1,2\n" * 50_000
+
+
+class FakeTransport(conftest.FakeTransport):
+    """Serves /login, users and a csv, remembering the auth headers sent"""
+
+    login_value = LOGIN
+
+    def __init__(self):
+        self.authorization = []
+        self.users = 0
+
+    def respond(
+        self, method, path, query_params, body, authenticator, transport_options
+    ):
+        headers = {"Content-Type": "application/json", "Set-Cookie": "session=abc"}
+        if authenticator:
+            auth = authenticator(transport_options or {})
+            self.authorization.append(auth["Authorization"])
+        if path.endswith("/csv"):
+            headers["Content-Type"] = "text/csv"
+            ret = conftest.response(headers=headers)
+            ret.stream = transport.ResponseStream(
+                CSV[i : i + 1000] for i in range(0, len(CSV), 1000)
+            )
+            return ret
+        if path.endswith("/missing"):
+            return conftest.response(
+                404, value=b'{"message": "Not found"}', headers=headers
+            )
+        self.users += 1
+        value = b'{"id": "%d", "first_name": "Jane"}' % self.users
+        return conftest.response(value=value, headers=headers)
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    looker = conftest.sdk(FakeTransport())
+    fake = looker.transport
+    with cassette.record(looker, path) as recording:
+        looker.user("1", fields="id")
+        looker.user("1", fields="id")
+        with looker.stream(looker.run_query, "42", "csv") as body:
+            assert b"".join(body) == CSV
+    assert recording.recorded == 4
+    assert looker.transport is fake and looker.auth.transport is fake
+    assert fake.authorization == ["Bearer secret-token"] * 3
+    return path
+
+
+def test_record_scrubs_credentials(recorded):
+    with gzip.open(recorded, "rb") as f:
+        raw = f.read()
+    assert b"secret-token" not in raw
+    assert b"client_secret" not in raw
+    assert b"session=abc" not in raw
+    login, first, second, csv = cassette.load(recorded)
+    assert login.path == "/api/4.0/login"
+    assert login.body == b"scrubbed"
+    assert b'"access_token": "scrubbed"' in login.value
+    assert first.path == "/api/4.0/users/1"
+    assert first.query_params == {"fields": "id"}
+    assert first.headers["Set-Cookie"] == "scrubbed"
+    assert first.value == b'{"id": "1", "first_name": "Jane"}'
+    assert second.value == b'{"id": "2", "first_name": "Jane"}'
+    assert csv.value == CSV
+    assert csv.response_mode == "STRING"
+    assert all(i.elapsed > 0 for i in (login, first, second, csv))
+
+
+def test_replay(recorded):
+    looker = conftest.sdk(FakeTransport())
+    replaying = cassette.replay(looker, recorded)
+    users = [looker.user("1", fields="id") for _ in range(3)]
+    # repeats are served in recorded order, starting over after the last
+    assert [u.id for u in users] == ["1", "2", "1"]
+    assert users[0] == models.User(id="1", first_name="Jane")
+    with looker.stream(looker.run_query, "42", "csv") as body:
+        assert b"".join(body) == CSV
+    assert looker.run_query("42", "csv") == CSV.decode("utf-8")
+    assert replaying.replayed == 6
+    assert looker.auth.is_authenticated
+
+
+def test_replay_unrecorded_request(recorded):
+    looker = conftest.sdk(FakeTransport())
+    cassette.replay(looker, recorded)
+    with pytest.raises(error.SDKError, match="no recorded response"):
+        looker.user("2")
+
+
+def test_replay_latency_and_bandwidth(recorded):
+    replaying = cassette.ReplayTransport(recorded, latency=0.01, bandwidth=10e6)
+    timings = {}
+    response = replaying.request(
+        transport.HttpMethod.GET,
+        "https://other.example.com/api/4.0/queries/42/run/csv",
+        transport_options={"timings": timings},
+    )
+    assert response.value == CSV
+    assert timings["wait"] == 0.01
+    assert timings["download"] == pytest.approx(len(CSV) / 10e6)
+
+    timings = {}
+    response = replaying.request(
+        transport.HttpMethod.GET,
+        "/api/4.0/queries/42/run/csv",
+        transport_options={"timings": timings, "stream": True},
+    )
+    assert response.value == b""
+    assert b"".join(response.stream) == CSV
+    assert timings["download"] == pytest.approx(len(CSV) / 10e6)
+
+
+def test_replay_stream_keeps_error_body(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    with cassette.RecordingTransport(FakeTransport(), path) as recording:
+        recording.request(transport.HttpMethod.GET, "/api/4.0/users/missing")
+    replaying = cassette.ReplayTransport(path)
+    response = replaying.request(
+        transport.HttpMethod.GET,
+        "/api/4.0/users/missing",
+        transport_options={"stream": True},
+    )
+    assert response.ok is False
+    assert response.stream is None
+    assert response.value == b'{"message": "Not found"}'
+
+
+def test_scrub_fields(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    body = b'{"credentials": [{"password": "hunter2", "email": "a@b.c"}]}'
+    with cassette.RecordingTransport(FakeTransport(), path) as recording:
+        recording.request(
+            transport.HttpMethod.POST,
+            "/api/4.0/users",
+            query_params={"client_secret": "y", "fields": "id"},
+            body=body,
+        )
+    with gzip.open(path, "rb") as f:
+        raw = f.read()
+    assert b"hunter2" not in raw
+    (created,) = cassette.load(path)
+    assert created.query_params == {"client_secret": "scrubbed", "fields": "id"}
+    assert json.loads(created.body) == {
+        "credentials": [{"password": "scrubbed", "email": "a@b.c"}]
+    }
+    # requests are scrubbed the same way to find their recording
+    replaying = cassette.ReplayTransport(path)
+    response = replaying.request(
+        transport.HttpMethod.POST,
+        "/api/4.0/users",
+        query_params={"client_secret": "z", "fields": "id"},
+        body=b'{"credentials": [{"password": "other", "email": "a@b.c"}]}',
+    )
+    assert response.value == b'{"id": "1", "first_name": "Jane"}'
+
+    fields = cassette.SCRUBBED_FIELDS | {"first_name"}
+    with cassette.RecordingTransport(FakeTransport(), path, fields) as recording:
+        recording.request(transport.HttpMethod.GET, "/api/4.0/users/1")
+    (user,) = cassette.load(path)
+    assert json.loads(user.value) == {"id": "1", "first_name": "scrubbed"}
+
+
+def test_replay_recorded_latency(recorded):
+    (login, *_) = cassette.load(recorded)
+    replaying = cassette.ReplayTransport(recorded, latency=None)
+    timings = {}
+    replaying.request(
+        transport.HttpMethod.POST,
+        "/api/4.0/login",
+        body=b"client_id=x&client_secret=y",
+        transport_options={"timings": timings},
+    )
+    assert timings == {"wait": login.elapsed}
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"id": "1"}\n')
+    with pytest.raises(error.SDKError):
+        cassette.load(path)
@@ -0,0 +1,176 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import functools
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import api_methods
+from looker_sdk.rtl import conditional
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import models
+from tests.rtl import conftest
+
+USER = b'{"id": "1", "first_name": "Jane"}'
+
+response = functools.partial(conftest.response, value=USER)
+
+
+class ValidatingTransport(transport.Transport):
+    """Answers 304 when the request's If-None-Match matches the current ETag"""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.value = USER
+        self.status_code = 200
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        headers = (transport_options or {}).get("headers", {})
+        self.requests.append((path, query_params, headers))
+        if self.status_code != 200:
+            return response(self.status_code, value=b"{}")
+        if headers.get("If-None-Match") == self.etag:
+            return response(304, value=b"")
+        return response(headers={"ETag": self.etag}, value=self.value)
+
+
+@pytest.fixture
+def api():
+    api = conftest.sdk(ValidatingTransport(), api_methods.APIMethods, conftest.NoAuth)
+    api.conditional_cache = conditional.ConditionalCache()
+    return api
+
+
+def test_get_revalidates_with_etag(api):
+    first = api.get("/users/1", models.User)
+    second = api.get("/users/1", models.User)
+    assert first == models.User(id="1", first_name="Jane")
+    # the 304 is served the model deserialized for the first response
+    assert second is first
+    (_, _, headers1), (_, _, headers2) = api.transport.requests
+    assert "If-None-Match" not in headers1
+    assert headers2["If-None-Match"] == '"v1"'
+    assert api.conditional_cache.hits == 1
+
+
+def test_changed_resource_replaces_the_entry(api):
+    api.get("/users/1", models.User)
+    api.transport.etag = '"v2"'
+    api.transport.value = b'{"id": "1", "first_name": "John"}'
+    assert api.get("/users/1", models.User).first_name == "John"
+    assert api.get("/users/1", models.User).first_name == "John"
+    assert api.transport.requests[-1][2]["If-None-Match"] == '"v2"'
+
+
+def test_entries_are_per_query_and_structure(api):
+    api.get("/users/1", models.User, query_params={"fields": "id"})
+    api.get("/users/1", models.User)
+    assert "If-None-Match" not in api.transport.requests[1][2]
+    assert api.get("/users/1", str) == USER.decode("utf-8")
+    assert api.conditional_cache.hits == 1
+
+
+def test_entries_are_per_user(api):
+    first = api.get("/users/1", models.User)
+    api.auth._sudo_id = 5
+    # another user's validators aren't sent, nor their model served
+    second = api.get("/users/1", models.User)
+    assert "If-None-Match" not in api.transport.requests[1][2]
+    assert second is not first
+    api.auth._sudo_id = None
+    assert api.get("/users/1", models.User) is first
+
+
+def test_errors_drop_the_entry(api):
+    api.get("/users/1", models.User)
+    api.transport.status_code = 404
+    with pytest.raises(error.SDKError):
+        api.get("/users/1", models.User)
+    assert len(api.conditional_cache) == 0
+
+
+def test_last_modified_and_caller_headers():
+    cache = conditional.ConditionalCache()
+    key = conditional.cache_key("me", "/looks", {"b": "2", "a": "1"})
+    assert key == conditional.cache_key("me", "/looks", {"a": "1", "b": "2"})
+    modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    entry = cache.update(key, None, response(headers={"Last-Modified": modified}))
+    options = {"headers": {"If-Modified-Since": "mine"}, "timeout": 5}
+    assert cache.options(entry, options) == {
+        "headers": {"If-Modified-Since": "mine"},
+        "timeout": 5,
+    }
+    assert cache.options(entry, None) == {"headers": {"If-Modified-Since": modified}}
+    # responses without validators aren't kept
+    assert cache.update(key, None, response()) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = conditional.ConditionalCache(max_entries=2)
+    for path in ["/a", "/b", "/c"]:
+        cache.update((path, ()), None, response(headers={"ETag": "x"}))
+        cache.get(("/a", ()))
+    assert cache.get(("/a", ())) is not None
+    assert cache.get(("/b", ())) is None
+    assert cache.get(("/c", ())) is not None
+
+
+class ValidatingAsyncTransport(transport.AsyncTransport):
+    def __init__(self):
+        self.sync = ValidatingTransport()
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    async def request(self, method, path, *args, **kwargs):
+        return self.sync.request(method, path, *args, **kwargs)
+
+
+def test_async_get_revalidates():
+    api = conftest.sdk(
+        ValidatingAsyncTransport(), api_methods.AsyncAPIMethods, conftest.NoAsyncAuth
+    )
+    api.conditional_cache = conditional.ConditionalCache()
+
+    async def run():
+        return [await api.get("/users/1", models.User) for _ in range(3)]
+
+    first, second, third = asyncio.run(run())
+    assert first is second is third
+    assert api.conditional_cache.hits == 2
@@ -0,0 +1,294 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from typing import MutableMapping, Optional
+
+import attr
+import pytest  # type: ignore
+
+from looker_sdk.rtl import transport
+
+httpx = pytest.importorskip("httpx")
+from looker_sdk.rtl import httpx_transport  # noqa: E402
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class TransportSettings:
+    """Fake TransportSettings
+    """
+
+    base_url: str = ""
+    verify_ssl: bool = True
+    timeout: int = 120
+    headers: Optional[MutableMapping[str, str]] = None
+    agent_tag: str = "foobar"
+
+    def is_configured(self) -> bool:
+        return bool(self.base_url)
+
+
+@pytest.fixture
+def settings():
+    return TransportSettings(
+        base_url="https://host1.looker.com:19999", headers=None, verify_ssl=True
+    )
+
+
+def _transport(settings, handler) -> httpx_transport.AsyncHttpxTransport:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return httpx_transport.AsyncHttpxTransport(settings, client)
+
+
+def test_configure(settings):
+    """Test configuration creates instance.
+    """
+    test = httpx_transport.AsyncHttpxTransport.configure(settings)
+    assert isinstance(test, httpx_transport.AsyncHttpxTransport)
+    assert test.client.headers.get("x-looker-appid") == "foobar"
+
+
+@pytest.mark.parametrize(
+    "status, headers, expected_ok, expected_encoding, expected_response_mode",
+    [
+        (200, {"Content-Type": "application/json"}, True, "utf-8", transport.ResponseMode.STRING),
+        (200, {"Content-Type": "image/png"}, True, "utf-8", transport.ResponseMode.BINARY),
+        (
+            200,
+            {"Content-Type": "text/xml; charset=latin1"},
+            True,
+            "latin1",
+            transport.ResponseMode.STRING,
+        ),
+        (404, {"Content-Type": "application/json"}, False, "utf-8", transport.ResponseMode.STRING),
+    ],
+)
+def test_request(
+    settings,
+    status: int,
+    headers: MutableMapping[str, str],
+    expected_ok: bool,
+    expected_encoding: str,
+    expected_response_mode: transport.ResponseMode,
+):
+    """Test basic round trip including authenticator and transport_options
+    """
+    seen = {}
+
+    def handler(request):
+        seen["request"] = request
+        return httpx.Response(status, content=b"yay!", headers=headers)
+
+    async def authenticator(transport_options):
+        return {"Authorization": "Bearer token"}
+
+    test = _transport(settings, handler)
+    resp = asyncio.run(
+        test.request(
+            transport.HttpMethod.GET,
+            "https://host1.looker.com:19999/api/4.0/user",
+            query_params={"fields": "id"},
+            authenticator=authenticator,
+            transport_options={"headers": {"foo": "bar"}},
+        )
+    )
+    assert isinstance(resp, transport.Response)
+    assert resp.value == b"yay!"
+    assert resp.ok is expected_ok
+    assert resp.response_mode == expected_response_mode
+    assert resp.encoding == expected_encoding
+    request = seen["request"]
+    assert request.headers["Authorization"] == "Bearer token"
+    assert request.headers["foo"] == "bar"
+    assert request.url.params["fields"] == "id"
+
+
+def test_request_error(settings):
+    """Test network error response
+    """
+
+    def handler(request):
+        raise httpx.ConnectError("Connection reset by peer", request=request)
+
+    test = _transport(settings, handler)
+    resp = asyncio.run(test.request(transport.HttpMethod.GET, "https://foo/bar"))
+    assert isinstance(resp, transport.Response)
+    assert resp.value == b"Connection reset by peer"
+    assert resp.ok is False
+
+
+def _sync_transport(settings, handler) -> httpx_transport.HttpxTransport:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return httpx_transport.HttpxTransport(settings, client)
+
+
+def test_sync_configure(settings):
+    pytest.importorskip("h2")
+    test = httpx_transport.HttpxTransport.configure(settings)
+    assert isinstance(test, httpx_transport.HttpxTransport)
+    assert test.client.headers.get("x-looker-appid") == "foobar"
+    test.close()
+
+
+def test_sync_request(settings):
+    seen = {}
+
+    def handler(request):
+        seen["request"] = request
+        return httpx.Response(
+            200, content=b"yay!", headers={"Content-Type": "text/plain; charset=latin1"}
+        )
+
+    test = _sync_transport(settings, handler)
+    resp = test.request(
+        transport.HttpMethod.POST,
+        "https://host1.looker.com:19999/api/4.0/user",
+        query_params={"fields": "id"},
+        body=b'{"id": 1}',
+        authenticator=lambda transport_options: {"Authorization": "Bearer token"},
+        transport_options={"headers": {"foo": "bar"}, "timeout": 7},
+    )
+    assert resp.ok is True
+    assert resp.value == b"yay!"
+    assert resp.status_code == 200
+    assert resp.encoding == "latin1"
+    assert resp.response_mode == transport.ResponseMode.STRING
+    request = seen["request"]
+    assert request.method == "POST"
+    assert request.content == b'{"id": 1}'
+    assert request.headers["Authorization"] == "Bearer token"
+    assert request.headers["foo"] == "bar"
+    assert request.headers["x-looker-appid"] == "foobar"
+    assert request.url.params["fields"] == "id"
+    assert request.extensions["timeout"]["read"] == 7
+
+
+def _redirecting(request):
+    if request.url.path == "/old":
+        return httpx.Response(302, headers={"Location": "https://foo/new"})
+    return httpx.Response(200, content=b"moved")
+
+
+def test_sync_request_follows_redirects(settings):
+    client = httpx.Client(
+        transport=httpx.MockTransport(_redirecting),
+        **httpx_transport._client_options(settings, False),
+    )
+    test = httpx_transport.HttpxTransport(settings, client)
+    resp = test.request(transport.HttpMethod.GET, "https://foo/old")
+    assert resp.status_code == 200
+    assert resp.value == b"moved"
+
+
+def test_async_request_follows_redirects(settings):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_redirecting),
+        **httpx_transport._client_options(settings, False),
+    )
+    test = httpx_transport.AsyncHttpxTransport(settings, client)
+    resp = asyncio.run(test.request(transport.HttpMethod.GET, "https://foo/old"))
+    assert resp.status_code == 200
+    assert resp.value == b"moved"
+
+
+def test_sync_request_stream(settings):
+    def handler(request):
+        return httpx.Response(200, content=b"a,b\n1,2\n")
+
+    test = _sync_transport(settings, handler)
+    resp = test.request(
+        transport.HttpMethod.GET, "https://foo/bar", transport_options={"stream": True}
+    )
+    assert resp.ok is True
+    assert resp.value == b""
+    assert b"".join(resp.stream) == b"a,b\n1,2\n"
+
+
+def test_sync_request_stream_error_reads_body(settings):
+    def handler(request):
+        return httpx.Response(404, content=b"not found")
+
+    test = _sync_transport(settings, handler)
+    resp = test.request(
+        transport.HttpMethod.GET, "https://foo/bar", transport_options={"stream": True}
+    )
+    assert resp.ok is False
+    assert resp.status_code == 404
+    assert resp.value == b"not found"
+    assert resp.stream is None
+
+
+def test_sync_request_error(settings):
+    def handler(request):
+        raise httpx.ConnectError("Connection reset by peer", request=request)
+
+    test = _sync_transport(settings, handler)
+    resp = test.request(transport.HttpMethod.GET, "https://foo/bar")
+    assert resp.ok is False
+    assert resp.value == b"Connection reset by peer"
+    assert isinstance(resp.exception, httpx.ConnectError)
+    assert resp.sent is False
+
+
+def test_sync_request_read_timeout_was_sent(settings):
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    test = _sync_transport(settings, handler)
+    resp = test.request(transport.HttpMethod.GET, "https://foo/bar")
+    assert resp.ok is False
+    assert resp.sent is True
+
+
+def test_init40_transport_class():
+    pytest.importorskip("h2")
+    import looker_sdk
+
+    sdk = looker_sdk.init40(
+        "../looker.ini", transport_class=httpx_transport.HttpxTransport
+    )
+    assert isinstance(sdk.transport, httpx_transport.HttpxTransport)
+    assert sdk.auth.transport is sdk.transport
+
+
+def test_sync_request_timings(settings):
+    test = _sync_transport(settings, lambda request: httpx.Response(200, content=b"x"))
+    timings = {}
+    resp = test.request(
+        transport.HttpMethod.GET, "https://foo/bar", transport_options={"timings": timings}
+    )
+    assert resp.value == b"x"
+    assert set(timings) == {"connect", "wait", "download"}
+
+
+def test_async_request_timings(settings):
+    test = _transport(settings, lambda request: httpx.Response(200, content=b"x"))
+    timings = {}
+    resp = asyncio.run(
+        test.request(
+            transport.HttpMethod.GET,
+            "https://foo/bar",
+            transport_options={"timings": timings},
+        )
+    )
+    assert resp.value == b"x"
+    assert set(timings) == {"connect", "wait", "download"}
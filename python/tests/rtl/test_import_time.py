@@ -0,0 +1,80 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import subprocess
+import sys
+
+import pytest  # type: ignore
+
+import looker_sdk
+
+GENERATED = ["looker_sdk.sdk.api40.methods", "looker_sdk.sdk.api40.models"]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(looker_sdk.__file__)))
+
+
+def import_time(module: str) -> float:
+    """Best of 3 wall clock seconds to import `module` in a fresh interpreter"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    best = float("inf")
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, float(proc.stdout))
+    return best
+
+
+def test_import_does_not_load_generated_modules():
+    code = "import sys, looker_sdk; print(sorted(set(sys.modules) & {names!r}))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code.format(names=set(GENERATED))],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.strip() == "[]"
+
+
+def test_generated_modules_load_on_first_use():
+    from looker_sdk.sdk.api40 import methods, models
+
+    assert looker_sdk.methods40 is methods
+    assert looker_sdk.models40 is models
+    assert "models40" in dir(looker_sdk)
+    with pytest.raises(AttributeError):
+        looker_sdk.models41
+
+
+def test_import_time_budget():
+    """Guard against the generated modules being imported eagerly again."""
+    lazy = import_time("looker_sdk")
+    full = import_time("looker_sdk.sdk.api40.methods")
+    assert lazy < full * 0.6, f"import looker_sdk took {lazy:.3f}s vs {full:.3f}s"
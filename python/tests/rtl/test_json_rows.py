@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import json
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import json_rows
+from looker_sdk.rtl import serialize
+from tests.rtl import conftest
+
+ROWS = [
+    {"users.id": 1, "users.name": "Zoë", "users.score": 12.5},
+    {"users.id": 22, "users.name": "a \"quoted\", [bracketed] name", "users.score": None},
+    {"users.id": 333, "users.name": "", "users.score": -1e3},
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1024])
+def test_json_rows(size):
+    body = json.dumps(ROWS, indent=1).encode("utf-8")
+    reader = json_rows.RowReader(conftest.chunked(body, size))
+    assert list(reader) == ROWS
+    assert reader.members == {}
+
+
+@pytest.mark.parametrize("size", [1, 5, 1024])
+def test_json_bi_rows(size):
+    metadata = {"fields": {"dimensions": [{"name": "users.id"}]}}
+    body = json.dumps(
+        {"metadata": metadata, "rows": ROWS, "after": [1, 2]}
+    ).encode("utf-8")
+    reader = json_rows.RowReader(conftest.chunked(body, size))
+    rows = iter(reader)
+    assert next(rows) == ROWS[0]
+    # members ahead of the rows are available before the rows are read
+    assert reader.members == {"metadata": metadata}
+    assert list(rows) == ROWS[1:]
+    assert reader.members == {"metadata": metadata, "after": [1, 2]}
+
+
+@pytest.mark.parametrize("body", [b"[]", b" [ ] ", b'{"rows": []}', b"{}"])
+def test_no_rows(body):
+    assert list(json_rows.RowReader(conftest.chunked(body, 1))) == []
+
+
+def test_numbers_split_across_chunks():
+    assert list(json_rows.RowReader([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+
+def test_large_rows_are_decoded_a_few_times():
+    row = {"users.id": 1, "users.notes": ["note %d" % i for i in range(20_000)]}
+    body = json.dumps([row, row]).encode("utf-8")
+    reader = json_rows.RowReader(conftest.chunked(body, 16))
+    calls = []
+    raw_decode = reader._json.raw_decode
+
+    def counting_raw_decode(s, idx=0):
+        calls.append(idx)
+        return raw_decode(s, idx)
+
+    reader._json.raw_decode = counting_raw_decode
+    assert list(reader) == [row, row]
+    # about 17k chunks per row, restarting on each would be quadratic
+    assert len(calls) < 60
+
+
+def test_encoding():
+    body = json.dumps(ROWS, ensure_ascii=False).encode("latin1", errors="replace")
+    assert [r["users.id"] for r in json_rows.RowReader(conftest.chunked(body, 3), "latin1")] == [
+        1,
+        22,
+        333,
+    ]
+
+
+@pytest.mark.parametrize("body", [b"", b"[{\"a\": 1}", b"[{\"a\": 1} {}]", b"nope"])
+def test_bad_json(body):
+    with pytest.raises(serialize.DeserializeError):
+        list(json_rows.RowReader(conftest.chunked(body, 2)))
+
+
+def test_close():
+    closed = []
+    with json_rows.RowReader([b"[]"], close=lambda: closed.append(True)) as reader:
+        assert list(reader) == []
+    assert closed == [True]
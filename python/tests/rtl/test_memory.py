@@ -0,0 +1,148 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Memory budgets for deserializing large API responses
+
+Budgets are for the full size payloads (50k users, 10k dashboards with
+their dashboard_elements and a content validation with 10k errors) and
+are scaled by LOOKERSDK_MEMORY_SCALE, 0.05 by default so the suite stays
+fast. Set it to 1 to measure the full sizes, which need a few GB.
+
+Peak and retained memory and retained allocations are measured with
+tracemalloc and include the parsed json. Lower a budget after making
+deserialization leaner.
+"""
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Dict, Sequence
+
+import pytest  # type: ignore
+
+import looker_sdk
+from looker_sdk.rtl import serialize
+from looker_sdk.sdk.api40 import models
+
+from benchmarks import payloads
+
+SCALE = float(os.environ.get("LOOKERSDK_MEMORY_SCALE", "0.05"))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(looker_sdk.__file__)))
+MB = 1024 * 1024
+
+# name: (payload, full size count, structure,
+#        peak MB by json codec, retained MB, retained allocations)
+CASES: Dict[str, Any] = {
+    "users": (
+        payloads.users,
+        50_000,
+        Sequence[models.User],
+        {"json": 400, "orjson": 1400},
+        280,
+        2_600_000,
+    ),
+    "dashboards": (
+        payloads.dashboards,
+        10_000,
+        Sequence[models.Dashboard],
+        {"json": 570, "orjson": 1800},
+        390,
+        3_400_000,
+    ),
+    "content_validation": (
+        payloads.content_validation,
+        10_000,
+        models.ContentValidation,
+        {"json": 33, "orjson": 100},
+        20,
+        270_000,
+    ),
+}
+
+
+@pytest.fixture
+def codec(request):
+    pytest.importorskip(request.param)
+    previous = serialize.json_codec()
+    serialize.set_json_codec(request.param)
+    yield request.param
+    serialize.set_json_codec(previous)
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"], indirect=True)
+@pytest.mark.parametrize("case", list(CASES))
+def test_deserialize_memory_budget(case: str, codec: str):
+    build, count, structure, peaks, retained_mb, allocations = CASES[case]
+    data = build(max(1, int(count * SCALE)))
+    tracemalloc.start()
+    try:
+        result = serialize.deserialize40(data=data, structure=structure)
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    assert result
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    assert peak <= peaks[codec] * MB * SCALE, f"peak {peak / MB:.1f} MB"
+    assert retained <= retained_mb * MB * SCALE, f"retained {retained / MB:.1f} MB"
+    assert blocks <= allocations * SCALE, f"{blocks} allocations retained"
+
+
+def max_rss(code: str) -> Dict[str, float]:
+    """Peak RSS in MB of a fresh interpreter before and after running code
+
+    code is run after building `data`, the users payload.
+    """
+    script = (
+        "import resource, sys\n"
+        "from benchmarks import payloads\n"
+        f"data = payloads.users(int(50_000 * {SCALE}))\n"
+        "def rss():\n"
+        "    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "    return rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)\n"
+        "before = rss()\n"
+        f"{code}\n"
+        "print(before, rss())\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    before, after = proc.stdout.split()
+    return {"before": float(before), "after": float(after)}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs the resource module")
+def test_deserialize_rss_budget():
+    """Peak RSS growth deserializing users, as a container would see it"""
+    rss = max_rss(
+        "from typing import Sequence\n"
+        "from looker_sdk.rtl import serialize\n"
+        "from looker_sdk.sdk.api40 import models\n"
+        "result = serialize.deserialize40(data=data, structure=Sequence[models.User])"
+    )
+    growth = rss["after"] - rss["before"]
+    # 50k users grow it by about 280 MB, plus some allocator slack
+    assert growth <= 350 * SCALE + 8, f"peak RSS grew {growth:.1f} MB"
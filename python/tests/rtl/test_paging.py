@@ -0,0 +1,101 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+from typing import List, Optional
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import paging
+
+
+class FakeSearch:
+    """Fake limit/offset SDK method over `total` integers"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.calls: List[dict] = []
+
+    def __call__(
+        self, name: str, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> List[int]:
+        self.calls.append({"name": name, "limit": limit, "offset": offset})
+        assert limit is not None and offset is not None
+        return list(range(self.total))[offset : offset + limit]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@pytest.mark.parametrize(
+    "total, page_size, expected_pages",
+    [(0, 10, []), (5, 10, [5]), (10, 10, [10]), (25, 10, [10, 10, 5])],
+)
+def test_paginate(total, page_size, expected_pages, prefetch):
+    search = FakeSearch(total)
+    pages = list(
+        paging.paginate(search, "jane", page_size=page_size, prefetch=prefetch)
+    )
+    assert [len(p) for p in pages] == expected_pages
+    assert [i for p in pages for i in p] == list(range(total))
+    assert all(c["name"] == "jane" for c in search.calls)
+    assert [c["offset"] for c in search.calls] == [
+        i * page_size for i in range(len(search.calls))
+    ]
+
+
+def test_iterate():
+    search = FakeSearch(7)
+    assert list(paging.iterate(search, name="jane", page_size=3)) == list(range(7))
+    assert len(search.calls) == 3
+
+
+class SignallingSearch(FakeSearch):
+    """FakeSearch that signals when the page at `offset` is requested"""
+
+    def __init__(self, total: int, offset: int):
+        super().__init__(total)
+        self.offset = offset
+        self.requested = threading.Event()
+
+    def __call__(
+        self, name: str, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> List[int]:
+        page = super().__call__(name, limit=limit, offset=offset)
+        if offset == self.offset:
+            self.requested.set()
+        return page
+
+
+def test_prefetch_requests_one_page_ahead():
+    search = SignallingSearch(100, offset=10)
+    pages = paging.paginate(search, "jane", page_size=10)
+    assert next(pages) == list(range(10))
+    # the second page is requested while the caller still holds the first
+    assert search.requested.wait(timeout=5)
+    pages.close()
+    # and nothing past it
+    assert [c["offset"] for c in search.calls] == [0, 10]
+
+
+@pytest.mark.parametrize("reserved", ["limit", "offset"])
+def test_paginate_rejects_limit_and_offset(reserved):
+    with pytest.raises(ValueError):
+        next(paging.paginate(FakeSearch(1), "jane", **{reserved: 5}))
@@ -0,0 +1,188 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import functools
+import gc
+import threading
+import weakref
+
+from looker_sdk.rtl import auth_session
+from looker_sdk.rtl import profile
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import methods
+from tests.rtl import conftest
+
+
+class FakeTransport(conftest.FakeTransport):
+    """Serves /login and a dashboard, adding made up network timings"""
+
+    def login(self, transport_options):
+        # logging in is timed as part of auth, not the call's wait
+        assert "timings" not in (transport_options or {})
+        return super().login(transport_options)
+
+    def respond(
+        self, method, path, query_params, body, authenticator, transport_options
+    ):
+        if authenticator is not None:
+            authenticator(transport_options or {})
+        timings = (transport_options or {}).get("timings")
+        if timings is not None:
+            transport.add_time(timings, "wait", 0.5)
+            transport.add_time(timings, "download", 0.25)
+        value = b'{"id": "42", "title": "Sales"}'
+        if path.endswith("/search"):
+            # one dashboard, on the first page
+            first = (query_params or {}).get("offset", "0") == "0"
+            value = b"[" + value + b"]" if first else b"[]"
+        return conftest.response(value=value)
+
+
+def test_profile_by_method():
+    looker = conftest.sdk(FakeTransport())
+    with looker.profile() as p:
+        looker.dashboard("42")
+        looker.dashboard("42")
+        looker.search_dashboards(title="Sales")
+    looker.dashboard("42")
+    assert looker.profiler is None
+
+    summary = p.summary()
+    assert set(summary) == {"dashboard", "search_dashboards"}
+    dashboard = summary["dashboard"]
+    assert dashboard["calls"] == 2
+    assert dashboard["wait"] == 1.0
+    assert dashboard["download"] == 0.5
+    assert dashboard["auth"] > 0
+    assert dashboard["parse"] > 0
+    assert dashboard["structure"] > 0
+    assert dashboard["connect"] == 0
+
+    lines = p.report().splitlines()
+    assert lines[0].split() == ["method", "calls", *profile.PHASES]
+    assert lines[1].split()[:4] == ["dashboard", "2", lines[1].split()[2], "0.0"]
+    assert lines[1].split()[4:6] == ["500.0", "250.0"]
+
+
+def test_profile_is_local_to_the_thread():
+    looker = conftest.sdk(FakeTransport())
+    profiling = threading.Event()
+    done = threading.Event()
+
+    def other():
+        profiling.wait(10)
+        looker.search_dashboards(title="Sales")
+        done.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    with looker.profile() as p:
+        profiling.set()
+        done.wait(10)
+        looker.dashboard("42")
+    thread.join()
+    assert set(p.summary()) == {"dashboard"}
+
+
+def test_profiles_are_per_sdk_and_do_not_keep_it_alive():
+    looker, other = conftest.sdk(FakeTransport()), conftest.sdk(FakeTransport())
+    with looker.profile() as p:
+        other.dashboard("42")
+        assert other.profiler is None
+        with other.profile() as q:
+            assert (looker.profiler, other.profiler) == (p, q)
+        collected = weakref.ref(other)
+        del other
+        gc.collect()
+        assert collected() is None
+    assert p.summary() == {}
+
+
+def test_profiler_setter_is_local_to_the_context():
+    looker = conftest.sdk(FakeTransport())
+    p = profile.Profile()
+    seen = []
+
+    def other_thread():
+        seen.append(looker.profiler)
+
+    looker.profiler = p
+    try:
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+        assert looker.profiler is p
+        assert seen == [None]
+    finally:
+        looker.profiler = None
+    assert looker.profiler is None
+
+
+def test_profile_batch_and_paginate():
+    looker = conftest.sdk(FakeTransport())
+    with looker.profile() as p:
+        looker.batch([functools.partial(looker.dashboard, "42")] * 3)
+        list(looker.paginate(looker.search_dashboards, title="Sales", page_size=1))
+    summary = p.summary()
+    assert summary["dashboard"]["calls"] == 3
+    # a page of one, then an empty page prefetched in the background
+    assert summary["search_dashboards"]["calls"] == 2
+
+
+def test_profile_decode():
+    looker = conftest.sdk(FakeTransport())
+    with looker.profile() as p:
+        looker.get("/dashboards/42", str)
+    (timings,) = p.summary().values()
+    assert timings["decode"] > 0
+    assert timings["parse"] == 0
+
+
+class FakeAsyncTransport(transport.AsyncTransport):
+    def __init__(self):
+        self.sync = FakeTransport()
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    async def request(self, method, path, *args, authenticator=None, **kwargs):
+        if authenticator is not None:
+            await authenticator(kwargs.get("transport_options") or {})
+        return self.sync.request(method, path, *args, **kwargs)
+
+
+def test_async_profile():
+    looker = conftest.sdk(
+        FakeAsyncTransport(), methods.AsyncLooker40SDK, auth_session.AsyncAuthSession
+    )
+
+    async def run():
+        with looker.profile() as p:
+            await asyncio.gather(looker.dashboard("1"), looker.dashboard("2"))
+        return p
+
+    summary = asyncio.run(run()).summary()
+    assert summary["dashboard"]["calls"] == 2
+    assert summary["dashboard"]["auth"] > 0
+    assert summary["dashboard"]["wait"] == 1.0
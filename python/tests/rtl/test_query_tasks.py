@@ -0,0 +1,219 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import query_tasks
+from looker_sdk.rtl import serialize
+from looker_sdk.sdk.api40 import models
+
+
+class FakeSDK:
+    """Query tasks that complete after `polls` multi_results calls
+
+    Queries with an id starting "fail" error out.
+    """
+
+    def __init__(self, polls=2, fail_polls=0):
+        self.polls = polls
+        self.fail_polls = fail_polls
+        self.lock = threading.Lock()
+        self.tasks = {}
+        self.created = 0
+        self.max_running = 0
+        self.multi_results = []
+
+    def create_query_task(self, body, **kwargs):
+        if body.query_id == "bad":
+            raise error.SDKError("Not found")
+        with self.lock:
+            self.created += 1
+            task_id = f"task-{self.created}"
+            self.tasks[task_id] = [body.query_id, self.polls, kwargs]
+            self.max_running = max(self.max_running, len(self.tasks))
+        return models.QueryTask(id=task_id, query_id=body.query_id, status="added")
+
+    def query_task_multi_results(self, query_task_ids):
+        assert isinstance(query_task_ids, models.DelimSequence)
+        self.multi_results.append(list(query_task_ids))
+        if self.fail_polls:
+            self.fail_polls -= 1
+            raise error.SDKError("Service unavailable")
+        results = {}
+        with self.lock:
+            for task_id in query_task_ids:
+                task = self.tasks[task_id]
+                task[1] -= 1
+                if task[1] > 0:
+                    results[task_id] = {"status": "running"}
+                    continue
+                del self.tasks[task_id]
+                if task[0].startswith("fail"):
+                    results[task_id] = {
+                        "status": "error",
+                        "data": {"errors": [{"message": "Unknown field"}]},
+                    }
+                else:
+                    results[task_id] = {
+                        "status": "complete",
+                        "data": [{"query": task[0], "kwargs": task[2]}],
+                    }
+        return results
+
+
+def task(query_id):
+    return models.WriteCreateQueryTask(
+        query_id=query_id, result_format=models.ResultFormat.json
+    )
+
+
+def test_polls_tasks_together():
+    sdk = FakeSDK(polls=3)
+    with query_tasks.QueryTaskManager(
+        sdk, max_running=10, poll_interval=0.001
+    ) as manager:
+        futures = [manager.submit(task(str(i)), limit=5) for i in range(50)]
+        results = [f.result(timeout=10) for f in futures]
+    assert results == [[{"query": str(i), "kwargs": {"limit": 5}}] for i in range(50)]
+    assert sdk.max_running == 10
+    assert all(len(ids) <= 10 for ids in sdk.multi_results)
+    # 50 tasks of 3 polls each, 10 at a time, one call per tick
+    assert len(sdk.multi_results) < 50
+    assert manager.running == 0
+
+
+def test_large_fan_out_polls_in_chunks():
+    sdk = FakeSDK(polls=1)
+    with query_tasks.QueryTaskManager(sdk, max_running=250) as manager:
+        futures = [manager.submit(task(str(i))) for i in range(250)]
+        concurrent.futures.wait(futures, timeout=10)
+    assert all(f.done() for f in futures)
+    assert max(len(ids) for ids in sdk.multi_results) == query_tasks.MAX_IDS_PER_POLL
+
+
+def test_failures():
+    sdk = FakeSDK(polls=1)
+    with query_tasks.QueryTaskManager(sdk, poll_interval=0.001) as manager:
+        ok = manager.submit(task("1"))
+        failed = manager.submit(task("fail"))
+        missing = manager.submit(task("bad"))
+    assert ok.result() == [{"query": "1", "kwargs": {}}]
+    with pytest.raises(error.SDKError, match="error: Unknown field"):
+        failed.result()
+    with pytest.raises(error.SDKError, match="Not found"):
+        missing.result()
+
+
+def test_poll_failures():
+    sdk = FakeSDK(polls=1, fail_polls=2)
+    with query_tasks.QueryTaskManager(
+        sdk, poll_interval=0.001, max_poll_failures=3
+    ) as manager:
+        recovered = manager.submit(task("1"))
+    assert recovered.result() == [{"query": "1", "kwargs": {}}]
+
+    sdk = FakeSDK(polls=1, fail_polls=3)
+    with query_tasks.QueryTaskManager(
+        sdk, poll_interval=0.001, max_poll_failures=3
+    ) as manager:
+        failed = manager.submit(task("1"))
+    with pytest.raises(error.SDKError, match="Service unavailable"):
+        failed.result()
+
+
+def test_backoff():
+    sdk = FakeSDK(polls=8)
+    manager = query_tasks.QueryTaskManager(
+        sdk, poll_interval=0.001, max_poll_interval=0.004, backoff=2
+    )
+    future = manager.submit(task("1"))
+    future.result(timeout=10)
+    manager.close()
+    # 0.001 doubling each poll without a completion, capped at 0.004
+    assert len(sdk.multi_results) == 8
+    assert manager._interval == 0.001
+
+
+def test_cancel_before_start():
+    sdk = FakeSDK(polls=5)
+    with query_tasks.QueryTaskManager(
+        sdk, max_running=1, poll_interval=0.001
+    ) as manager:
+        first = manager.submit(task("1"))
+        second = manager.submit(task("2"))
+        assert second.cancel()
+    assert first.result() == [{"query": "1", "kwargs": {}}]
+    assert sdk.created == 1
+    with pytest.raises(RuntimeError):
+        manager.submit(task("3"))
+
+
+def test_awaitable():
+    sdk = FakeSDK(polls=2)
+
+    async def run(manager):
+        return await asyncio.gather(
+            *(asyncio.wrap_future(manager.submit(task(str(i)))) for i in range(3))
+        )
+
+    with query_tasks.QueryTaskManager(sdk, poll_interval=0.001) as manager:
+        results = asyncio.run(run(manager))
+    assert [r[0]["query"] for r in results] == ["0", "1", "2"]
+
+
+def test_malformed_poll_response_fails_futures():
+    sdk = FakeSDK(polls=1)
+
+    def malformed(query_task_ids):
+        raise serialize.DeserializeError("Bad json")
+
+    sdk.query_task_multi_results = malformed
+    with query_tasks.QueryTaskManager(sdk, poll_interval=0.001) as manager:
+        future = manager.submit(task("1"))
+        with pytest.raises(serialize.DeserializeError):
+            future.result(timeout=5)
+    assert manager.running == 0
+
+
+# the poller re-raises after failing the futures
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_poller_crash_fails_outstanding_futures():
+    sdk = FakeSDK(polls=1)
+    manager = query_tasks.QueryTaskManager(sdk, max_running=1, poll_interval=0.001)
+
+    def crash():
+        raise RuntimeError("poller bug")
+
+    manager._poll = crash
+    running = manager.submit(task("1"))
+    queued = manager.submit(task("2"))
+    for future in (running, queued):
+        with pytest.raises(RuntimeError, match="poller bug"):
+            future.result(timeout=5)
+    with pytest.raises(RuntimeError):
+        manager.submit(task("3"))
+    manager._thread.join()
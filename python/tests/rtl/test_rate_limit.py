@@ -0,0 +1,162 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import rate_limit
+from looker_sdk.rtl import requests_transport
+from looker_sdk.rtl import transport
+
+GET = transport.HttpMethod.GET
+POST = transport.HttpMethod.POST
+BASE = "https://looker.example.com:19999/api/4.0"
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        (GET, f"{BASE}/queries/42/run/json", "query"),
+        (POST, f"{BASE}/queries/run/csv", "query"),
+        (GET, f"{BASE}/looks/7/run/png?limit=10", "query"),
+        (POST, f"{BASE}/sql_queries/abc/run/json", "query"),
+        (POST, f"{BASE}/query_tasks", "query"),
+        (POST, f"{BASE}/render_tasks/dashboards/1/pdf", "query"),
+        (GET, f"{BASE}/dashboards/1", "read"),
+        (GET, f"{BASE}/users/runner", "read"),
+        (transport.HttpMethod.PATCH, f"{BASE}/users/1", "write"),
+        (transport.HttpMethod.DELETE, f"{BASE}/looks/7", "write"),
+    ],
+)
+def test_endpoint_class(method, path, expected):
+    assert rate_limit.endpoint_class(method, path) == expected
+
+
+def test_memory_backend_allows_burst_then_spaces_requests():
+    backend = rate_limit.MemoryBackend()
+    limit = rate_limit.RateLimit(10, burst=2)
+    waits = [backend.reserve("bucket", limit) for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+    assert backend.reserve("other", limit) == 0
+
+
+def test_memory_backend_is_thread_safe():
+    backend = rate_limit.MemoryBackend()
+    limit = rate_limit.RateLimit(100, burst=1)
+    waits = []
+
+    def reserve():
+        for _ in range(50):
+            waits.append(backend.reserve("bucket", limit))
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 200 reservations at 100/s: the last one waits about 2 seconds
+    assert max(waits) == pytest.approx(1.99, abs=0.1)
+
+
+def test_limiter_limits_by_class_and_host():
+    limiter = rate_limit.RateLimiter(
+        {"query": rate_limit.RateLimit(1), "*": rate_limit.RateLimit(100, burst=1)}
+    )
+    assert limiter.reserve(GET, f"{BASE}/queries/1/run/json") == 0
+    assert limiter.reserve(GET, f"{BASE}/queries/1/run/json") > 0.9
+    other_host = "https://other.example.com/api/4.0/queries/1/run/json"
+    assert limiter.reserve(GET, other_host) == 0
+    # "read" falls back to the "*" limit
+    assert limiter.reserve(GET, f"{BASE}/dashboards/1") == 0
+    assert limiter.reserve(GET, f"{BASE}/dashboards/1") > 0
+
+    unlimited = rate_limit.RateLimiter({"query": rate_limit.RateLimit(1)})
+    assert [unlimited.reserve(GET, f"{BASE}/dashboards/1") for _ in range(5)] == [
+        0
+    ] * 5
+
+
+def test_file_backend_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "buckets.json")
+    code = (
+        "from looker_sdk.rtl import rate_limit; "
+        f"backend = rate_limit.FileBackend({path!r}); "
+        "[backend.reserve('bucket', rate_limit.RateLimit(1, burst=1)) "
+        "for _ in range(5)]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    # the other process took 5 tokens at 1/s so this one queues behind them
+    wait = rate_limit.FileBackend(path).reserve(
+        "bucket", rate_limit.RateLimit(1, burst=1)
+    )
+    assert 3 < wait <= 5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="posix permissions")
+def test_file_backend_default_is_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    backend = rate_limit.FileBackend()
+    backend.reserve("bucket", rate_limit.RateLimit(1))
+    assert backend.path == str(tmp_path / ".looker" / "rate_limit.json")
+    assert os.stat(tmp_path / ".looker").st_mode & 0o777 == 0o700
+    assert os.stat(backend.path).st_mode & 0o777 == 0o600
+
+
+class RecordingLimiter(rate_limit.RateLimiter):
+    def __init__(self):
+        super().__init__({})
+        self.requests = []
+
+    def reserve(self, method, url):
+        self.requests.append((method, url))
+        return 0.0
+
+
+class FailingSession:
+    """Fake requests.Session failing every request"""
+
+    headers = {}
+
+    def request(self, *args, **kwargs):
+        raise IOError("unreachable")
+
+
+class Settings:
+    base_url = BASE
+    verify_ssl = True
+    timeout = 120
+    agent_tag = "test"
+    headers = None
+
+
+def test_requests_transport_waits_for_rate_limiter():
+    limiter = RecordingLimiter()
+    test = requests_transport.RequestsTransport(Settings(), FailingSession())
+    test.rate_limiter = limiter
+    test.request(GET, f"{BASE}/dashboards/1")
+    assert limiter.requests == [(GET, f"{BASE}/dashboards/1")]
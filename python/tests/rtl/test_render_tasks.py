@@ -0,0 +1,221 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import functools
+import json
+import threading
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import render_tasks
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import models
+from tests.rtl import conftest
+
+
+def pdf(task_id):
+    return b"%PDF-1.4 " + task_id.encode("ascii") * 10_000
+
+
+class FakeTransport(conftest.FakeTransport):
+    """Render tasks succeeding after two status polls, whose first results
+    request is 202 Accepted. Dashboard "broken" fails to render and the
+    results of dashboard "stuck" are never ready.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tasks = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+        # query params each render task was created with
+        self.created = {}
+
+    def respond(
+        self, method, path, query_params, body, authenticator, transport_options
+    ):
+        path = path.split("/api/4.0")[-1]
+        headers = {"Content-Type": "application/json"}
+        status = 200
+        with self.lock:
+            self.requests.append((method.name, path))
+            if method == transport.HttpMethod.POST:
+                # /render_tasks/<kind>/<id>/<format>
+                _, _, kind, content_id, result_format = path.split("/")
+                task_id = f"{kind}-{content_id}"
+                self.tasks[task_id] = {"polls": 0, "results": 0}
+                self.created[task_id] = dict(query_params or {})
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                value = json.dumps(
+                    {"id": task_id, "status": "enqueued_for_query"}
+                ).encode("utf-8")
+            elif path.endswith("/results"):
+                task_id = path.split("/")[2]
+                task = self.tasks[task_id]
+                task["results"] += 1
+                if task["results"] == 1 or task_id == "dashboards-stuck":
+                    status = 202
+                    headers = {"Retry-After": "0"}
+                    value = b""
+                else:
+                    self.in_flight -= 1
+                    headers = {"Content-Type": "application/pdf"}
+                    value = pdf(task_id)
+            else:
+                task_id = path.split("/")[2]
+                task = self.tasks[task_id]
+                task["polls"] += 1
+                if task_id == "dashboards-broken":
+                    self.in_flight -= 1
+                    data = {"status": "failure", "status_detail": "Timed out"}
+                elif task["polls"] < 2:
+                    data = {"status": "rendering"}
+                else:
+                    data = {"status": "success"}
+                value = json.dumps(dict(data, id=task_id)).encode("utf-8")
+        stream = None
+        if (transport_options or {}).get("stream"):
+            chunks = [value[i : i + 4096] for i in range(0, len(value), 4096)]
+            stream = transport.ResponseStream(chunks)
+            value = b""
+        return transport.Response(
+            ok=True,
+            value=value,
+            stream=stream,
+            response_mode=transport.response_mode(headers.get("Content-Type")),
+            status_code=status,
+            headers=headers,
+        )
+
+
+@pytest.fixture
+def sdk():
+    return conftest.sdk(FakeTransport())
+
+
+def pipeline(sdk, **kwargs):
+    return render_tasks.RenderPipeline(
+        sdk, poll_interval=0.001, max_poll_interval=0.004, **kwargs
+    )
+
+
+def test_renders_to_files(sdk, tmp_path):
+    with pipeline(sdk, max_running=3) as renders:
+        futures = [
+            renders.submit_dashboard(
+                str(i),
+                str(tmp_path / "pdfs" / f"{i}.pdf"),
+                body=models.CreateDashboardRenderTask(dashboard_style="tiled"),
+            )
+            for i in range(10)
+        ]
+    for i, future in enumerate(futures):
+        path = future.result(timeout=10)
+        assert path == str(tmp_path / "pdfs" / f"{i}.pdf")
+        with open(path, "rb") as f:
+            assert f.read() == pdf(f"dashboards-{i}")
+    fake = sdk.transport
+    assert fake.max_in_flight == 3
+    # two polls and two results requests (202, then the pdf) per task
+    assert fake.requests.count(("GET", "/render_tasks/dashboards-0")) == 2
+    assert fake.requests.count(("GET", "/render_tasks/dashboards-0/results")) == 2
+    assert not list(tmp_path.glob("pdfs/*.part"))
+
+
+def test_looks_queries_and_callables(sdk, tmp_path):
+    with pipeline(sdk) as renders:
+        look = renders.submit_look("7", str(tmp_path / "look.png"), fields="id")
+        query = renders.submit_query(
+            "8", str(tmp_path / "query.jpg"), "jpg", width=640, height=480
+        )
+        custom = renders.submit(
+            functools.partial(sdk.create_look_render_task, "9", "png", 10, 10),
+            str(tmp_path / "custom.png"),
+        )
+    assert look.result(timeout=10) == str(tmp_path / "look.png")
+    assert query.result(timeout=10) == str(tmp_path / "query.jpg")
+    assert custom.result(timeout=10) == str(tmp_path / "custom.png")
+    assert ("POST", "/render_tasks/queries/8/jpg") in sdk.transport.requests
+    assert sdk.transport.created["looks-7"]["fields"] == "id"
+    assert sdk.transport.created["queries-8"]["width"] == "640"
+    assert sdk.transport.created["queries-8"]["height"] == "480"
+
+
+def test_failed_render(sdk, tmp_path):
+    with pipeline(sdk) as renders:
+        broken = renders.submit_dashboard("broken", str(tmp_path / "broken.pdf"))
+        fine = renders.submit_dashboard("1", str(tmp_path / "1.pdf"))
+    with pytest.raises(error.SDKError, match="failed: Timed out"):
+        broken.result(timeout=10)
+    assert fine.result(timeout=10)
+    assert not (tmp_path / "broken.pdf").exists()
+    with pytest.raises(RuntimeError):
+        renders.submit_dashboard("2", str(tmp_path / "2.pdf"))
+
+
+def test_download_timeout(sdk, tmp_path):
+    with pipeline(sdk, download_timeout=0.05) as renders:
+        stuck = renders.submit_dashboard("stuck", str(tmp_path / "stuck.pdf"))
+        fine = renders.submit_dashboard("1", str(tmp_path / "1.pdf"))
+    with pytest.raises(error.SDKError, match="not ready after 0.05 seconds"):
+        stuck.result(timeout=10)
+    assert fine.result(timeout=10)
+    assert sdk.transport.tasks["dashboards-stuck"]["results"] > 1
+    assert not (tmp_path / "stuck.pdf").exists()
+
+
+def test_failed_create(sdk, tmp_path):
+    def create():
+        raise error.SDKError("Not found")
+
+    with pipeline(sdk, max_running=1) as renders:
+        missing = renders.submit(create, str(tmp_path / "missing.pdf"))
+        fine = renders.submit_look("1", str(tmp_path / "1.png"))
+    with pytest.raises(error.SDKError, match="Not found"):
+        missing.result(timeout=10)
+    assert fine.result(timeout=10)
+
+
+def test_close_without_waiting(sdk, tmp_path):
+    renders = pipeline(sdk, max_running=1)
+    # the first render's status poll is an hour away, the others wait for it
+    renders.poll_interval = 3600
+    first = renders.submit_dashboard("1", str(tmp_path / "1.pdf"))
+    queued = [
+        renders.submit_dashboard(str(i), str(tmp_path / f"{i}.pdf"))
+        for i in range(2, 5)
+    ]
+    for _ in range(1000):
+        with renders._cond:
+            if renders._scheduled:
+                break
+        threading.Event().wait(0.01)
+    renders.close(wait=False)
+    with pytest.raises(error.SDKError, match="closed"):
+        first.result(timeout=10)
+    assert all(future.cancelled() for future in queued)
+    renders._thread.join(timeout=10)
+    assert not renders._thread.is_alive()
+    assert list(sdk.transport.tasks) == ["dashboards-1"]
@@ -20,11 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import threading
 from typing import cast, MutableMapping, Optional
 
 import attr
 import pytest  # type: ignore
 import requests
+import urllib3
 
 from looker_sdk.rtl import requests_transport
 from looker_sdk.rtl import transport
@@ -38,6 +40,7 @@ class Response:
     ok: bool
     content: bytes
     headers: MutableMapping[str, str]
+    status_code: int = 200
 
 
 class Session:
@@ -131,6 +134,8 @@ def test_request_ok(
     assert resp.ok is True
     assert resp.response_mode == expected_response_mode
     assert resp.encoding == expected_encoding
+    assert resp.status_code == 200
+    assert resp.headers["Content-Type"] == headers["Content-Type"]
 
 
 @pytest.mark.parametrize(
@@ -169,3 +174,179 @@ def test_request_error(settings):
     assert isinstance(resp, transport.Response)
     assert resp.value == b"(54, 'Connection reset by peer')"
     assert resp.ok is False
+    assert resp.status_code is None
+    assert isinstance(resp.exception, IOError)
+    assert resp.sent is True
+
+
+@pytest.mark.parametrize(
+    "exc, sent",
+    [
+        (requests.exceptions.ReadTimeout("read timed out"), True),
+        (requests.exceptions.ConnectionError("Connection aborted."), True),
+        (requests.exceptions.ConnectTimeout("connect timed out"), False),
+        (
+            requests.exceptions.ConnectionError(
+                urllib3.exceptions.MaxRetryError(
+                    None,
+                    "/some/path",
+                    urllib3.exceptions.NewConnectionError(None, "refused"),
+                )
+            ),
+            False,
+        ),
+    ],
+)
+def test_request_error_sent(settings, exc, sent):
+    """Test connect errors are told apart from errors after sending"""
+
+    class FailingSession(Session):
+        def request(self, *args, **kwargs):
+            raise exc
+
+    session = cast(requests.Session, FailingSession(None))
+    test = requests_transport.RequestsTransport(settings, session)
+    resp = test.request(transport.HttpMethod.GET, "/some/path")
+    assert resp.exception is exc
+    assert resp.sent is sent
+
+
+class StreamingResponse(Response):
+    """Fake streamed requests.Response"""
+
+    closed = False
+
+    def iter_content(self, chunk_size):
+        return iter([self.content[:2], self.content[2:]])
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingSession(Session):
+    """Fake requests.Session recording the stream kwarg"""
+
+    def request(self, method, url, auth, params, data, headers, timeout, **kwargs):
+        self.kwargs = kwargs
+        return self.ret_val
+
+
+@pytest.mark.parametrize("ok", [True, False])
+def test_request_stream(settings, ok):
+    """Test streamed responses only stream successful bodies"""
+    ret_val = StreamingResponse(
+        ok=ok,
+        content=b"a,b\nc,d",
+        headers=requests.structures.CaseInsensitiveDict({"Content-Type": "text/csv"}),
+    )
+    session = StreamingSession(ret_val)
+    test = requests_transport.RequestsTransport(
+        settings, cast(requests.Session, session)
+    )
+    resp = test.request(
+        transport.HttpMethod.GET, "/some/path", transport_options={"stream": True}
+    )
+    assert session.kwargs == {"stream": True}
+    assert resp.ok is ok
+    if ok:
+        assert resp.value == b""
+        assert resp.stream is not None
+        assert list(resp.stream.iter_lines()) == ["a,b", "c,d"]
+        resp.stream.close()
+        assert ret_val.closed
+    else:
+        assert resp.stream is None
+        assert resp.value == b"a,b\nc,d"
+
+
+def test_configure_sizes_connection_pool(settings):
+    """Test the pool settings configure one adapter for http and https"""
+    settings.pool_connections = 2
+    settings.pool_maxsize = 64
+    settings.pool_block = True
+    test = requests_transport.RequestsTransport.configure(settings)
+    adapter = test.session.get_adapter("https://host1.looker.com")
+    assert adapter is test.session.get_adapter("http://localhost")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.poolmanager.pools._maxsize == 2
+
+
+def test_keep_alive_disabled(settings):
+    settings.keep_alive = False
+    test = requests_transport.RequestsTransport.configure(settings)
+    assert test.session.headers["Connection"] == "close"
+
+
+def test_session_per_thread(settings):
+    """Test each thread gets a session and all of them share the pool"""
+    settings.session_per_thread = True
+    test = requests_transport.RequestsTransport.configure(settings)
+    sessions = []
+    threads = [
+        threading.Thread(target=lambda: sessions.append(test.session))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    main = test.session
+    assert main is test.session
+    assert len({id(s) for s in sessions + [main]}) == 3
+    adapter = main.get_adapter("https://host1.looker.com")
+    for session in sessions:
+        assert session.get_adapter("https://host1.looker.com") is adapter
+        assert session.headers["x-looker-appid"] == "foobar"
+
+
+@pytest.mark.parametrize(
+    "connect_timeout, read_timeout, option, expected",
+    [
+        (None, None, None, 120),
+        (None, 300, None, 300),
+        (None, 300, 5, 5),
+        (3.5, None, None, (3.5, 120)),
+        (3.5, 300, 5, (3.5, 5)),
+    ],
+)
+def test_request_timeouts(settings, connect_timeout, read_timeout, option, expected):
+    settings.connect_timeout = connect_timeout
+    settings.read_timeout = read_timeout
+    session = TimeoutSession(
+        Response(ok=True, content=b"", headers=requests.structures.CaseInsensitiveDict())
+    )
+    test = requests_transport.RequestsTransport(
+        settings, cast(requests.Session, session)
+    )
+    test.request(
+        transport.HttpMethod.GET,
+        "/some/path",
+        transport_options={"timeout": option} if option else None,
+    )
+    assert session.timeout == expected
+
+
+class TimeoutSession(Session):
+    """Fake requests.Session recording the timeout"""
+
+    def request(self, method, url, auth, params, data, headers, timeout):
+        self.timeout = timeout
+        return self.ret_val
+
+
+def test_request_timings(settings):
+    ret_val = Response(ok=True, content=b"yay!", headers={})
+    session = StreamingSession(ret_val)
+    test = requests_transport.RequestsTransport(
+        settings, cast(requests.Session, session)
+    )
+    timings = {"wait": 1.0}
+    resp = test.request(
+        transport.HttpMethod.GET, "/some/path", transport_options={"timings": timings}
+    )
+    assert resp.value == b"yay!"
+    # the body is read separately to time its download
+    assert session.kwargs == {"stream": True}
+    assert timings["wait"] > 1.0
+    assert timings["download"] >= 0
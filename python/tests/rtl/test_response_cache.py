@@ -0,0 +1,223 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import concurrent.futures
+import functools
+import os
+import sys
+import time
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import api_methods
+from looker_sdk.rtl import response_cache
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import models
+from tests.rtl import conftest
+
+response = functools.partial(conftest.response, value=b'{"id": "1"}')
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield response_cache.MemoryBackend(max_bytes=450)
+    elif request.param == "sqlite":
+        backend = response_cache.SQLiteBackend(
+            str(tmp_path / "cache.db"), max_bytes=450
+        )
+        yield backend
+        backend.close()
+    else:
+        yield response_cache.FileBackend(str(tmp_path / "cache"), max_bytes=700)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_backends_are_private(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "CACHE_DIRECTORY", str(tmp_path / "cache"))
+    sqlite = response_cache.SQLiteBackend()
+    sqlite.set("k", "/users/1", response(), time.time() + 60)
+    sqlite.close()
+    files = response_cache.FileBackend()
+    files.set("k", "/users/1", response(), time.time() + 60)
+    assert os.stat(tmp_path / "cache").st_mode & 0o777 == 0o700
+    assert os.stat(files.directory).st_mode & 0o777 == 0o700
+    for name in [sqlite.path] + [
+        os.path.join(files.directory, f) for f in os.listdir(files.directory)
+    ]:
+        assert os.stat(name).st_mode & 0o777 == 0o600, name
+
+    shared = tmp_path / "shared.db"
+    shared.write_bytes(b"")
+    os.chmod(shared, 0o644)
+    response_cache.SQLiteBackend(str(shared)).close()
+    assert os.stat(shared).st_mode & 0o777 == 0o600
+
+
+def test_backend_get_set(backend):
+    later = time.time() + 60
+    assert backend.get("k") is None
+    backend.set("k", "/users/1", response(value=b"\x00body"), later)
+    cached = backend.get("k")
+    assert cached.value == b"\x00body"
+    assert cached.response_mode == transport.ResponseMode.STRING
+    assert cached.encoding == "utf-8"
+    assert cached.ok is True
+    backend.set("expired", "/users/2", response(), time.time() - 1)
+    assert backend.get("expired") is None
+    backend.clear()
+    assert backend.get("k") is None
+
+
+USERS = ["/users/1", "/users/1/roles", "/users", "/users/search"]
+
+
+@pytest.mark.parametrize(
+    "write, stale",
+    [
+        ("/users/1", USERS),
+        ("/users", USERS),
+        ("/users/2/roles", USERS),
+        ("/roles/3", ["/roles"]),
+    ],
+)
+def test_backend_invalidate(backend, write, stale):
+    later = time.time() + 60
+    paths = USERS + ["/users_x", "/roles"]
+    for path in paths:
+        backend.set(path, path, response(value=b"x"), later)
+    backend.invalidate(write)
+    assert [p for p in paths if backend.get(p) is None] == stale
+
+
+def test_backend_evicts_least_recently_used(backend):
+    later = time.time() + 60
+    backend.set("a", "/a", response(value=b"a" * 200), later)
+    time.sleep(0.01)
+    backend.set("b", "/b", response(value=b"b" * 200), later)
+    time.sleep(0.01)
+    assert backend.get("a") is not None
+    time.sleep(0.01)
+    # the file backend's headers count towards its max_bytes
+    backend.set("c", "/c", response(value=b"c" * 200), later)
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+
+
+def test_memory_backend_max_entries():
+    backend = response_cache.MemoryBackend(max_entries=2)
+    for key in "abc":
+        backend.set(key, "/" + key, response(), time.time() + 60)
+    assert [backend.get(key) is None for key in "abc"] == [True, False, False]
+
+
+def test_ttl_for():
+    cache = response_cache.ResponseCache(
+        ttl=60, ttls={"/users/*": 10, "/session": 0, "/queries/*/run/*": 5}
+    )
+    assert cache.ttl_for("/dashboards/1") == 60
+    assert cache.ttl_for("users/1") == 10
+    assert cache.ttl_for("/session") == 0
+    assert cache.ttl_for("/queries/1/run/json") == 5
+    assert cache.ttl_for("/looks/1/run/csv") == 0
+
+
+class CountingTransport(transport.Transport):
+    def __init__(self):
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        self.requests.append((method, path))
+        n = len(self.requests)
+        value = f'{{"id": "1", "first_name": "v{n}"}}'.encode("utf-8")
+        return response(value=value)
+
+
+@pytest.fixture
+def api():
+    api = conftest.sdk(CountingTransport(), api_methods.APIMethods, conftest.NoAuth)
+    api.response_cache = response_cache.ResponseCache()
+    return api
+
+
+def test_get_is_cached(api):
+    first = api.get("/users/1", models.User)
+    second = api.get("/users/1", models.User)
+    assert first == second == models.User(id="1", first_name="v1")
+    # every hit is deserialized afresh, callers may modify their models
+    assert first is not second
+    assert len(api.transport.requests) == 1
+    assert api.get("/users/1", models.User, query_params={"fields": "id"})
+    assert len(api.transport.requests) == 2
+    assert (api.response_cache.hits, api.response_cache.misses) == (1, 2)
+
+
+def test_counters_are_thread_safe():
+    cache = response_cache.ResponseCache()
+    cache.put("k", "/users/1", response())
+
+    def lookups(_):
+        for key in ["k", "missing"] * 500:
+            cache.get(key)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lookups, range(8)))
+    assert (cache.hits, cache.misses) == (4000, 4000)
+
+
+def test_writes_invalidate(api):
+    api.get("/users/1", models.User)
+    api.get("/users", str)
+    api.patch("/users/1", models.User, body={"first_name": "x"})
+    assert api.get("/users/1", models.User).first_name == "v4"
+    api.get("/users", str)
+    assert len(api.transport.requests) == 5
+
+
+def test_streams_and_queries_are_not_cached(api):
+    api.get("/queries/1/run/json", str)
+    api.get("/queries/1/run/json", str)
+    assert len(api.transport.requests) == 2
+    api.transport.requests.clear()
+    api.get("/users/1", str, transport_options={"stream": True})
+    api.get("/users/1", str)
+    assert len(api.transport.requests) == 2
+
+
+def test_sudo_users_are_cached_separately(api):
+    api.get("/users/1", str)
+    api.auth._sudo_id = 5
+    api.get("/users/1", str)
+    assert len(api.transport.requests) == 2
@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import json
+
+import pytest  # type: ignore
+
+from looker_sdk import results
+from tests.rtl import conftest
+
+JSON_BI = {
+    "metadata": {
+        "fields": {
+            "dimensions": [
+                {"name": "users.name", "type": "string"},
+                {"name": "users.is_admin", "type": "yesno"},
+            ],
+            "measures": [
+                {"name": "users.count", "type": "count"},
+                {"name": "users.average_age", "type": "average"},
+            ],
+            "pivots": [],
+            "table_calculations": [{"name": "share", "measure": True}],
+        }
+    },
+    "rows": [
+        {
+            "users.name": "Jane",
+            "users.is_admin": "Yes",
+            "users.count": 3,
+            "users.average_age": 30,
+            "share": 0.75,
+        },
+        {
+            "users.name": "Zoë",
+            "users.is_admin": "No",
+            "users.count": 1,
+            "users.average_age": None,
+            "share": 0.25,
+        },
+    ],
+}
+JSON = [{"a": 1, "b": "x"}, {"a": 2, "c": True}]
+CSV = 'name,note\r\nJane,"multi\nline"\r\nZoë,plain\r\n'
+
+
+def test_columns_json():
+    actual = results.columns(conftest.chunked(json.dumps(JSON).encode("utf-8")))
+    assert actual.data == {"a": [1, 2], "b": ["x", None], "c": [None, True]}
+    assert actual.types == {}
+    assert len(actual) == 2
+
+
+def test_columns_json_bi():
+    actual = results.columns(json.dumps(JSON_BI), "json_bi")
+    assert actual.data["users.name"] == ["Jane", "Zoë"]
+    assert actual.data["users.average_age"] == [30, None]
+    assert actual.types == {
+        "users.name": "string",
+        "users.is_admin": "yesno",
+        "users.count": "count",
+        "users.average_age": "average",
+        "share": "number",
+    }
+
+
+def test_columns_csv():
+    actual = results.columns(conftest.chunked(CSV.encode("utf-8")), "csv")
+    assert actual.data == {"name": ["Jane", "Zoë"], "note": ["multi\nline", "plain"]}
+
+
+def test_columns_unsupported_format():
+    with pytest.raises(ValueError):
+        results.columns(b"<html/>", "html")
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    actual = results.to_numpy(conftest.chunked(json.dumps(JSON_BI).encode("utf-8")), "json_bi")
+    assert actual["users.count"].dtype == np.int64
+    assert actual["users.is_admin"].tolist() == [True, False]
+    assert actual["users.average_age"][0] == 30.0
+    assert np.isnan(actual["users.average_age"][1])
+    assert actual["users.name"].dtype == object
+    plain = results.to_numpy(json.dumps(JSON))
+    assert plain["a"].dtype.kind == "i"
+    assert plain["b"].tolist() == ["x", None]
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = results.to_arrow(json.dumps(JSON_BI).encode("utf-8"), "json_bi")
+    assert table.schema.field("users.count").type == pa.int64()
+    assert table.schema.field("users.average_age").type == pa.float64()
+    assert table.schema.field("users.is_admin").type == pa.bool_()
+    assert table.column("users.name").to_pylist() == ["Jane", "Zoë"]
+
+
+def test_to_arrow_csv():
+    pytest.importorskip("pyarrow")
+    table = results.to_arrow(conftest.chunked(CSV.encode("utf-8")), "csv")
+    assert table.column("note").to_pylist() == ["multi\nline", "plain"]
+
+
+def test_to_pandas():
+    pytest.importorskip("pandas")
+    frame = results.to_pandas(json.dumps(JSON_BI), "json_bi")
+    assert list(frame["users.count"]) == [3, 1]
@@ -0,0 +1,226 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import datetime
+import email.utils
+import functools
+
+import pytest  # type: ignore
+
+from looker_sdk import error
+from looker_sdk.rtl import api_methods
+from looker_sdk.rtl import retry
+from looker_sdk.rtl import transport
+from tests.rtl import conftest
+
+GET = transport.HttpMethod.GET
+POST = transport.HttpMethod.POST
+
+response = functools.partial(conftest.response, value=b"done")
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        (None, None),
+        ({"Retry-After": "7"}, 7),
+        ({"Retry-After": "1.5"}, 1.5),
+        ({"Retry-After": "-3"}, 0),
+        ({"Retry-After": "soon"}, None),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0),
+    ],
+)
+def test_retry_after(headers, expected):
+    assert retry.retry_after(response(429, headers=headers)) == expected
+
+
+def test_retry_after_http_date():
+    when = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        seconds=30
+    )
+    headers = {"Retry-After": email.utils.format_datetime(when, usegmt=True)}
+    assert 25 < retry.retry_after(response(503, headers=headers)) <= 30
+
+
+def test_delay_backs_off_exponentially():
+    policy = retry.RetryPolicy(backoff=0.5, max_backoff=1.5, jitter=False)
+    delays = [policy.delay(GET, response(503), attempt) for attempt in range(1, 5)]
+    assert delays == [0.5, 1.0, 1.5, None]
+
+
+def test_delay_jitter_stays_below_backoff():
+    policy = retry.RetryPolicy(backoff=2, max_retries=100)
+    for attempt in range(1, 50):
+        assert 0 <= policy.delay(GET, response(429), attempt) <= 30
+
+
+def test_delay_honours_retry_after():
+    policy = retry.RetryPolicy(max_retry_after=60)
+    assert policy.delay(GET, response(429, headers={"Retry-After": "42"}), 1) == 42
+    assert policy.delay(GET, response(429, headers={"Retry-After": "61"}), 1) is None
+
+
+@pytest.mark.parametrize(
+    "method, resp, expected",
+    [
+        (GET, response(200), False),
+        (GET, response(404), False),
+        (GET, response(500), False),
+        (GET, response(502), True),
+        (POST, response(503), False),
+        (transport.HttpMethod.PUT, response(429), True),
+        (GET, response(None, exception=IOError("refused"), sent=False), True),
+        # the server may have received the request and still be running it
+        (GET, response(None, exception=IOError("read timed out")), False),
+        # a failed response a transport built without saying why
+        (GET, response(None), False),
+    ],
+)
+def test_retryable(method, resp, expected):
+    assert retry.RetryPolicy().retryable(method, resp) is expected
+
+
+class SequenceTransport(transport.Transport):
+    """Serves the given responses in order and records each request"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls([])
+
+    def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        self.requests.append((method, path, body))
+        return self.responses.pop(0)
+
+
+def sdk(responses):
+    fake = SequenceTransport(responses)
+    api = conftest.sdk(fake, api_methods.APIMethods, conftest.NoAuth)
+    api.retry = retry.RetryPolicy(backoff=0)
+    return api, fake
+
+
+def test_get_retries_until_success():
+    retried = []
+    api, fake = sdk(
+        [response(503), response(429, headers={"Retry-After": "0"}), response(200)]
+    )
+    api.retry.on_retry = lambda *args: retried.append(args[2:4])
+    assert api.get("/user", str) == "done"
+    assert len(fake.requests) == 3
+    assert retried == [(1, 0), (2, 0)]
+    assert api.retry_stats.as_dict() == {
+        "requests": 3,
+        "retries": 2,
+        "reasons": {"503": 1, "429": 1},
+        "gave_up": 0,
+        "waited": 0,
+    }
+
+
+def test_get_gives_up_after_max_retries():
+    api, fake = sdk([response(503, value=b"unavailable")] * 4)
+    api.retry.max_retries = 2
+    with pytest.raises(error.SDKError):
+        api.get("/user", str)
+    assert len(fake.requests) == 3
+    assert api.retry_stats.gave_up == 1
+
+
+def test_post_is_not_retried_by_default():
+    api, fake = sdk([response(503, value=b"unavailable"), response(200)])
+    with pytest.raises(error.SDKError):
+        api.post("/users", str, body={"first_name": "x"})
+    assert len(fake.requests) == 1
+
+    api, fake = sdk([response(503), response(200)])
+    api.retry.methods = retry.IDEMPOTENT_METHODS | {POST}
+    assert api.post("/users", str, body={"first_name": "x"}) == "done"
+    assert fake.requests[0][2] == fake.requests[1][2]
+
+
+def test_read_errors_are_not_retried_by_default():
+    timeout = IOError("read timed out")
+    api, fake = sdk([response(None, exception=timeout), response(200)])
+    with pytest.raises(error.SDKError):
+        api.get("/queries/1/run/json", str)
+    assert len(fake.requests) == 1
+    assert api.retry_stats.gave_up == 0
+
+    api, fake = sdk([response(None, exception=timeout), response(200)])
+    api.retry.retry_read_errors = True
+    assert api.get("/queries/1/run/json", str) == "done"
+    assert len(fake.requests) == 2
+
+
+def test_retry_policy_per_call():
+    api, fake = sdk([response(503, value=b"unavailable"), response(200)])
+    with pytest.raises(error.SDKError):
+        api.get("/user", str, transport_options={"retry": None})
+    assert len(fake.requests) == 1
+
+    api, fake = sdk([response(503), response(503), response(200)])
+    api.retry = None
+    policy = retry.RetryPolicy(backoff=0)
+    assert api.get("/user", str, transport_options={"retry": policy}) == "done"
+
+
+class SequenceAsyncTransport(transport.AsyncTransport):
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    @classmethod
+    def configure(cls, settings):
+        return cls([])
+
+    async def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        return self.responses.pop(0)
+
+
+def test_async_get_retries():
+    fake = SequenceAsyncTransport(
+        [response(None, exception=IOError("refused"), sent=False), response(200)]
+    )
+    api = conftest.sdk(fake, api_methods.AsyncAPIMethods, conftest.NoAsyncAuth)
+    api.retry = retry.RetryPolicy(backoff=0)
+    assert asyncio.run(api.get("/user", str)) == "done"
+    assert api.retry_stats.reasons == {"io_error": 1}
@@ -24,6 +24,7 @@ import copy
 import datetime
 import enum
 import functools
+import importlib.util
 import json
 
 from typing import Optional, Sequence
@@ -213,6 +214,9 @@ class ModelNoRefs2(ml.Model):
         self.name2 = name2
 
 
+pytestmark = pytest.mark.usefixtures("stdlib_json")
+
+
 converter = cattr.Converter()
 translate_keys_structure_hook = functools.partial(
     sr.translate_keys_structure_hook, converter
@@ -768,3 +772,72 @@ def test_safe_enum_deserialization():
         sr.deserialize(data=json.dumps(data), structure=Model, converter=converter)
         == model
     )
+
+
+def test_deserialize40_nested_models():
+    """converter40 resolves ForwardRefs and reserved keywords via its hooks."""
+    from looker_sdk.sdk.api40 import models as mdls
+
+    data = [
+        {
+            "name": "joined",
+            "from": "source_view",
+            "fields": ["a", "b"],
+            "relationship": None,
+        }
+    ]
+    joins = sr.deserialize40(
+        data=json.dumps(data), structure=Sequence[mdls.LookmlModelExploreJoins]
+    )
+    assert joins == [
+        mdls.LookmlModelExploreJoins(
+            name="joined", from_="source_view", fields=["a", "b"]
+        )
+    ]
+
+    data = {
+        "id": "1",
+        "dashboard_filters": [{"name": "f1", "required": True}],
+        "folder": {"id": "2", "parent_id": None, "name": "Shared"},
+    }
+    dashboard = sr.deserialize40(data=json.dumps(data), structure=mdls.Dashboard)
+    assert dashboard == mdls.Dashboard(
+        id="1",
+        dashboard_filters=[mdls.DashboardFilter(name="f1", required=True)],
+        folder=mdls.FolderBase(id="2", parent_id=None, name="Shared"),
+    )
+
+
+def test_forward_ref_structure_hook_factory_rejects_unknown_types():
+    with pytest.raises(sr.DeserializeError):
+        sr.forward_ref_structure_hook_factory(
+            globals(), converter, ForwardRef("datetime")
+        )
+
+
+def _installed_codecs():
+    return ["json"] + [
+        name for name in ["orjson", "ujson"] if importlib.util.find_spec(name)
+    ]
+
+
+@pytest.mark.parametrize("codec", _installed_codecs())
+def test_json_codecs(codec):
+    sr.set_json_codec(codec)
+    assert sr.json_codec().name == codec
+    model = sr.deserialize(
+        data=json.dumps(MODEL_DATA).encode("utf-8"), structure=Model, converter=converter
+    )
+    assert model.model_no_refs1 == ModelNoRefs1(name1="model_no_refs1_name")
+    assert json.loads(sr.serialize(api_model=model, converter=converter)) == MODEL_DATA
+    with pytest.raises(sr.DeserializeError):
+        sr.deserialize(data=b"{nope", structure=Model, converter=converter)
+
+
+def test_set_json_codec():
+    custom = sr.JsonCodec(name="custom", loads=json.loads, dumps=lambda d: b"{}")
+    assert sr.set_json_codec(custom) is sr.json_codec() is custom
+    assert sr.serialize(api_model={"a": 1}, converter=converter) == b"{}"
+    assert sr.set_json_codec().name in ["orjson", "ujson", "json"]
+    with pytest.raises(ValueError):
+        sr.set_json_codec("simplejson")
@@ -0,0 +1,180 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import api_methods
+from looker_sdk.rtl import single_flight
+from looker_sdk.rtl import transport
+from looker_sdk.sdk.api40 import models
+from tests.rtl import conftest
+
+
+def test_do_shares_the_result_of_the_call_in_flight():
+    flight = single_flight.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=9) as executor:
+        leader = executor.submit(flight.do, "key", slow)
+        started.wait(5)
+        followers = [executor.submit(flight.do, "key", slow) for _ in range(7)]
+        other = executor.submit(flight.do, "other", lambda: "other")
+        assert other.result(5) == "other"
+        while flight.shared < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result(5) for f in [leader] + followers]
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert (flight.calls, flight.shared) == (2, 7)
+    # nothing in flight any more so the next call runs again
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_do_shares_exceptions():
+    flight = single_flight.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise IOError("boom")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        started.wait(5)
+        follower = executor.submit(flight.do, "key", fail)
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(IOError):
+                future.result(5)
+
+
+class SlowTransport(transport.Transport):
+    def __init__(self):
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    def request(
+        self,
+        method,
+        path,
+        query_params=None,
+        body=None,
+        authenticator=None,
+        transport_options=None,
+    ):
+        self.requests.append((path, query_params))
+        time.sleep(0.2)
+        return conftest.response(value=b'{"id": "1", "title": "Sales"}')
+
+
+def test_get_coalesces_identical_requests():
+    fake = SlowTransport()
+    api = conftest.sdk(fake, api_methods.APIMethods, conftest.NoAuth)
+    api.single_flight = single_flight.SingleFlight()
+    calls = [("/dashboards/1", None)] * 6 + [("/dashboards/1", {"fields": "id"})] * 2
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda c: api.get(c[0], models.Dashboard, query_params=c[1]), calls
+            )
+        )
+    assert len(fake.requests) == 2
+    assert all(r == models.Dashboard(id="1", title="Sales") for r in results)
+    # each caller deserializes its own model
+    assert len({id(r) for r in results}) == len(results)
+
+
+class SlowAsyncTransport(transport.AsyncTransport):
+    def __init__(self):
+        self.requests = []
+
+    @classmethod
+    def configure(cls, settings):
+        return cls()
+
+    async def request(self, method, path, *args, **kwargs):
+        self.requests.append(path)
+        await asyncio.sleep(0.05)
+        return conftest.response(value=b"done")
+
+
+def test_async_get_coalesces_identical_requests():
+    fake = SlowAsyncTransport()
+    api = conftest.sdk(fake, api_methods.AsyncAPIMethods, conftest.NoAsyncAuth)
+    api.single_flight = single_flight.SingleFlight()
+
+    async def run():
+        return await asyncio.gather(
+            *(api.get("/dashboards/1", str) for _ in range(5)),
+            api.get("/dashboards/2", str),
+        )
+
+    assert asyncio.run(run()) == ["done"] * 6
+    assert fake.requests.count(fake.requests[0]) == 1
+    assert len(fake.requests) == 2
+    assert api.single_flight.shared == 4
+
+
+def test_do_async_survives_the_leader_being_cancelled():
+    flight = single_flight.SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def run():
+        leader = asyncio.ensure_future(
+            asyncio.wait_for(flight.do_async("key", fetch), timeout=0.01)
+        )
+        await asyncio.sleep(0)
+        follower = flight.do_async("key", fetch)
+        results = await asyncio.gather(leader, follower, return_exceptions=True)
+        return results
+
+    leader, follower = asyncio.run(run())
+    assert isinstance(leader, asyncio.TimeoutError)
+    assert follower == "value"
+    assert calls == [1]
+    assert flight.shared == 1
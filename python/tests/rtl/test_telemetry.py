@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import retry
+from looker_sdk.rtl import telemetry
+from tests.rtl import conftest
+
+pytest.importorskip("opentelemetry.sdk")
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+
+class FakeTransport(conftest.FakeTransport):
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.headers = []
+
+    def respond(
+        self, method, path, query_params, body, authenticator, transport_options
+    ):
+        headers = dict((transport_options or {}).get("headers", {}))
+        headers.update(authenticator(transport_options or {}))
+        self.headers.append(headers)
+        status_code, value = self.responses.pop(0)
+        return conftest.response(status_code, value)
+
+
+def sdk(responses):
+    sdk = conftest.sdk(FakeTransport(responses))
+    sdk.retry = retry.RetryPolicy(backoff=0)
+    return sdk
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def reader():
+    return InMemoryMetricReader()
+
+
+def instrument(sdk, exporter, reader):
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    telemetry.instrument(sdk, tracer_provider, MeterProvider(metric_readers=[reader]))
+
+
+def test_api_call_span(exporter, reader):
+    looker = sdk([(503, b"busy"), (200, b'{"id": "42", "title": "Sales"}')])
+    instrument(looker, exporter, reader)
+    assert looker.dashboard("42").title == "Sales"
+
+    login, call = exporter.get_finished_spans()
+    assert call.name == "GET /dashboards/{dashboard_id}"
+    assert call.attributes["looker.method"] == "dashboard"
+    assert call.attributes["http.response.status_code"] == 200
+    assert call.attributes["http.response.body.size"] == 30
+    assert call.attributes["looker.retries"] == 1
+    assert login.name == "looker.login"
+    assert login.parent.span_id == call.context.span_id
+
+    traceparent = looker.transport.headers[-1]["traceparent"]
+    assert traceparent.split("-")[1] == format(call.context.trace_id, "032x")
+
+    (metric,) = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    assert metric.name == "looker.api.duration"
+    (point,) = metric.data.data_points
+    assert point.count == 1
+    assert point.attributes["http.route"] == "/dashboards/{dashboard_id}"
+
+
+def test_direct_call_span(exporter, reader):
+    looker = sdk([(200, b"{}"), (200, b"{}")])
+    instrument(looker, exporter, reader)
+    looker.get("/users/7", str)
+    looker.get("/users/7", str, operation="user", route="/users/{user_id}")
+    _, plain, named = exporter.get_finished_spans()
+    # without a route the span is named after the path itself
+    assert plain.name == "GET /users/7"
+    assert plain.attributes["looker.method"] == ""
+    assert named.name == "GET /users/{user_id}"
+    assert named.attributes["looker.method"] == "user"
+
+
+def test_failed_call_span(exporter, reader):
+    looker = sdk([(404, b'{"message": "Not found"}')])
+    instrument(looker, exporter, reader)
+    with pytest.raises(Exception):
+        looker.dashboard("42")
+    call = exporter.get_finished_spans()[-1]
+    assert call.status.is_ok is False
+    assert call.attributes["http.response.status_code"] == 404
+
+
+def test_disabled_by_default():
+    looker = sdk([(200, b"{}")])
+    looker.dashboard("42")
+    assert "traceparent" not in looker.transport.headers[0]
+    assert looker.telemetry is None and looker.auth.telemetry is None
@@ -0,0 +1,124 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2019 Looker Data Sciences, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import datetime
+import os
+import sys
+
+import pytest  # type: ignore
+
+from looker_sdk.rtl import auth_token
+from looker_sdk.rtl import token_store
+
+
+def token(access_token="abc", expires_in=3600):
+    return auth_token.AuthToken(
+        auth_token.AccessToken(
+            access_token=access_token, token_type="Bearer", expires_in=expires_in
+        )
+    )
+
+
+def test_file_store_round_trip(tmp_path):
+    store = token_store.FileTokenStore(str(tmp_path / "looker" / "tokens.json"))
+    key = token_store.token_key("https://looker.example.com", "client")
+    assert store.load(key) is None
+    saved = token()
+    store.save(key, saved)
+    store.save("other", token("def"))
+    loaded = store.load(key)
+    assert loaded.access_token == "abc"
+    assert loaded.token_type == "Bearer"
+    assert loaded.expires_at == saved.expires_at
+    assert loaded.is_active
+    store.delete(key)
+    assert store.load(key) is None
+    assert store.load("other").access_token == "def"
+
+
+def test_file_store_keeps_lag_time(tmp_path):
+    store = token_store.FileTokenStore(str(tmp_path / "tokens.json"))
+    store.save("key", token(expires_in=5))
+    # expires_in 5 minus the 10 second lag_time
+    assert not store.load("key").is_active
+    assert datetime.datetime.now() - store.load("key").expires_at < datetime.timedelta(
+        seconds=6
+    )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_file_store_permissions(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("{}")
+    os.chmod(path, 0o644)
+    token_store.FileTokenStore(str(path)).save("key", token())
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    store = token_store.FileTokenStore(str(tmp_path / "new" / "tokens.json"))
+    store.save("key", token())
+    assert os.stat(tmp_path / "new").st_mode & 0o777 == 0o700
+    assert os.stat(store.path).st_mode & 0o777 == 0o600
+
+
+def test_file_store_ignores_bad_content(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("not json")
+    store = token_store.FileTokenStore(str(path))
+    assert store.load("key") is None
+    store.save("key", token())
+    assert store.load("key").access_token == "abc"
+    path.write_text('{"key": {"access_token": "abc"}}')
+    assert store.load("key") is None
+
+
+def test_keyring_store():
+    keyring = pytest.importorskip("keyring")
+    from keyring import backend
+
+    class MemoryKeyring(backend.KeyringBackend):
+        priority = 1
+
+        def __init__(self):
+            super().__init__()
+            self.passwords = {}
+
+        def get_password(self, service, username):
+            return self.passwords.get((service, username))
+
+        def set_password(self, service, username, password):
+            self.passwords[(service, username)] = password
+
+        def delete_password(self, service, username):
+            if (service, username) not in self.passwords:
+                raise keyring.errors.PasswordDeleteError(username)
+            del self.passwords[(service, username)]
+
+    previous = keyring.get_keyring()
+    keyring.set_keyring(MemoryKeyring())
+    try:
+        store = token_store.KeyringTokenStore()
+        store.save("key", token())
+        assert store.load("key").access_token == "abc"
+        store.delete("key")
+        store.delete("key")
+        assert store.load("key") is None
+    finally:
+        keyring.set_keyring(previous)
@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import io
+
 import pytest  # type: ignore
 
 from looker_sdk.rtl import transport
@@ -32,3 +34,48 @@ def test_string_mode(string_content_types):
 def test_binary_mode(binary_content_types):
     for content_type in binary_content_types:
         assert transport.response_mode(content_type) == transport.ResponseMode.BINARY
+
+
+class Closer:
+    def __init__(self):
+        self.closed = False
+
+    def __call__(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    "chunks, encoding, expected",
+    [
+        ([b"a,b\nc,", b"d\n"], "utf-8", ["a,b", "c,d"]),
+        ([b"a,b\r", b"\nc,d"], "utf-8", ["a,b", "c,d"]),
+        (["é\nü".encode("utf-8")[:1], "é\nü".encode("utf-8")[1:]], "utf-8", ["é", "ü"]),
+        ([b"", b"x\n\ny"], "latin1", ["x", "", "y"]),
+    ],
+)
+def test_response_stream_iter_lines(chunks, encoding, expected):
+    stream = transport.ResponseStream(iter(chunks), encoding)
+    assert list(stream.iter_lines()) == expected
+
+
+def test_response_stream_write_to_path(tmp_path):
+    closer = Closer()
+    stream = transport.ResponseStream(iter([b"ab", b"", b"cd"]), close=closer)
+    target = tmp_path / "out.csv"
+    assert stream.write_to(target) == 4
+    assert target.read_bytes() == b"abcd"
+    assert closer.closed
+
+
+def test_response_stream_write_to_file_object():
+    buffer = io.BytesIO()
+    stream = transport.ResponseStream(iter([b"ab", b"cd"]))
+    assert stream.write_to(buffer) == 4
+    assert buffer.getvalue() == b"abcd"
+
+
+def test_response_stream_context_manager_closes():
+    closer = Closer()
+    with transport.ResponseStream(iter([b"ab"]), close=closer) as stream:
+        assert list(stream) == [b"ab"]
+    assert closer.closed